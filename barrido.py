@@ -0,0 +1,96 @@
+"""
+Barridos de parámetros sobre rejillas multidimensionales.
+Evalúa VAN, TIR y B/C sobre el producto cartesiano de cualquier subconjunto
+de entradas del proyecto (por ejemplo TMAR x ahorro x vida útil). La rejilla
+se divide en bloques que se reparten en el grupo de procesos compartido
+(procesos.py) y el resultado es un arreglo compacto por indicador, listo
+para mapas de calor.
+"""
+
+from collections import deque
+
+import numpy as np
+
+import finanzas
+import procesos
+
+# Entradas que pueden barrerse (mismos nombres que DataManager.DEFAULTS, con TMAR decimal)
+VARIABLES = ("costo_tanque", "costo_bomba", "costo_instalacion", "ahorro_anual",
+             "mantenimiento_anual", "vida_util", "tmar")
+
+# Por debajo de este número de puntos no compensa repartir el trabajo entre procesos
+PUNTOS_MINIMOS_PARALELO = 200_000
+
+
+def _evaluar_bloque(base, ejes, indicadores, inicio, fin):
+    """Evalúa los puntos [inicio, fin) de la rejilla aplanada"""
+    nombres = list(ejes)
+    forma = tuple(len(ejes[nombre]) for nombre in nombres)
+    indices = np.unravel_index(np.arange(inicio, fin), forma)
+
+    parametros = {v: np.full(fin - inicio, float(base[v])) for v in VARIABLES}
+    for nombre, indice in zip(nombres, indices):
+        parametros[nombre] = np.asarray(ejes[nombre], dtype=float)[indice]
+    parametros["vida_util"] = np.rint(parametros["vida_util"])
+
+    resultados = finanzas.evaluar_anualidades(parametros, indicadores)
+    return inicio, {k: v.astype(np.float32) for k, v in resultados.items()}
+
+
+def barrido(base, ejes, indicadores=("van",), max_workers=None, tamano_bloque=100_000, progreso=None):
+    """
+    Evalúa los indicadores sobre el producto cartesiano de `ejes`.
+    `ejes` mapea variable -> valores del eje (se respeta su orden); las demás
+    variables toman su valor de `base`. Retorna un diccionario con los ejes y
+    un arreglo float32 por indicador de forma (len(eje_1), len(eje_2), ...).
+    `progreso`, si se da, recibe la fracción completada tras cada bloque y
+    puede devolver False para cancelar (los puntos sin evaluar quedan en NaN).
+    """
+    desconocidas = set(ejes) - set(VARIABLES)
+    if desconocidas:
+        raise ValueError(f"Variables no soportadas en el barrido: {sorted(desconocidas)}")
+
+    ejes = {nombre: np.asarray(valores, dtype=float) for nombre, valores in ejes.items()}
+    forma = tuple(len(valores) for valores in ejes.values())
+    total = int(np.prod(forma))
+    planos = {k: np.full(total, np.nan, dtype=np.float32) for k in indicadores}
+    bloques = [(inicio, min(inicio + tamano_bloque, total)) for inicio in range(0, total, tamano_bloque)]
+
+    if max_workers is None:
+        max_workers = procesos.procesos_disponibles()
+
+    evaluados = 0
+
+    def guardar(resultado):
+        # Retorna False si se pidió cancelar
+        nonlocal evaluados
+        inicio, valores = resultado
+        for k, v in valores.items():
+            planos[k][inicio:inicio + v.size] = v
+        evaluados += len(next(iter(valores.values())))
+        return progreso is None or progreso(evaluados / total) is not False
+
+    if max_workers <= 1 or total < PUNTOS_MINIMOS_PARALELO or len(bloques) == 1:
+        for inicio, fin in bloques:
+            if not guardar(_evaluar_bloque(base, ejes, indicadores, inicio, fin)):
+                break
+    else:
+        base_simple = {v: float(base[v]) for v in VARIABLES}
+        pool = procesos.grupo_procesos()
+        # Como máximo 2 bloques por worker en vuelo: al cancelar queda poco por descartar
+        pendientes = deque()
+        cancelado = False
+        for inicio, fin in bloques:
+            pendientes.append(pool.submit(_evaluar_bloque, base_simple, ejes, indicadores, inicio, fin))
+            if len(pendientes) >= 2 * max_workers and not guardar(pendientes.popleft().result()):
+                cancelado = True
+                break
+        while pendientes and not cancelado:
+            cancelado = not guardar(pendientes.popleft().result())
+        for pendiente in pendientes:
+            pendiente.cancel()
+
+    resultado = {"ejes": ejes}
+    for k in indicadores:
+        resultado[k] = planos[k].reshape(forma)
+    return resultado
@@ -0,0 +1,317 @@
+"""
+Benchmarks de rendimiento del núcleo financiero.
+
+Uso:
+    python benchmark.py tir --tamanos 10000 100000 1000000
+    python benchmark.py paginas --repeticiones 10
+    python benchmark.py flujo-caja --proyectos 10000 --anios 30
+    python benchmark.py suite --guardar linea_base.json
+    python benchmark.py suite --comparar linea_base.json --umbral 0.3
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+import finanzas
+from flujo_caja import FlujoCaja
+
+
+def _cronometrar(funcion, repeticiones=3):
+    """Retorna el mejor tiempo (s) de varias ejecuciones y el último resultado"""
+    mejor = float("inf")
+    resultado = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+
+def _flujos_aleatorios(cantidad, periodos, semilla=0):
+    """Genera proyectos uniformes parecidos a los de la aplicación"""
+    rng = np.random.default_rng(semilla)
+    inversion = rng.uniform(1000, 3000, cantidad)
+    flujo_anual = rng.uniform(100, 900, cantidad)
+    return inversion, flujo_anual, periodos
+
+
+def benchmark_tir(tamanos, periodos=8, muestra_referencia=10000):
+    """
+    Compara los solucionadores de TIR por lotes contra `npf.irr`.
+    `npf.irr` se mide sobre una muestra y su tiempo se extrapola al lote
+    completo, ya que resolver un millón de polinomios uno a uno toma minutos.
+    """
+    import numpy_financial as npf
+
+    print(f"{'vectores':>10} {'npf.irr (s)':>12} {'tir_lote (s)':>13} "
+          f"{'anualidad (s)':>14} {'acel.':>8} {'error máx':>10}")
+    for cantidad in tamanos:
+        inversion, flujo_anual, n = _flujos_aleatorios(cantidad, periodos)
+        flujos = np.column_stack([-inversion, np.repeat(flujo_anual[:, None], n, axis=1)])
+
+        muestra = min(cantidad, muestra_referencia)
+        t_npf, referencia = _cronometrar(
+            lambda: np.array([npf.irr(f) for f in flujos[:muestra]]), repeticiones=1
+        )
+        t_npf *= cantidad / muestra
+
+        t_lote, (tir, _) = _cronometrar(lambda: finanzas.tir_lote(flujos))
+        t_anualidad, (tir_anualidad, _) = _cronometrar(
+            lambda: finanzas.tir_anualidad_lote(inversion, flujo_anual, n)
+        )
+
+        error = max(
+            np.nanmax(np.abs(tir[:muestra] - referencia)),
+            np.nanmax(np.abs(tir_anualidad[:muestra] - referencia)),
+        )
+        print(f"{cantidad:>10} {t_npf:>12.3f} {t_lote:>13.3f} {t_anualidad:>14.4f} "
+              f"{t_npf / t_anualidad:>7.0f}x {error:>10.2e}")
+
+
+def benchmark_flujo_caja(proyectos, anios=30, periodos_por_anio=12):
+    """Genera flujos mensuales con reglas de crecimiento y calcula VAN y TIR"""
+    rng = np.random.default_rng(0)
+    t_generar, flujo = _cronometrar(lambda: FlujoCaja.desde_reglas(
+        rng.uniform(500, 900, proyectos), rng.uniform(50, 150, proyectos), anios,
+        crecimiento_ahorro=0.04, inflacion_costos=0.03, costo_reemplazo=600, anios_reemplazo=5,
+        valor_rescate=100, tasa_impuesto=0.1, periodos_por_anio=periodos_por_anio,
+    ))
+    inversion = rng.uniform(1000, 3000, proyectos)
+    t_van, _ = _cronometrar(lambda: finanzas.van_lote(inversion, flujo.netos(), flujo.tasa_periodo(0.1)))
+    t_tir, (tir, _) = _cronometrar(lambda: finanzas.tir_flujo_caja_lote(inversion, flujo), repeticiones=1)
+    print(f"{proyectos} proyectos x {flujo.n_periodos} períodos: generar {t_generar:.3f} s | "
+          f"VAN {t_van:.3f} s | TIR {t_tir:.3f} s ({np.isfinite(tir).sum()} con TIR)")
+
+
+PAGINAS = ["📝 Inicio", "📖 Glosario", "📚 Manual de Uso", "💰 Datos de Inversión",
+           "📊 Análisis Financiero", "🔍 Análisis de Sensibilidad",
+           "⚖️ Análisis Multicriterio", "📈 Resultados Integrales"]
+
+# Streamlit ya importa plotly.graph_objects al arrancar, por eso se reportan
+# solo los módulos que la página carga además de los del servidor
+MODULOS_PESADOS = ["plotly.graph_objects", "plotly.express", "numpy_financial", "pandas", "numpy"]
+
+# Se ejecuta en un proceso nuevo por página para medir el arranque en frío
+_SCRIPT_PAGINA = """
+import json, statistics, sys, time
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=120)
+at.session_state["menu_opcion"] = {pagina!r}
+previos = set(sys.modules)
+inicio = time.perf_counter()
+at.run()
+frio = time.perf_counter() - inicio
+reruns = []
+for _ in range({repeticiones}):
+    inicio = time.perf_counter()
+    at.run()
+    reruns.append(time.perf_counter() - inicio)
+print(json.dumps({{
+    "frio": frio,
+    "rerun": statistics.median(reruns),
+    "errores": [str(e.value) for e in at.exception],
+    "modulos": [m for m in {modulos!r} if m in sys.modules and m not in previos],
+}}))
+"""
+
+
+def medir_pagina(pagina, repeticiones=10):
+    """Mide el primer run (frío) y la mediana de los reruns de una página"""
+    app = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+    script = _SCRIPT_PAGINA.format(app=app, pagina=pagina, repeticiones=repeticiones,
+                                   modulos=MODULOS_PESADOS)
+    salida = subprocess.run([sys.executable, "-c", script], capture_output=True,
+                            text=True, check=True)
+    return json.loads(salida.stdout.strip().splitlines()[-1])
+
+
+def benchmark_paginas(repeticiones=10):
+    """Tiempo de arranque en frío y de rerun de cada página (AppTest, sin navegador)"""
+    print(f"{'página':<30} {'frío (ms)':>10} {'rerun (ms)':>11}  módulos pesados cargados por la página")
+    for pagina in PAGINAS:
+        medicion = medir_pagina(pagina, repeticiones)
+        modulos = ", ".join(medicion["modulos"]) or "-"
+        estado = "  ERROR: " + "; ".join(medicion["errores"]) if medicion["errores"] else ""
+        print(f"{pagina:<30} {medicion['frio'] * 1000:>10.1f} {medicion['rerun'] * 1000:>11.1f}  "
+              f"{modulos}{estado}")
+
+
+# ==================== SUITE DE REGRESIÓN ====================
+
+ESCALAS_VECTORES = [1, 100, 10_000, 1_000_000]
+ESCALAS_PERIODOS = [1, 10, 100, 1000]
+# Tope de vectores x períodos por caso (~160 MB en float64)
+ELEMENTOS_MAXIMOS = 20_000_000
+# Diferencias menores a esta (s) se consideran ruido de medición
+TOLERANCIA_ABSOLUTA = 0.002
+
+
+def casos_calcular(vectores, periodos, semilla=0):
+    """
+    Casos (nombre, función) de las funciones calcular_*. Con un solo vector
+    se mide la función escalar; con más, el núcleo por lotes en el que
+    delega, que es el que procesa los lotes de la aplicación.
+    """
+    rng = np.random.default_rng(semilla)
+    flujos = rng.uniform(100, 900, (vectores, periodos))
+    inversion = rng.uniform(1000, 3000, vectores)
+    costos = rng.uniform(50, 150, (vectores, periodos))
+    van = rng.normal(1000, 500, vectores)
+    tasa = 0.1
+
+    if vectores == 1:
+        lista, inv = flujos[0].tolist(), float(inversion[0])
+        return [
+            ("calcular_van", lambda: finanzas.calcular_van(inv, lista, tasa)),
+            ("calcular_tir", lambda: finanzas.calcular_tir(inv, lista)),
+            ("calcular_bc", lambda: finanzas.calcular_bc(700.0, 100.0, tasa, periodos)),
+            ("calcular_payback", lambda: finanzas.calcular_payback(inv, lista)),
+            ("calcular_payback_descontado", lambda: finanzas.calcular_payback_descontado(inv, lista, tasa)),
+            ("calcular_vae", lambda: finanzas.calcular_vae(float(van[0]), tasa, periodos)),
+        ]
+    return [
+        ("calcular_van", lambda: finanzas.van_lote(inversion, flujos, tasa)),
+        ("calcular_tir", lambda: finanzas.tir_lote(np.column_stack([-inversion, flujos]))),
+        ("calcular_bc", lambda: finanzas.bc_lote(flujos + costos, costos, tasa)),
+        ("calcular_payback", lambda: finanzas.payback_lote(inversion, flujos)),
+        ("calcular_payback_descontado", lambda: finanzas.payback_descontado_lote(inversion, flujos, tasa)),
+        ("calcular_vae", lambda: finanzas.vae_lote(van, tasa, periodos)),
+    ]
+
+
+def medir_calcular(escalas_vectores=ESCALAS_VECTORES, escalas_periodos=ESCALAS_PERIODOS):
+    """Mejor tiempo (s) de cada función calcular_* en cada escala"""
+    resultados = {}
+    for vectores in escalas_vectores:
+        for periodos in escalas_periodos:
+            if vectores * periodos > ELEMENTOS_MAXIMOS:
+                continue
+            # Las escalas pequeñas se repiten más para estabilizar la medición
+            repeticiones = 20 if vectores * periodos <= 10_000 else 3
+            for nombre, funcion in casos_calcular(vectores, periodos):
+                resultados[f"{nombre}[{vectores}x{periodos}]"], _ = _cronometrar(funcion, repeticiones)
+    return resultados
+
+
+def ejecutar_suite(paginas=True, rapido=False, repeticiones_pagina=5):
+    """Ejecuta todos los casos y retorna el documento JSON de resultados"""
+    if rapido:
+        resultados = medir_calcular([1, 100, 10_000], [1, 10, 100])
+    else:
+        resultados = medir_calcular()
+    errores = {}
+    if paginas:
+        for pagina in PAGINAS:
+            medicion = medir_pagina(pagina, repeticiones_pagina)
+            resultados[f"pagina[{pagina}].frio"] = medicion["frio"]
+            resultados[f"pagina[{pagina}].rerun"] = medicion["rerun"]
+            if medicion["errores"]:
+                errores[pagina] = medicion["errores"]
+    return {
+        "entorno": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "plataforma": platform.platform(),
+            "procesador": platform.processor() or platform.machine(),
+            "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "resultados": resultados,
+        "errores": errores,
+    }
+
+
+def comparar_con_linea_base(actual, linea_base, umbral):
+    """
+    Retorna las regresiones: casos cuyo tiempo supera al de la línea base en
+    más de `umbral` (relativo) y en más de TOLERANCIA_ABSOLUTA segundos.
+    """
+    regresiones = []
+    for nombre, base in linea_base["resultados"].items():
+        tiempo = actual["resultados"].get(nombre)
+        if tiempo is None:
+            continue
+        if tiempo > base * (1 + umbral) and tiempo - base > TOLERANCIA_ABSOLUTA:
+            regresiones.append((nombre, base, tiempo))
+    return regresiones
+
+
+def benchmark_suite(guardar=None, comparar=None, umbral=0.3, paginas=True, rapido=False):
+    """Ejecuta la suite, guarda/compara la línea base y retorna el código de salida"""
+    actual = ejecutar_suite(paginas=paginas, rapido=rapido)
+    linea_base = None
+    if comparar:
+        with open(comparar, encoding="utf-8") as archivo:
+            linea_base = json.load(archivo)
+
+    print(f"{'caso':<60} {'actual (ms)':>12} {'base (ms)':>10} {'cambio':>8}")
+    for nombre, tiempo in actual["resultados"].items():
+        base = linea_base["resultados"].get(nombre) if linea_base else None
+        cambio = f"{(tiempo / base - 1) * 100:+7.1f}%" if base else ""
+        base_ms = f"{base * 1000:>10.3f}" if base else f"{'-':>10}"
+        print(f"{nombre:<60} {tiempo * 1000:>12.3f} {base_ms} {cambio:>8}")
+
+    if guardar:
+        with open(guardar, "w", encoding="utf-8") as archivo:
+            json.dump(actual, archivo, indent=2, ensure_ascii=False)
+        print(f"\nResultados guardados en {guardar}")
+
+    codigo = 0
+    for pagina, errores in actual["errores"].items():
+        print(f"ERROR en {pagina}: {'; '.join(errores)}")
+        codigo = 1
+    if linea_base:
+        regresiones = comparar_con_linea_base(actual, linea_base, umbral)
+        for nombre, base, tiempo in regresiones:
+            print(f"REGRESIÓN {nombre}: {base * 1000:.3f} ms -> {tiempo * 1000:.3f} ms")
+        if regresiones:
+            codigo = 1
+        else:
+            print(f"\nSin regresiones mayores a {umbral:.0%}")
+    return codigo
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks del núcleo financiero")
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+
+    parser_tir = subparsers.add_parser("tir", help="TIR por lotes vs numpy_financial.irr")
+    parser_tir.add_argument("--tamanos", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser_tir.add_argument("--periodos", type=int, default=8)
+
+    parser_paginas = subparsers.add_parser("paginas", help="Arranque en frío y rerun de cada página")
+    parser_paginas.add_argument("--repeticiones", type=int, default=10)
+
+    parser_flujo = subparsers.add_parser("flujo-caja", help="Flujos mensuales no uniformes por lotes")
+    parser_flujo.add_argument("--proyectos", type=int, default=10000)
+    parser_flujo.add_argument("--anios", type=int, default=30)
+
+    parser_suite = subparsers.add_parser("suite", help="Suite de regresión con línea base JSON")
+    parser_suite.add_argument("--guardar", help="Archivo JSON donde guardar los resultados")
+    parser_suite.add_argument("--comparar", help="Línea base JSON contra la que comparar")
+    parser_suite.add_argument("--umbral", type=float, default=0.3,
+                              help="Aumento relativo de latencia tolerado (0.3 = 30%%)")
+    parser_suite.add_argument("--sin-paginas", action="store_true", help="No medir las páginas")
+    parser_suite.add_argument("--rapido", action="store_true",
+                              help="Solo escalas pequeñas (hasta 10^4 vectores y 100 períodos)")
+
+    args = parser.parse_args()
+    if args.comando == "tir":
+        benchmark_tir(args.tamanos, args.periodos)
+    elif args.comando == "paginas":
+        benchmark_paginas(args.repeticiones)
+    elif args.comando == "flujo-caja":
+        benchmark_flujo_caja(args.proyectos, args.anios)
+    elif args.comando == "suite":
+        sys.exit(benchmark_suite(args.guardar, args.comparar, args.umbral,
+                                 paginas=not args.sin_paginas, rapido=args.rapido))
+
+
+if __name__ == "__main__":
+    main()
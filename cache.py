@@ -0,0 +1,117 @@
+"""
+Caché de resultados compartida por todas las sesiones del proceso.
+Las entradas se identifican con un hash canónico de los datos de entrada y
+se eliminan por antigüedad (TTL) o por uso menos reciente (LRU).
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+def _canonico(valor):
+    """Normaliza un valor para que datos equivalentes produzcan el mismo hash"""
+    if isinstance(valor, bool) or valor is None or isinstance(valor, str):
+        return valor
+    if isinstance(valor, (int, float)):
+        return repr(float(valor))
+    if isinstance(valor, dict):
+        return {str(k): _canonico(v) for k, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [_canonico(v) for v in valor]
+    if hasattr(valor, "tolist"):
+        return _canonico(valor.tolist())
+    return repr(valor)
+
+
+def clave_entrada(*partes):
+    """Hash SHA-256 canónico de los datos de entrada de un cálculo"""
+    texto = json.dumps(_canonico(list(partes)), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+
+class CacheResultados:
+    """Caché LRU con expiración por tiempo, segura entre hilos"""
+
+    def __init__(self, max_entradas=512, ttl_segundos=3600):
+        self.max_entradas = max_entradas
+        self.ttl_segundos = ttl_segundos
+        self._entradas = OrderedDict()
+        self._lock = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+        self.expulsiones = 0
+
+    def obtener(self, clave):
+        """Retorna (encontrado, valor) y marca la entrada como usada"""
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is not None:
+                guardado, valor = entrada
+                if time.monotonic() - guardado <= self.ttl_segundos:
+                    self._entradas.move_to_end(clave)
+                    self.aciertos += 1
+                    return True, valor
+                del self._entradas[clave]
+                self.expulsiones += 1
+            self.fallos += 1
+            return False, None
+
+    def guardar(self, clave, valor):
+        """Guarda un valor expulsando las entradas menos usadas si hace falta"""
+        with self._lock:
+            self._entradas[clave] = (time.monotonic(), valor)
+            self._entradas.move_to_end(clave)
+            while len(self._entradas) > self.max_entradas:
+                self._entradas.popitem(last=False)
+                self.expulsiones += 1
+
+    def obtener_o_calcular(self, clave, funcion, *args, **kwargs):
+        """Retorna el valor en caché o lo calcula y lo guarda"""
+        encontrado, valor = self.obtener(clave)
+        if encontrado:
+            return valor
+        valor = funcion(*args, **kwargs)
+        self.guardar(clave, valor)
+        return valor
+
+    def limpiar(self):
+        """Vacía la caché sin reiniciar los contadores"""
+        with self._lock:
+            self._entradas.clear()
+
+    def metricas(self):
+        """Contadores de uso de la caché"""
+        with self._lock:
+            return {
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "expulsiones": self.expulsiones,
+                "entradas": len(self._entradas),
+            }
+
+    def metricas_prometheus(self, nombre="ingeco_cache"):
+        """Contadores en formato de texto de Prometheus"""
+        metricas = self.metricas()
+        lineas = []
+        for clave, tipo in [("aciertos", "counter"), ("fallos", "counter"),
+                            ("expulsiones", "counter"), ("entradas", "gauge")]:
+            lineas.append(f"# TYPE {nombre}_{clave} {tipo}")
+            lineas.append(f"{nombre}_{clave} {metricas[clave]}")
+        return "\n".join(lineas) + "\n"
+
+    def exportar_metricas(self, ruta):
+        """Escribe las métricas en un archivo para el textfile collector de Prometheus"""
+        temporal = f"{ruta}.tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            archivo.write(self.metricas_prometheus())
+        # Reemplazo atómico para que el recolector nunca lea un archivo a medias
+        os.replace(temporal, ruta)
+
+
+# Instancia única por proceso: Streamlit importa el módulo una sola vez,
+# así que todas las sesiones comparten estos resultados
+cache_resultados = CacheResultados()
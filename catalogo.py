@@ -0,0 +1,206 @@
+"""
+Catálogo de equipos y selección de la mejor combinación tanque + bomba + instalación.
+Cada tabla del catálogo se guarda en columnas NumPy ordenadas por su atributo
+técnico (capacidad del tanque, caudal de la bomba), de modo que los equipos
+que cumplen un mínimo se obtienen con una búsqueda binaria. El optimizador
+descarta las opciones dominadas antes de combinar y evalúa las combinaciones
+restantes en un solo lote con las formas cerradas de la anualidad.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+import finanzas
+
+# Catálogo de ejemplo; los costos de referencia son los de DataManager.DEFAULTS
+TANQUES_EJEMPLO = pd.DataFrame([
+    ["Tanque plástico 600 L", 600, "Plástico", 480.0, 0.0, 10],
+    ["Tanque plástico 1,100 L", 1100, "Plástico", 750.0, 0.0, 10],
+    ["Tanque reforzado 1,100 L", 1100, "Reforzado", 890.0, 0.0, 15],
+    ["Tanque reforzado 1,500 L", 1500, "Reforzado", 1150.0, 0.0, 15],
+    ["Tanque acero 2,500 L", 2500, "Acero", 2100.0, 15.0, 20],
+], columns=["nombre", "capacidad_litros", "material", "costo", "mantenimiento_anual", "vida_util"])
+
+BOMBAS_EJEMPLO = pd.DataFrame([
+    ["Bomba ½ HP", 0.5, 35.0, 600.0, 0.0, 8],
+    ["Bomba ½ HP periférica", 0.5, 30.0, 450.0, 10.0, 6],
+    ["Bomba ¾ HP", 0.75, 50.0, 820.0, 0.0, 10],
+    ["Bomba 1 HP", 1.0, 70.0, 1050.0, 5.0, 12],
+], columns=["nombre", "potencia_hp", "caudal_lpm", "costo", "mantenimiento_anual", "vida_util"])
+
+INSTALACIONES_EJEMPLO = pd.DataFrame([
+    ["Instalación básica (PVC)", 400.0, 0.0],
+    ["Instalación con tubería termofusión", 550.0, 0.0],
+], columns=["nombre", "costo", "mantenimiento_anual"])
+
+# Tablas del catálogo: atributo por el que se ordena cada una
+CLAVES = {"tanques": "capacidad_litros", "bombas": "caudal_lpm", "instalaciones": "costo"}
+CRITERIOS = {"van": "VAN", "vae": "VAE"}
+
+
+class TablaEquipos:
+    """
+    Tabla de equipos en columnas NumPy, ordenada por `clave`. Requiere las
+    columnas `nombre` y `costo`; `mantenimiento_anual` (adicional al del
+    proyecto) vale 0 y `vida_util` (años) infinito si no se dan.
+    """
+
+    def __init__(self, datos, clave="costo"):
+        tabla = pd.DataFrame(datos)
+        faltantes = {"nombre", "costo", clave} - set(tabla.columns)
+        if faltantes:
+            raise ValueError(f"Faltan columnas en el catálogo: {sorted(faltantes)}")
+        tabla = tabla.sort_values(clave, kind="stable", ignore_index=True)
+
+        self.clave = clave
+        self.columnas = {nombre: tabla[nombre].to_numpy() for nombre in tabla.columns}
+        for nombre in ("costo", "mantenimiento_anual", "vida_util", clave):
+            valores = self.columnas.get(nombre, np.inf if nombre == "vida_util" else 0.0)
+            self.columnas[nombre] = np.ascontiguousarray(np.broadcast_to(valores, len(tabla)), dtype=float)
+        self._indice = {nombre: i for i, nombre in enumerate(self.columnas["nombre"].tolist())}
+
+    def __len__(self):
+        return self.columnas["costo"].size
+
+    def __getitem__(self, columna):
+        return self.columnas[columna]
+
+    def fila(self, nombre):
+        """Datos de un equipo por su nombre"""
+        i = self._indice[nombre]
+        return {columna: valores[i] for columna, valores in self.columnas.items()}
+
+    def desde_minimo(self, minimo):
+        """Índices de los equipos cuya clave es al menos `minimo` (búsqueda binaria)"""
+        return np.arange(np.searchsorted(self.columnas[self.clave], minimo, side="left"), len(self))
+
+    def como_dataframe(self):
+        return pd.DataFrame(self.columnas)
+
+
+def cargar_tabla(origen, clave, formato=None):
+    """
+    TablaEquipos desde un CSV o un JSON (lista de registros). `origen` es una
+    ruta o un archivo; sin ruta, el formato se indica con `formato`.
+    """
+    if formato is None:
+        formato = os.path.splitext(str(getattr(origen, "name", origen)))[1].lstrip(".").lower()
+    if formato == "csv":
+        datos = pd.read_csv(origen)
+    elif formato == "json":
+        datos = pd.read_json(origen, orient="records")
+    else:
+        raise ValueError(f"Formato de catálogo no soportado: {formato}")
+    return TablaEquipos(datos, clave)
+
+
+def catalogo_ejemplo():
+    """Tablas del catálogo de ejemplo: {"tanques", "bombas", "instalaciones"}"""
+    return {
+        "tanques": TablaEquipos(TANQUES_EJEMPLO, CLAVES["tanques"]),
+        "bombas": TablaEquipos(BOMBAS_EJEMPLO, CLAVES["bombas"]),
+        "instalaciones": TablaEquipos(INSTALACIONES_EJEMPLO, CLAVES["instalaciones"]),
+    }
+
+
+def _menores(valores, elegibles, k):
+    """Índices (de `elegibles`) de los k menores `valores`"""
+    if elegibles.size <= k:
+        return elegibles
+    return elegibles[np.argpartition(valores[elegibles], k - 1)[:k]]
+
+
+def evaluar_combinaciones(tanques, bombas, instalaciones, indices, proyecto):
+    """
+    VAN, VAE, TIR, B/C y payback descontado de las combinaciones `indices`
+    (tres arreglos de índices: tanque, bomba, instalación) para el ahorro,
+    mantenimiento, vida útil y TMAR de `proyecto`. La vida útil de cada
+    combinación es la menor entre la del proyecto, la del tanque y la de la bomba.
+    """
+    t, b, i = indices
+    vida = np.minimum(float(proyecto["vida_util"]), np.minimum(tanques["vida_util"][t], bombas["vida_util"][b]))
+    parametros = {
+        "costo_tanque": tanques["costo"][t],
+        "costo_bomba": bombas["costo"][b],
+        "costo_instalacion": instalaciones["costo"][i],
+        "ahorro_anual": np.full(t.size, float(proyecto["ahorro_anual"])),
+        "mantenimiento_anual": (float(proyecto["mantenimiento_anual"]) + tanques["mantenimiento_anual"][t]
+                                + bombas["mantenimiento_anual"][b] + instalaciones["mantenimiento_anual"][i]),
+        "vida_util": vida,
+        "tmar": np.full(t.size, float(proyecto["tmar"])),
+    }
+    resultados = finanzas.evaluar_anualidades(parametros)
+    resultados["vae"] = finanzas.vae_lote(resultados["van"], parametros["tmar"], vida)
+    resultados["inversion_inicial"] = (parametros["costo_tanque"] + parametros["costo_bomba"]
+                                       + parametros["costo_instalacion"])
+    resultados["vida_util"] = vida
+    return resultados
+
+
+def mejores_combinaciones(tanques, bombas, instalaciones, proyecto, k=10, criterio="van",
+                          capacidad_minima=0.0, caudal_minimo=0.0):
+    """
+    Las k combinaciones factibles (capacidad y caudal mínimos) con mayor VAN
+    o VAE, con flujos uniformes y los datos de `proyecto`. Retorna
+    {"mejores": DataFrame, "factibles": int, "evaluadas": int}.
+
+    Poda: con un horizonte n fijo, cada equipo aporta costo + mantenimiento
+    x P/A(TMAR, n) a la inversión equivalente, así que solo pueden estar
+    entre las k mejores las combinaciones de los k equipos de menor aporte
+    de cada tabla entre los que duran al menos n (con flujos netos positivos
+    un equipo más durable no empeora la combinación). Basta combinar esos
+    k x k x k equipos para cada vida útil distinta del catálogo.
+    """
+    if criterio not in CRITERIOS:
+        raise ValueError(f"Criterio no soportado: {criterio}")
+    t_factibles = tanques.desde_minimo(capacidad_minima)
+    b_factibles = bombas.desde_minimo(caudal_minimo)
+    i_factibles = np.arange(len(instalaciones))
+    factibles = t_factibles.size * b_factibles.size * i_factibles.size
+    if factibles == 0:
+        return {"mejores": pd.DataFrame(), "factibles": 0, "evaluadas": 0}
+
+    vida_proyecto = float(proyecto["vida_util"])
+    vida_t = np.minimum(tanques["vida_util"], vida_proyecto)
+    vida_b = np.minimum(bombas["vida_util"], vida_proyecto)
+    horizontes = np.unique(np.concatenate([vida_t[t_factibles], vida_b[b_factibles]]))
+    horizontes = horizontes[horizontes >= 1]
+
+    candidatos = []
+    for n in horizontes:
+        factor = float(finanzas.factor_anualidad(proyecto["tmar"], n))
+        elegidos = []
+        for tabla, elegibles, vida in ((tanques, t_factibles, vida_t), (bombas, b_factibles, vida_b),
+                                       (instalaciones, i_factibles, None)):
+            if vida is not None:
+                elegibles = elegibles[vida[elegibles] >= n]
+            aporte = tabla["costo"] + tabla["mantenimiento_anual"] * factor
+            elegidos.append(_menores(aporte, elegibles, k))
+        t, b, i = np.meshgrid(*elegidos, indexing="ij")
+        candidatos.append((t.ravel() * len(bombas) + b.ravel()) * len(instalaciones) + i.ravel())
+
+    codigos = np.unique(np.concatenate(candidatos))
+    t, resto = np.divmod(codigos, len(bombas) * len(instalaciones))
+    b, i = np.divmod(resto, len(instalaciones))
+    resultados = evaluar_combinaciones(tanques, bombas, instalaciones, (t, b, i), proyecto)
+
+    valor = np.nan_to_num(resultados[criterio], nan=-np.inf)
+    orden = np.argsort(-valor, kind="stable")[:k]
+    mejores = pd.DataFrame({
+        "tanque": tanques["nombre"][t[orden]],
+        "bomba": bombas["nombre"][b[orden]],
+        "instalacion": instalaciones["nombre"][i[orden]],
+        "inversion_inicial": resultados["inversion_inicial"][orden],
+        "vida_util": resultados["vida_util"][orden],
+        "van": resultados["van"][orden],
+        "vae": resultados["vae"][orden],
+        "tir": resultados["tir"][orden],
+        "bc": resultados["bc"][orden],
+        "payback_desc": resultados["payback_desc"][orden],
+        "costo_tanque": tanques["costo"][t[orden]],
+        "costo_bomba": bombas["costo"][b[orden]],
+        "costo_instalacion": instalaciones["costo"][i[orden]],
+    })
+    return {"mejores": mejores, "factibles": factibles, "evaluadas": int(codigos.size)}
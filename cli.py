@@ -0,0 +1,134 @@
+"""
+Evaluación por lotes de carteras de proyectos desde la línea de comandos.
+
+Lee parámetros de proyectos (una fila por proyecto) desde CSV o Parquet por
+bloques, los evalúa en un pool de procesos y escribe los indicadores y la
+decisión de cada proyecto sin cargar el archivo completo en memoria.
+
+Uso:
+    python cli.py proyectos.csv resultados.csv --tamano-bloque 50000 --workers 4
+    python cli.py proyectos.parquet resultados.parquet
+
+Columnas reconocidas (las faltantes toman los valores por defecto):
+    id, costo_tanque, costo_bomba, costo_instalacion (o inversion_inicial),
+    ahorro_anual, mantenimiento_anual, vida_util, tmar_porcentaje (o tmar)
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import deque
+
+import pandas as pd
+
+import procesos
+from evaluacion import evaluar_cartera
+
+
+def _es_parquet(ruta):
+    return ruta.lower().endswith((".parquet", ".pq"))
+
+
+def leer_bloques(ruta, tamano_bloque):
+    """Itera sobre el archivo de entrada en DataFrames de `tamano_bloque` filas"""
+    if _es_parquet(ruta):
+        import pyarrow.parquet as pq
+        archivo = pq.ParquetFile(ruta)
+        for lote in archivo.iter_batches(batch_size=tamano_bloque):
+            yield lote.to_pandas()
+    else:
+        yield from pd.read_csv(ruta, chunksize=tamano_bloque)
+
+
+class EscritorResultados:
+    """Escribe bloques de resultados en CSV o Parquet a medida que llegan"""
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        self._parquet = None
+        self._primero = True
+
+    def escribir(self, bloque):
+        if _es_parquet(self.ruta):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            tabla = pa.Table.from_pandas(bloque, preserve_index=False)
+            if self._parquet is None:
+                self._parquet = pq.ParquetWriter(self.ruta, tabla.schema)
+            self._parquet.write_table(tabla)
+        else:
+            bloque.to_csv(self.ruta, mode="w" if self._primero else "a",
+                          header=self._primero, index=False)
+        self._primero = False
+
+    def cerrar(self):
+        if self._parquet is not None:
+            self._parquet.close()
+
+
+def evaluar_archivo(entrada, salida, tamano_bloque=50_000, workers=1, reportar=None):
+    """
+    Evalúa todos los proyectos de `entrada` y escribe los resultados en `salida`.
+    Mantiene como máximo 2 bloques por worker en vuelo para acotar la memoria.
+    Retorna (proyectos evaluados, segundos).
+    """
+    escritor = EscritorResultados(salida)
+    inicio = time.perf_counter()
+    total = 0
+
+    def registrar(bloque):
+        nonlocal total
+        escritor.escribir(bloque)
+        total += len(bloque)
+        if reportar is not None:
+            transcurrido = time.perf_counter() - inicio
+            reportar(total, transcurrido)
+
+    try:
+        if workers <= 1:
+            for bloque in leer_bloques(entrada, tamano_bloque):
+                registrar(evaluar_cartera(bloque))
+        else:
+            pool = procesos.grupo_procesos(workers)
+            pendientes = deque()
+            for bloque in leer_bloques(entrada, tamano_bloque):
+                pendientes.append(pool.submit(evaluar_cartera, bloque))
+                # Se escribe en orden de llegada de la entrada
+                while len(pendientes) >= 2 * workers:
+                    registrar(pendientes.popleft().result())
+            while pendientes:
+                registrar(pendientes.popleft().result())
+    finally:
+        escritor.cerrar()
+
+    return total, time.perf_counter() - inicio
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Evaluación económica por lotes de proyectos")
+    parser.add_argument("entrada", help="Archivo CSV o Parquet con los parámetros de los proyectos")
+    parser.add_argument("salida", help="Archivo CSV o Parquet de resultados")
+    parser.add_argument("--tamano-bloque", type=int, default=50_000,
+                        help="Filas leídas y evaluadas por bloque")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Procesos del pool de evaluación")
+    parser.add_argument("--silencioso", action="store_true", help="No reportar el avance")
+    args = parser.parse_args(argumentos)
+
+    def reportar(total, segundos):
+        print(f"\r{total:,} proyectos | {total / max(segundos, 1e-9):,.0f} proyectos/s",
+              end="", file=sys.stderr, flush=True)
+
+    total, segundos = evaluar_archivo(
+        args.entrada, args.salida, args.tamano_bloque, args.workers,
+        reportar=None if args.silencioso else reportar,
+    )
+    if not args.silencioso:
+        print(file=sys.stderr)
+    print(f"{total:,} proyectos evaluados en {segundos:.2f} s "
+          f"({total / max(segundos, 1e-9):,.0f} proyectos/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Simulación estocástica de cortes de agua y del valor del tanque.
+Los cortes llegan como un proceso de Poisson con duraciones aleatorias; sus
+intervalos se unen y se reparten en horas sin servicio por día. Durante un
+corte la vivienda consume del tanque y, con el servicio restablecido, la
+bomba lo vuelve a llenar; el nivel se obtiene con el mismo barrido de
+prefijos de `simulacion_energia`. Miles de años se simulan por bloques de
+días, así que la memoria no crece con el número de años.
+"""
+
+import numpy as np
+
+import finanzas
+import simulacion_energia
+from simulacion_energia import DIAS_ANIO, HORAS_DIA
+
+DISTRIBUCIONES_DURACION = ["Exponencial", "Lognormal", "Gamma", "Fija"]
+
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def duraciones(rng, tamano, media, distribucion="Exponencial", variacion=1.0):
+    """
+    Duraciones de corte en horas con la `media` dada; `variacion` es el
+    coeficiente de variación de las distribuciones Lognormal y Gamma (la
+    Exponencial tiene 1 y la Fija 0).
+    """
+    if distribucion == "Exponencial":
+        return rng.exponential(media, tamano)
+    if distribucion == "Lognormal":
+        sigma2 = np.log1p(variacion ** 2)
+        return rng.lognormal(np.log(media) - sigma2 / 2, np.sqrt(sigma2), tamano)
+    if distribucion == "Gamma":
+        forma = 1.0 / max(variacion, 1e-9) ** 2
+        return rng.gamma(forma, media / forma, tamano)
+    if distribucion == "Fija":
+        return np.full(tamano, float(media))
+    raise ValueError(f"Distribución de duración no soportada: {distribucion}")
+
+
+def horas_sin_servicio(inicios, fines, dias):
+    """
+    Horas sin servicio en cada uno de `dias` días a partir de intervalos de
+    corte [inicio, fin) en horas (pueden superponerse). Los intervalos se
+    unen y se integra la función acumulada de horas sin servicio en los
+    límites de cada día.
+    """
+    if inicios.size == 0:
+        return np.zeros(dias)
+    orden = np.argsort(inicios, kind="stable")
+    inicios, fines = inicios[orden], fines[orden]
+    # Un intervalo inicia un tramo unido si empieza después de todo lo anterior
+    alcance = np.maximum.accumulate(fines)
+    nuevo = np.ones(inicios.size, dtype=bool)
+    nuevo[1:] = inicios[1:] > alcance[:-1]
+    primeros = np.flatnonzero(nuevo)
+    tramo_inicio = inicios[primeros]
+    longitudes = alcance[np.append(primeros[1:] - 1, -1)] - tramo_inicio
+
+    limites = np.arange(dias + 1) * float(HORAS_DIA)
+    previas = np.concatenate([[0.0], np.cumsum(longitudes)])
+    j = np.searchsorted(tramo_inicio, limites, side="right")
+    k = np.maximum(j - 1, 0)
+    parcial = np.where(j > 0, np.clip(limites - tramo_inicio[k], 0.0, longitudes[k]), 0.0)
+    acumuladas = previas[k] + parcial
+    return np.diff(acumuladas)
+
+
+def _simular_bloque(horas_corte, capacidad, consumo_diario, recarga_horaria, inicial):
+    """
+    Recorre los días de un bloque: en cada día primero el corte (la vivienda
+    consume del tanque) y luego las horas con servicio (la bomba recarga).
+    Retorna (demanda durante los cortes, demanda cubierta por el tanque,
+    nivel final) por configuración.
+    """
+    demanda_corte = consumo_diario[:, None] * (horas_corte / HORAS_DIA)
+    recarga = recarga_horaria[:, None] * (HORAS_DIA - horas_corte)
+    aporte = np.empty((capacidad.size, 2 * horas_corte.size))
+    aporte[:, 0::2] = -demanda_corte
+    aporte[:, 1::2] = recarga
+    nivel = simulacion_energia.niveles(aporte, capacidad, inicial)
+    antes_del_corte = np.concatenate([inicial[:, None], nivel[:, 1:-1:2]], axis=1)
+    cubierta = np.minimum(demanda_corte, antes_del_corte)
+    return demanda_corte, cubierta, nivel[:, -1]
+
+
+def simular_cortes(capacidad, consumo_diario, caudal_lpm, frecuencia_anual, duracion_media,
+                   distribucion="Exponencial", variacion=1.0, valor_agua=25.0, anios=10_000,
+                   semilla=None, progreso=None):
+    """
+    Simula `anios` años de cortes (Poisson con `frecuencia_anual` cortes por
+    año y duraciones de `duracion_media` horas) para cada configuración de
+    tanque (`capacidad` en L), consumo diario (L) y caudal de la bomba
+    (L/min). Todas las configuraciones comparten los mismos cortes, así que
+    sus diferencias no se deben al azar. La demanda de un día se reparte por
+    igual entre sus horas.
+
+    Retorna por año simulado: "horas_corte" y "cortes" (años,),
+    "demanda_corte", "demanda_evitada" (L) y "ahorro_anual" (agua evitada
+    por `valor_agua` S/ por m³), estos con una fila por configuración.
+    `progreso`, si se da, recibe la fracción completada tras cada bloque y
+    puede devolver False para cancelar (se retornan los años simulados).
+    """
+    capacidad, consumo_diario, caudal_lpm, valor_agua = (
+        np.atleast_1d(x).astype(float) for x in np.broadcast_arrays(
+            capacidad, consumo_diario, caudal_lpm, valor_agua,
+        )
+    )
+    filas = capacidad.size
+    # La bomba recarga con su caudal menos lo que la vivienda consume mientras tanto
+    recarga_horaria = np.maximum(caudal_lpm * 60.0 - consumo_diario / HORAS_DIA, 0.0)
+    anios_bloque = max(1, simulacion_energia.ELEMENTOS_BLOQUE // (2 * DIAS_ANIO * filas))
+    rng = np.random.default_rng(semilla)
+
+    horas_corte = np.zeros(anios)
+    cortes = np.zeros(anios, dtype=np.int64)
+    demanda_corte = np.zeros((filas, anios))
+    demanda_evitada = np.zeros((filas, anios))
+    nivel = capacidad.copy()
+    pendiente = 0.0
+    realizados = 0
+    while realizados < anios:
+        bloque = min(anios_bloque, anios - realizados)
+        horas = bloque * DIAS_ANIO * HORAS_DIA
+        n = rng.poisson(frecuencia_anual * bloque)
+        inicios = rng.uniform(0.0, horas, n)
+        fines = inicios + duraciones(rng, n, duracion_media, distribucion, variacion)
+        # Un corte que continúa desde el bloque anterior empieza en la hora 0
+        inicios, fines = np.append(inicios, 0.0), np.append(fines, pendiente)
+        pendiente = max(float(fines.max()) - horas, 0.0)
+
+        por_dia = horas_sin_servicio(inicios, np.minimum(fines, horas), bloque * DIAS_ANIO)
+        demanda, cubierta, nivel = _simular_bloque(por_dia, capacidad, consumo_diario, recarga_horaria, nivel)
+
+        anio = slice(realizados, realizados + bloque)
+        horas_corte[anio] = por_dia.reshape(bloque, DIAS_ANIO).sum(axis=1)
+        cortes[anio] = np.bincount((inicios[:-1] // (DIAS_ANIO * HORAS_DIA)).astype(np.int64), minlength=bloque)
+        demanda_corte[:, anio] = demanda.reshape(filas, bloque, DIAS_ANIO).sum(axis=2)
+        demanda_evitada[:, anio] = cubierta.reshape(filas, bloque, DIAS_ANIO).sum(axis=2)
+        realizados += bloque
+
+        if progreso is not None and progreso(realizados / anios) is False:
+            break
+
+    anio = slice(0, realizados)
+    return {
+        "horas_corte": horas_corte[anio],
+        "cortes": cortes[anio],
+        "demanda_corte": demanda_corte[:, anio],
+        "demanda_evitada": demanda_evitada[:, anio],
+        "ahorro_anual": demanda_evitada[:, anio] / 1000.0 * valor_agua[:, None],
+    }
+
+
+def ahorro_equivalente(ahorro_por_anio, vida_util, tasa):
+    """
+    Ahorro anual uniforme equivalente de cada vida del proyecto: los años
+    simulados se agrupan en períodos consecutivos de `vida_util` años y se
+    toma el valor presente de cada período dividido entre P/A(tasa, n).
+    Es la distribución que corresponde a la evaluación con flujos uniformes.
+    Con menos años simulados que `vida_util` no hay períodos completos y se
+    retorna un arreglo de forma (filas, 0).
+    """
+    ahorro_por_anio = np.atleast_2d(ahorro_por_anio)
+    n = int(vida_util)
+    if n < 1:
+        raise ValueError(f"La vida útil debe ser al menos 1 año: {vida_util}")
+    periodos = ahorro_por_anio.shape[1] // n
+    if periodos == 0:
+        return np.empty((ahorro_por_anio.shape[0], 0))
+    tabla = finanzas.tabla_descuento(np.asarray([tasa], dtype=float), n)
+    vidas = ahorro_por_anio[:, :periodos * n].reshape(-1, periodos, n)
+    return (vidas @ tabla.factores[0]) / tabla.acumulados[0, -1]
+
+
+def resumen(valores):
+    """Media, desviación y percentiles de una muestra (por ejemplo del ahorro anual)"""
+    valores = np.asarray(valores, dtype=float).ravel()
+    percentiles = np.percentile(valores, PERCENTILES) if valores.size else np.full(len(PERCENTILES), np.nan)
+    return {
+        "media": float(valores.mean()) if valores.size else float("nan"),
+        "desviacion": float(valores.std()) if valores.size else float("nan"),
+        "percentiles": dict(zip(PERCENTILES, percentiles.tolist())),
+    }
@@ -4,28 +4,14 @@ Maneja la persistencia y validación de datos en session_state.
 """
 
 import streamlit as st
-import json
-
-# Variable global para almacenar backup de datos
-_data_backup = {}
+from modelo import Proyecto, VALORES_POR_DEFECTO
+from sesiones import almacen_sesiones, id_sesion_actual
 
 class DataManager:
     """Gestor centralizado de datos del proyecto"""
     
-    # Valores por defecto
-    DEFAULTS = {
-        "costo_tanque": 750.0,
-        "costo_bomba": 600.0,
-        "costo_instalacion": 400.0,
-        "vida_util": 8,
-        "ahorro_anual": 700.0,
-        "mantenimiento_anual": 100.0,
-        "tmar_porcentaje": 10.0,
-        "financiado": False,
-        "tasa_nominal": 12.0,
-        "periodos_capitalizacion": 12,
-        "plazo_meses": 24
-    }
+    # Valores por defecto (los del modelo Proyecto)
+    DEFAULTS = dict(VALORES_POR_DEFECTO)
     
     @staticmethod
     def initialize():
@@ -50,19 +36,19 @@ class DataManager:
     
     @staticmethod
     def backup_data():
-        """Guarda los datos actuales en un backup global"""
-        global _data_backup
-        _data_backup = {}
+        """Guarda los datos actuales en el respaldo de la sesión"""
+        backup = {}
         for key in DataManager.DEFAULTS.keys():
             if key in st.session_state:
-                _data_backup[key] = st.session_state[key]
+                backup[key] = st.session_state[key]
+        almacen_sesiones.guardar(id_sesion_actual(), backup)
     
     @staticmethod
     def restore_from_backup():
-        """Restaura los datos desde el backup si existen"""
-        global _data_backup
-        if _data_backup:
-            for key, value in _data_backup.items():
+        """Restaura los datos desde el respaldo de la sesión si existe"""
+        backup = almacen_sesiones.cargar(id_sesion_actual())
+        if backup:
+            for key, value in backup.items():
                 if key not in st.session_state:
                     st.session_state[key] = value
             return True
@@ -106,18 +92,34 @@ class DataManager:
         DataManager.update_inversion_inicial()
         DataManager.update_tmar()
     
+    @staticmethod
+    def get_proyecto():
+        """Proyecto inmutable con los datos actuales (los faltantes toman sus defaults)"""
+        return Proyecto.desde_dict(st.session_state)
+
     @staticmethod
     def get_all_data():
         """Retorna un diccionario con todos los datos actuales"""
-        data = {}
-        for key in DataManager.DEFAULTS.keys():
-            data[key] = st.session_state.get(key, DataManager.DEFAULTS[key])
-        
-        data["tmar"] = st.session_state.get("tmar", 0.10)
-        data["inversion_inicial"] = st.session_state.get("inversion_inicial", 1750.0)
-        
-        return data
-    
+        return DataManager.get_proyecto().como_dict()
+
+    @staticmethod
+    def get_grafo():
+        """Grafo de indicadores de la sesión, sincronizado con los datos actuales"""
+        if "grafo_indicadores" not in st.session_state:
+            from evaluacion import crear_grafo_proyecto
+            st.session_state["grafo_indicadores"] = crear_grafo_proyecto()
+        grafo = st.session_state["grafo_indicadores"]
+        grafo.actualizar(DataManager.get_all_data())
+        return grafo
+
+    @staticmethod
+    def get_figuras():
+        """Caché de figuras de plotly de la sesión (se reutilizan entre reruns)"""
+        if "cache_figuras" not in st.session_state:
+            from figuras import CacheFiguras
+            st.session_state["cache_figuras"] = CacheFiguras()
+        return st.session_state["cache_figuras"]
+
     @staticmethod
     def validate_data():
         """Valida que los datos sean coherentes"""
@@ -0,0 +1,129 @@
+"""
+Valores críticos (de equilibrio) de las entradas del proyecto.
+Para cada entrada se busca el valor con el que el proyecto queda justo en un
+umbral de decisión: VAN = 0, B/C = 1 o inversión recuperada (sin descontar)
+al final de la vida útil. Con flujos uniformes se usan las formas cerradas de
+la anualidad para lotes de proyectos; en otro caso, `raiz_por_rejilla`
+evalúa muchos valores candidatos en una sola llamada vectorizada.
+"""
+
+import numpy as np
+
+import finanzas
+
+# Entradas con valor crítico (nombres de DataManager.DEFAULTS, TMAR decimal)
+VARIABLES = ("ahorro_anual", "mantenimiento_anual", "costo_tanque", "costo_bomba",
+             "costo_instalacion", "vida_util", "tmar")
+COSTOS = ("costo_tanque", "costo_bomba", "costo_instalacion")
+
+# Criterio -> umbral. VAN = 0 equivale a payback descontado = vida útil, y la
+# recuperación sin descontar a payback simple = vida útil
+CRITERIOS = {
+    "van": "VAN = 0",
+    "bc": "B/C = 1",
+    "payback": "Payback = vida útil",
+}
+
+PUNTOS_REJILLA = 64
+
+
+def equilibrio_anualidades(parametros, criterios=tuple(CRITERIOS)):
+    """
+    Valores críticos en forma cerrada de un lote de proyectos de flujo
+    uniforme (`parametros` como en `finanzas.evaluar_anualidades`). Retorna
+    {criterio: {variable: arreglo}}, con NaN donde el criterio no depende de
+    la variable o no existe un valor admisible.
+    """
+    ahorro = np.asarray(parametros["ahorro_anual"], dtype=float)
+    mantenimiento = np.asarray(parametros["mantenimiento_anual"], dtype=float)
+    n = np.asarray(parametros["vida_util"], dtype=float)
+    tmar = np.asarray(parametros["tmar"], dtype=float)
+    costos = {k: np.asarray(parametros[k], dtype=float) for k in COSTOS}
+    inversion = sum(costos.values())
+    flujo = ahorro - mantenimiento
+    forma = np.broadcast(ahorro, mantenimiento, n, tmar, inversion).shape
+    ninguno = np.full(forma, np.nan)
+
+    resultados = {}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if "van" in criterios:
+            factor = finanzas.factor_anualidad(tmar, n)
+            van = flujo * factor - inversion
+            # Vida útil con flujo * P/A(i, n) = I: n = -ln(1 - i I / flujo) / ln(1 + i)
+            proporcion = inversion / flujo
+            vida = np.where(tmar == 0, proporcion, -np.log1p(-tmar * proporcion) / np.log1p(tmar))
+            resultados["van"] = {
+                "ahorro_anual": mantenimiento + inversion / factor,
+                "mantenimiento_anual": ahorro - inversion / factor,
+                **{k: v + van for k, v in costos.items()},
+                "vida_util": np.where(flujo > 0, vida, np.nan),
+                "tmar": finanzas.tir_anualidad_lote(inversion, flujo, n)[0].reshape(forma),
+            }
+        if "bc" in criterios:
+            # Con flujos uniformes B/C = ahorro / mantenimiento: no depende de la tasa ni del plazo
+            resultados["bc"] = {
+                "ahorro_anual": np.broadcast_to(mantenimiento, forma),
+                "mantenimiento_anual": np.broadcast_to(ahorro, forma),
+                **{k: ninguno for k in COSTOS},
+                "vida_util": ninguno,
+                "tmar": ninguno,
+            }
+        if "payback" in criterios:
+            resultados["payback"] = {
+                "ahorro_anual": mantenimiento + inversion / n,
+                "mantenimiento_anual": ahorro - inversion / n,
+                **{k: v + flujo * n - inversion for k, v in costos.items()},
+                "vida_util": np.where(flujo > 0, inversion / flujo, np.nan),
+                "tmar": ninguno,
+            }
+
+    return {criterio: {variable: _admisible(variable, valor) for variable, valor in valores.items()}
+            for criterio, valores in resultados.items()}
+
+
+def _admisible(variable, valor):
+    """Descarta valores críticos fuera del dominio de la variable"""
+    valor = np.asarray(valor, dtype=float)
+    minimo = finanzas.TASA_MINIMA if variable == "tmar" else 0.0
+    return np.where(np.isfinite(valor) & (valor >= minimo), valor, np.nan)
+
+
+def raiz_por_rejilla(funcion, bajo, alto, puntos=PUNTOS_REJILLA, iteraciones=6):
+    """
+    Primer cambio de signo de `funcion` en [bajo, alto]. En cada iteración se
+    evalúa una rejilla de `puntos` valores con una sola llamada a
+    `funcion(valores) -> residuos` y el intervalo se reduce al tramo con el
+    cambio de signo; al final se interpola linealmente. Retorna NaN si no
+    hay cambio de signo en el intervalo.
+    """
+    for _ in range(iteraciones):
+        valores = np.linspace(bajo, alto, puntos)
+        residuos = np.asarray(funcion(valores), dtype=float)
+        if np.any(residuos == 0):
+            return float(valores[np.argmax(residuos == 0)])
+        signos = np.sign(residuos)
+        cambios = np.flatnonzero(signos[1:] * signos[:-1] < 0)
+        if cambios.size == 0:
+            return float("nan")
+        k = cambios[0]
+        bajo, alto = valores[k], valores[k + 1]
+        residuo_bajo, residuo_alto = residuos[k], residuos[k + 1]
+    return float(bajo - residuo_bajo * (alto - bajo) / (residuo_alto - residuo_bajo))
+
+
+def raiz_entera(funcion, valores):
+    """
+    Cambio de signo de `funcion` sobre valores enteros (p. ej. la vida útil,
+    que se modela en años enteros), interpolado entre los dos enteros que lo
+    encierran. Retorna NaN si no hay cambio de signo.
+    """
+    valores = np.asarray(valores, dtype=float)
+    residuos = np.asarray(funcion(valores), dtype=float)
+    signos = np.sign(residuos)
+    if np.any(signos == 0):
+        return float(valores[np.argmax(signos == 0)])
+    cambios = np.flatnonzero(signos[1:] * signos[:-1] < 0)
+    if cambios.size == 0:
+        return float("nan")
+    k = cambios[0]
+    return float(valores[k] - residuos[k] * (valores[k + 1] - valores[k]) / (residuos[k + 1] - residuos[k]))
@@ -0,0 +1,552 @@
+"""
+Capa de evaluación del proyecto con resultados en caché.
+Calcula los indicadores de cada página a partir de los datos de
+DataManager.get_all_data() y los reutiliza entre reruns y sesiones
+mientras las entradas no cambien.
+"""
+
+import numpy as np
+import pandas as pd
+
+import barrido
+import cortes
+import equilibrio
+import financiamiento
+import finanzas
+import montecarlo
+import tornado
+from cache import cache_resultados, clave_entrada
+from flujo_caja import FlujoCaja
+from grafo import GrafoCalculo
+from instrumentacion import medir
+import modelo
+from modelo import ResultadoEvaluacion
+from trabajos import gestor_trabajos
+
+# Tasas del gráfico de sensibilidad VAN vs TMAR
+TASAS_SENSIBILIDAD = np.linspace(0.05, 0.25, 20)
+
+# Matriz de decisión: VAN > 0, TIR > TMAR, B/C > 1 y payback < vida útil
+TOTAL_CRITERIOS = 4
+RECOMENDACIONES = ["NO RECOMENDADO", "NO RECOMENDADO", "VIABLE CON CONDICIONES",
+                   "ALTAMENTE RECOMENDADO", "ALTAMENTE RECOMENDADO"]
+DECISIONES = ["❌ NO VIABLE", "❌ NO VIABLE", "⚠️ REVISAR", "✅ VIABLE", "✅ VIABLE"]
+
+# Vida útil máxima (años) en la búsqueda de su valor de equilibrio
+VIDA_MAXIMA = 50
+
+
+# Reglas del flujo de caja (en DataManager.DEFAULTS, porcentajes en %)
+ENTRADAS_REGLAS = ("crecimiento_ahorro", "inflacion_costos", "costo_reemplazo", "anios_reemplazo",
+                   "valor_rescate", "tasa_impuesto")
+
+# Entradas de las que dependen los flujos del proyecto y los escenarios
+ENTRADAS_FLUJOS = ("inversion_inicial", "vida_util", "ahorro_anual", "mantenimiento_anual",
+                   "financiado", "porcentaje_financiado", "tasa_nominal", "periodos_capitalizacion", "plazo_meses",
+                   "sistema_amortizacion") + ENTRADAS_REGLAS
+ENTRADAS_ESCENARIOS = ("inversion_inicial", "vida_util", "ahorro_anual", "mantenimiento_anual",
+                       "var_optimista", "var_pesimista") + ENTRADAS_REGLAS
+
+
+def flujo_caja_proyecto(datos, ahorro_anual=None):
+    """
+    FlujoCaja anual del proyecto a partir de sus reglas de crecimiento.
+    `ahorro_anual` permite evaluar varios ahorros a la vez (un proyecto por valor).
+    """
+    return FlujoCaja.desde_reglas(
+        datos["ahorro_anual"] if ahorro_anual is None else ahorro_anual,
+        datos["mantenimiento_anual"],
+        datos["vida_util"],
+        crecimiento_ahorro=datos.get("crecimiento_ahorro", 0.0) / 100,
+        inflacion_costos=datos.get("inflacion_costos", 0.0) / 100,
+        costo_reemplazo=datos.get("costo_reemplazo", 0.0),
+        anios_reemplazo=datos.get("anios_reemplazo", 0),
+        valor_rescate=datos.get("valor_rescate", 0.0),
+        tasa_impuesto=datos.get("tasa_impuesto", 0.0) / 100,
+    )
+
+
+def flujos_proyecto(datos):
+    """
+    Flujos del inversionista: aporte propio en el año 0 y el FlujoCaja de los
+    años siguientes. Sin financiamiento el aporte es toda la inversión; con
+    financiamiento se presta `porcentaje_financiado` de la inversión, el
+    aporte es el resto y el FlujoCaja incluye el servicio de la deuda.
+    """
+    inversion_inicial = datos["inversion_inicial"]
+    flujo_caja = flujo_caja_proyecto(datos)
+
+    if datos.get("financiado"):
+        aporte, flujo_caja = financiamiento.flujos_financiados(
+            flujo_caja, inversion_inicial, monto_financiado(datos),
+            datos["tasa_nominal"] / 100, datos["periodos_capitalizacion"], datos["plazo_meses"],
+            datos["sistema_amortizacion"],
+        )
+        aporte = float(aporte) if np.ndim(aporte) == 0 else aporte
+    else:
+        aporte = inversion_inicial
+
+    return {
+        "aporte_propio": aporte,
+        "flujo_caja": flujo_caja,
+        "flujos_netos": flujo_caja.netos()[0],
+    }
+
+
+def monto_financiado(datos):
+    """Principal del préstamo: el `porcentaje_financiado` de la inversión inicial"""
+    return datos["inversion_inicial"] * datos["porcentaje_financiado"] / 100
+
+
+def _resultados(flujo_neto_anual, flujos, van, vae, tir, bc, payback_simple, payback_desc):
+    """ResultadoEvaluacion que consumen las páginas"""
+    return ResultadoEvaluacion(
+        flujo_neto_anual=flujo_neto_anual,
+        aporte_propio=flujos["aporte_propio"],
+        componentes=tuple((k, tuple(v[0].tolist())) for k, v in flujos["flujo_caja"].componentes.items()),
+        flujos_netos=tuple(flujos["flujos_netos"].tolist()),
+        van=van,
+        vae=vae,
+        tir=tir,
+        bc=bc,
+        payback_simple=payback_simple,
+        payback_desc=payback_desc,
+    )
+
+
+def evaluar_proyecto(datos):
+    """
+    Calcula VAN, VAE, TIR, B/C y ambos paybacks del proyecto. Si el proyecto
+    es financiado, los indicadores se calculan sobre los flujos del
+    inversionista (aporte propio y flujos netos después del servicio de deuda).
+    """
+    flujos = flujos_proyecto(datos)
+    aporte = flujos["aporte_propio"]
+    flujo_caja = flujos["flujo_caja"]
+    tmar = datos["tmar"]
+    indicadores = finanzas.evaluar_lote(aporte, flujo_caja.beneficios(), flujo_caja.costos(),
+                                        flujo_caja.tasa_periodo(tmar))
+    van = float(indicadores["van"][0])
+    periodos_por_anio = flujo_caja.periodos_por_anio
+    return _resultados(
+        datos["ahorro_anual"] - datos["mantenimiento_anual"], flujos,
+        van=van,
+        vae=finanzas.calcular_vae(van, tmar, flujo_caja),
+        tir=finanzas.calcular_tir(aporte, flujo_caja),
+        bc=float(indicadores["bc"][0]),
+        payback_simple=finanzas.como_periodo(indicadores["payback"][0] / periodos_por_anio),
+        payback_desc=finanzas.como_periodo(indicadores["payback_descontado"][0] / periodos_por_anio),
+    )
+
+
+def veredicto(resultados, tmar, vida_util):
+    """Aplica la matriz de decisión de Resultados Integrales a un proyecto"""
+    payback_desc = resultados.payback_desc
+    criterios = {
+        "van": resultados.van > 0,
+        "tir": resultados.tir > tmar,
+        "bc": resultados.bc > 1,
+        "payback": bool(payback_desc) and payback_desc < vida_util,
+    }
+    if resultados.sin_aporte:
+        # Sin aporte propio la TIR y el payback no aplican (None) y no cuentan
+        criterios["tir"] = criterios["payback"] = None
+    aplicables = sum(valor is not None for valor in criterios.values())
+    cumplidos = sum(bool(valor) for valor in criterios.values())
+    nivel = round(cumplidos * TOTAL_CRITERIOS / aplicables)
+    return {
+        "criterios": criterios,
+        "criterios_cumplidos": cumplidos,
+        "total_criterios": aplicables,
+        "porcentaje_aprobacion": cumplidos / aplicables * 100,
+        "recomendacion": RECOMENDACIONES[nivel],
+        "decision": DECISIONES[nivel],
+    }
+
+
+def _como_cartera(proyectos):
+    """Cartera como DataFrame; una lista de modelo.Proyecto se convierte por columnas"""
+    if isinstance(proyectos, pd.DataFrame):
+        return proyectos
+    return pd.DataFrame(modelo.columnas(proyectos))
+
+
+def _parametros_cartera(proyectos):
+    """
+    Arreglos por proyecto de una cartera (un DataFrame, una fila por
+    proyecto) con los nombres de DataManager.DEFAULTS y la TMAR decimal. Las
+    columnas faltantes toman los valores por defecto; la TMAR puede darse
+    como `tmar` o `tmar_porcentaje`, y la inversión como `inversion_inicial`
+    o por costos.
+    """
+    from data_manager import DataManager
+
+    cantidad = len(proyectos)
+
+    def columna(nombre):
+        if nombre in proyectos:
+            return proyectos[nombre].to_numpy(dtype=float)
+        return np.full(cantidad, float(DataManager.DEFAULTS[nombre]))
+
+    parametros = {nombre: columna(nombre) for nombre in
+                  ("costo_tanque", "costo_bomba", "costo_instalacion",
+                   "ahorro_anual", "mantenimiento_anual", "vida_util")}
+    if "inversion_inicial" in proyectos:
+        # Se concentra toda la inversión en un solo concepto
+        parametros["costo_tanque"] = proyectos["inversion_inicial"].to_numpy(dtype=float)
+        parametros["costo_bomba"] = np.zeros(cantidad)
+        parametros["costo_instalacion"] = np.zeros(cantidad)
+    if "tmar" in proyectos:
+        parametros["tmar"] = proyectos["tmar"].to_numpy(dtype=float)
+    else:
+        parametros["tmar"] = columna("tmar_porcentaje") / 100
+    return parametros
+
+
+def evaluar_cartera(proyectos):
+    """
+    Evalúa una cartera de proyectos (un DataFrame, una fila por proyecto, o
+    una lista de modelo.Proyecto) en una sola pasada vectorizada. Las
+    columnas se interpretan como en `_parametros_cartera`.
+    """
+    proyectos = _como_cartera(proyectos)
+    parametros = _parametros_cartera(proyectos)
+    n = parametros["vida_util"]
+    tmar = parametros["tmar"]
+    inversion = parametros["costo_tanque"] + parametros["costo_bomba"] + parametros["costo_instalacion"]
+    flujo = parametros["ahorro_anual"] - parametros["mantenimiento_anual"]
+
+    indicadores = finanzas.evaluar_anualidades(parametros)
+    van = indicadores["van"]
+    tir = indicadores["tir"]
+    bc = indicadores["bc"]
+    payback_desc = indicadores["payback_desc"]
+
+    # Misma matriz de decisión que `veredicto`, aplicada a toda la cartera
+    cumplidos = ((van > 0).astype(int) + (tir > tmar) + (bc > 1)
+                 + ((payback_desc > 0) & (payback_desc < n)))
+
+    resultado = pd.DataFrame({
+        "inversion_inicial": inversion,
+        "flujo_neto_anual": flujo,
+        "van": van,
+        "vae": finanzas.vae_lote(van, tmar, n),
+        "tir": tir,
+        "bc": bc,
+        "payback_simple": finanzas.payback_anualidad_lote(inversion, flujo, n),
+        "payback_desc": payback_desc,
+        "criterios_cumplidos": cumplidos,
+        "decision": np.asarray(DECISIONES, dtype=object)[cumplidos],
+    }, index=proyectos.index)
+    if "id" in proyectos:
+        resultado.insert(0, "id", proyectos["id"])
+    return resultado
+
+
+def _flujos_escenarios(datos, var_optimista, var_pesimista):
+    """Ahorros y FlujoCaja de los escenarios optimista, probable y pesimista"""
+    ahorro_base = datos["ahorro_anual"]
+    # Orden: optimista, probable, pesimista
+    ahorros = np.array([ahorro_base * (1 + var_optimista), ahorro_base, ahorro_base * (1 - var_pesimista)])
+    return ahorros, flujo_caja_proyecto(datos, ahorros)
+
+
+def tir_escenarios(datos, var_optimista, var_pesimista):
+    """Ahorro y TIR de cada escenario (no dependen de la TMAR)"""
+    ahorros, flujo_caja = _flujos_escenarios(datos, var_optimista, var_pesimista)
+    tirs, _ = finanzas.tir_flujo_caja_lote(datos["inversion_inicial"], flujo_caja)
+    return {"ahorros": tuple(ahorros.tolist()), "tirs": tuple(tirs.tolist())}
+
+
+def van_escenarios(datos, var_optimista, var_pesimista):
+    """VAN de cada escenario a la TMAR del proyecto"""
+    _, flujo_caja = _flujos_escenarios(datos, var_optimista, var_pesimista)
+    vans = finanzas.van_lote(datos["inversion_inicial"], flujo_caja.netos(), datos["tmar"])
+    return {"vans": tuple(vans.tolist())}
+
+
+def curva_van_tasas(datos):
+    """Curva VAN vs tasa de descuento del escenario probable"""
+    flujos = flujo_caja_proyecto(datos).netos()[0]
+    return {
+        "tasas": TASAS_SENSIBILIDAD,
+        "vans_tasas": finanzas.van_lote(datos["inversion_inicial"], flujos, TASAS_SENSIBILIDAD),
+    }
+
+
+@medir("calcular")
+def comparar_ofertas(datos, ofertas):
+    """
+    Compara ofertas de préstamo (un DataFrame, una fila por oferta, con
+    tasa_nominal en %, periodos_capitalizacion, plazo_meses y
+    sistema_amortizacion) financiando el `porcentaje_financiado` de la
+    inversión. Sin aporte propio la TIR no aplica (NaN).
+    """
+    inversion_inicial = datos["inversion_inicial"]
+    principal = monto_financiado(datos)
+    tasa_nominal = ofertas["tasa_nominal"].to_numpy(dtype=float) / 100
+    periodos = ofertas["periodos_capitalizacion"].to_numpy(dtype=float)
+    plazo = ofertas["plazo_meses"].to_numpy(dtype=float)
+    sistema = ofertas["sistema_amortizacion"].to_numpy()
+
+    resumen = financiamiento.resumen_prestamos(principal, tasa_nominal, periodos, plazo, sistema)
+    aporte, flujo_caja = financiamiento.flujos_financiados(
+        flujo_caja_proyecto(datos), inversion_inicial, principal,
+        tasa_nominal, periodos, plazo, sistema,
+    )
+    van = finanzas.van_lote(aporte, flujo_caja.netos(), datos["tmar"])
+    tir, _ = finanzas.tir_flujo_caja_lote(aporte, flujo_caja)
+    tir = np.where(aporte > 0, tir, np.nan)
+
+    return pd.DataFrame({
+        "cuota_inicial": resumen["cuota_inicial"],
+        "cuota_maxima": resumen["cuota_maxima"],
+        "total_intereses": resumen["total_intereses"],
+        "tasa_efectiva_anual": resumen["tasa_efectiva_anual"],
+        "van": van,
+        "tir": tir,
+    }, index=ofertas.index)
+
+
+def clave_montecarlo(datos, distribuciones, n_simulaciones, semilla=42):
+    """Clave de caché de una simulación Monte Carlo; `distribuciones` como en montecarlo"""
+    return clave_entrada("simular_montecarlo", datos, distribuciones, n_simulaciones, semilla)
+
+
+def trabajo_montecarlo(id_sesion, datos, distribuciones, n_simulaciones, semilla=42):
+    """
+    Simulación Monte Carlo como trabajo en segundo plano de la sesión; el
+    resultado queda en caché con `clave_montecarlo`
+    """
+    clave = clave_montecarlo(datos, distribuciones, n_simulaciones, semilla)
+    especificacion = montecarlo.especificacion_por_variacion(datos, distribuciones)
+    return gestor_trabajos.enviar(id_sesion, "montecarlo", clave, montecarlo.simular,
+                                  datos, especificacion, n_simulaciones, semilla=semilla)
+
+
+def clave_cortes(*argumentos, semilla=42):
+    """Clave de caché de una simulación de cortes; los argumentos son los de `cortes.simular_cortes`"""
+    return clave_entrada("simular_cortes", *argumentos, semilla)
+
+
+def trabajo_cortes(id_sesion, capacidad, consumo_diario, caudal_lpm, frecuencia_anual, duracion_media,
+                   distribucion, variacion, valor_agua, anios, semilla=42):
+    """Simulación de cortes como trabajo en segundo plano; el resultado queda en caché con `clave_cortes`"""
+    argumentos = (capacidad, consumo_diario, caudal_lpm, frecuencia_anual, duracion_media,
+                  distribucion, variacion, valor_agua, anios)
+    clave = clave_cortes(*argumentos, semilla=semilla)
+    return gestor_trabajos.enviar(id_sesion, "cortes", clave, cortes.simular_cortes, *argumentos, semilla=semilla)
+
+
+def ejes_por_variacion(datos, variables, variacion, puntos=60):
+    """Ejes de un barrido alrededor del valor base (±variación relativa)"""
+    ejes = {}
+    for variable in variables:
+        valor = float(datos[variable])
+        if variable == "vida_util":
+            bajo = max(1, int(round(valor * (1 - variacion))))
+            alto = max(bajo, int(round(valor * (1 + variacion))))
+            ejes[variable] = np.arange(bajo, alto + 1)
+        else:
+            delta = abs(valor) * variacion if valor else variacion
+            ejes[variable] = np.linspace(max(valor - delta, 0.0), valor + delta, puntos)
+    return ejes
+
+
+def clave_barrido(datos, ejes, indicadores):
+    """Clave de caché de un barrido de parámetros"""
+    return clave_entrada("barrido", datos, ejes, indicadores)
+
+
+def trabajo_barrido(id_sesion, datos, ejes, indicadores):
+    """Barrido de parámetros como trabajo en segundo plano; el resultado queda en caché con `clave_barrido`"""
+    return gestor_trabajos.enviar(id_sesion, "barrido", clave_barrido(datos, ejes, indicadores), barrido.barrido,
+                                  datos, ejes, indicadores)
+
+
+def _residuos_equilibrio(datos, variable, valores):
+    """
+    Residuo de cada criterio de equilibrio con `variable` igual a cada uno de
+    `valores` (un proyecto por valor): VAN, VP de beneficios menos VP de
+    costos (B/C = 1) y flujos netos sin descontar menos el aporte. Cada
+    criterio se cumple donde su residuo es 0.
+    """
+    datos = dict(datos)
+    if variable in equilibrio.COSTOS:
+        datos["inversion_inicial"] = datos["inversion_inicial"] - datos[variable] + valores
+    else:
+        datos[variable] = valores
+    flujos = flujos_proyecto(datos)
+    aporte = flujos["aporte_propio"]
+    flujo_caja = flujos["flujo_caja"]
+    tasas = flujo_caja.tasa_periodo(datos["tmar"])
+    netos = flujo_caja.netos()
+    return {
+        "van": finanzas.van_lote(aporte, netos, tasas),
+        "bc": finanzas.van_lote(0.0, netos, tasas),
+        "payback": netos.sum(axis=-1) - aporte,
+    }
+
+
+def _intervalo_equilibrio(datos, variable):
+    """Intervalo de búsqueda del valor crítico de una entrada continua"""
+    if variable == "tmar":
+        return 0.0, 1.0
+    escala = max(abs(float(datos[variable])), float(datos["inversion_inicial"]),
+                 float(datos["ahorro_anual"]), 1.0)
+    return 0.0, 10.0 * escala
+
+
+@medir("calcular")
+def equilibrio_proyecto(datos):
+    """
+    Valor crítico de cada entrada de `equilibrio.VARIABLES` para cada
+    criterio de `equilibrio.CRITERIOS`, con las demás entradas fijas.
+    Retorna {criterio: {variable: valor}} (NaN si no existe). Sin reglas de
+    crecimiento ni financiamiento usa las formas cerradas de la anualidad;
+    en otro caso busca la raíz evaluando lotes de valores candidatos.
+    """
+    if not datos.get("financiado") and not any(datos.get(clave) for clave in ENTRADAS_REGLAS):
+        cerrados = equilibrio.equilibrio_anualidades({v: datos[v] for v in equilibrio.VARIABLES})
+        return {criterio: {variable: float(valor) for variable, valor in valores.items()}
+                for criterio, valores in cerrados.items()}
+
+    resultado = {criterio: {} for criterio in equilibrio.CRITERIOS}
+    vidas = np.arange(1, VIDA_MAXIMA + 1)
+    residuos_vida = _residuos_equilibrio(datos, "vida_util", vidas)
+    for criterio in equilibrio.CRITERIOS:
+        for variable in equilibrio.VARIABLES:
+            if variable == "vida_util":
+                valor = equilibrio.raiz_entera(lambda _: residuos_vida[criterio], vidas)
+            elif variable == "tmar" and criterio == "payback":
+                # La recuperación sin descontar no depende de la tasa
+                valor = float("nan")
+            else:
+                valor = equilibrio.raiz_por_rejilla(
+                    lambda valores: _residuos_equilibrio(datos, variable, valores)[criterio],
+                    *_intervalo_equilibrio(datos, variable),
+                )
+            resultado[criterio][variable] = valor
+    return resultado
+
+
+def equilibrio_cartera(proyectos):
+    """
+    Valores críticos de una cartera de proyectos de flujo uniforme (columnas
+    como en `evaluar_cartera`) en una sola pasada vectorizada. Retorna un
+    DataFrame con columnas (criterio, variable).
+    """
+    proyectos = _como_cartera(proyectos)
+    parametros = _parametros_cartera(proyectos)
+    criticos = equilibrio.equilibrio_anualidades(parametros)
+    return pd.concat(
+        {criterio: pd.DataFrame(valores, index=proyectos.index) for criterio, valores in criticos.items()},
+        axis=1,
+    )
+
+
+def _indicadores_variantes(datos, parametros):
+    """
+    VAN y TIR de un lote de variantes del proyecto (`parametros`: un arreglo
+    por entrada) con sus reglas de flujo y su financiamiento, en una pasada.
+    """
+    datos = {**datos, **parametros}
+    datos["inversion_inicial"] = sum(datos[costo] for costo in equilibrio.COSTOS)
+    flujos = flujos_proyecto(datos)
+    aporte = flujos["aporte_propio"]
+    flujo_caja = flujos["flujo_caja"]
+    return {
+        "van": finanzas.van_lote(aporte, flujo_caja.netos(), flujo_caja.tasa_periodo(datos["tmar"])),
+        "tir": finanzas.tir_flujo_caja_lote(aporte, flujo_caja)[0],
+    }
+
+
+@medir("calcular")
+def tornado_proyecto(datos, variacion):
+    """Análisis de tornado del proyecto: cada entrada y regla no nula se mueve ±variación"""
+    return tornado.tornado(datos, variacion, tornado.VARIABLES + tornado.VARIABLES_REGLAS,
+                           evaluar=_indicadores_variantes)
+
+
+def tornado_cacheado(datos, variacion):
+    """Versión en caché de `tornado_proyecto`, compartida entre sesiones"""
+    clave = clave_entrada("tornado", datos, variacion)
+    return cache_resultados.obtener_o_calcular(clave, tornado_proyecto, datos, variacion)
+
+
+def crear_grafo_proyecto():
+    """
+    Grafo de indicadores del proyecto para el recálculo incremental. Sus
+    entradas son las de DataManager.get_all_data() más `var_optimista` y
+    `var_pesimista`; por ejemplo, la TIR no depende de la TMAR, así que mover
+    la TMAR no la recalcula. El grafo es de cada sesión, pero el valor de
+    cada nodo se guarda en cache_resultados con la clave de los datos de los
+    que depende, así que sesiones con las mismas entradas lo comparten.
+    """
+    grafo = GrafoCalculo()
+
+    def en_cache(nombre, datos_nodo):
+        # Decorador: el nodo se calcula una vez por proceso para los mismos datos
+        def envolver(funcion):
+            def calcular(*valores):
+                clave = clave_entrada(nombre, {entrada: grafo.obtener(entrada) for entrada in datos_nodo})
+                return cache_resultados.obtener_o_calcular(clave, funcion, *valores)
+            return calcular
+        return envolver
+
+    def agregar_con_datos(nombre, funcion, entradas):
+        # La función del nodo recibe sus entradas como un diccionario de datos
+        grafo.agregar(nombre, en_cache(nombre, entradas)(lambda *valores: funcion(dict(zip(entradas, valores)))),
+                      entradas)
+
+    con_tmar = ENTRADAS_FLUJOS + ("tmar",)
+
+    agregar_con_datos("flujos", flujos_proyecto, ENTRADAS_FLUJOS)
+
+    @grafo.nodo("van", ("flujos", "tmar"))
+    @en_cache("van", con_tmar)
+    def _van(flujos, tmar):
+        return finanzas.calcular_van(flujos["aporte_propio"], flujos["flujo_caja"], tmar)
+
+    @grafo.nodo("vae", ("van", "tmar", "flujos"))
+    @en_cache("vae", con_tmar)
+    def _vae(van, tmar, flujos):
+        return finanzas.calcular_vae(van, tmar, flujos["flujo_caja"])
+
+    @grafo.nodo("tir", ("flujos",))
+    @en_cache("tir", ENTRADAS_FLUJOS)
+    def _tir(flujos):
+        return finanzas.calcular_tir(flujos["aporte_propio"], flujos["flujo_caja"])
+
+    @grafo.nodo("bc", ("flujos", "tmar"))
+    @en_cache("bc", con_tmar)
+    def _bc(flujos, tmar):
+        return finanzas.calcular_bc(flujos["flujo_caja"], tasa=tmar)
+
+    @grafo.nodo("payback_simple", ("flujos",))
+    @en_cache("payback_simple", ENTRADAS_FLUJOS)
+    def _payback_simple(flujos):
+        return finanzas.calcular_payback(flujos["aporte_propio"], flujos["flujo_caja"])
+
+    @grafo.nodo("payback_desc", ("flujos", "tmar"))
+    @en_cache("payback_desc", con_tmar)
+    def _payback_desc(flujos, tmar):
+        return finanzas.calcular_payback_descontado(flujos["aporte_propio"], flujos["flujo_caja"], tmar)
+
+    @grafo.nodo("resultados", ("ahorro_anual", "mantenimiento_anual", "flujos", "van", "vae", "tir",
+                               "bc", "payback_simple", "payback_desc"))
+    @en_cache("resultados", con_tmar)
+    def _resultados_nodo(ahorro_anual, mantenimiento_anual, flujos, *indicadores):
+        return _resultados(ahorro_anual - mantenimiento_anual, flujos, *indicadores)
+
+    grafo.agregar("veredicto", veredicto, ("resultados", "tmar", "vida_util"))
+
+    agregar_con_datos("tir_escenarios",
+                      lambda datos: tir_escenarios(datos, datos["var_optimista"], datos["var_pesimista"]),
+                      ENTRADAS_ESCENARIOS)
+    agregar_con_datos("van_escenarios",
+                      lambda datos: van_escenarios(datos, datos["var_optimista"], datos["var_pesimista"]),
+                      ENTRADAS_ESCENARIOS + ("tmar",))
+    agregar_con_datos("curva_van_tasas", curva_van_tasas, ENTRADAS_ESCENARIOS[:4] + ENTRADAS_REGLAS)
+    agregar_con_datos("equilibrio", equilibrio_proyecto, con_tmar + equilibrio.COSTOS)
+    return grafo
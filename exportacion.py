@@ -0,0 +1,205 @@
+"""
+Exportación por bloques de resultados grandes (barridos y simulaciones).
+Los resultados se recorren como un generador de DataFrames de tamaño acotado
+y se codifican bloque a bloque en CSV, Parquet o Arrow IPC, de modo que la
+tabla completa nunca se materializa en memoria. Las corridas pueden además
+guardarse en un .npz comprimido para recargarlas sin recalcular.
+"""
+
+import io
+import json
+
+import numpy as np
+import pandas as pd
+
+import montecarlo
+
+# Formato -> (extensión, tipo MIME)
+FORMATOS = {
+    "CSV": (".csv", "text/csv"),
+    "Parquet": (".parquet", "application/vnd.apache.parquet"),
+    "Arrow": (".arrow", "application/vnd.apache.arrow.stream"),
+}
+
+TAMANO_BLOQUE = 100_000
+
+
+def formato_por_extension(ruta):
+    """Formato de exportación según la extensión del archivo (CSV por defecto)"""
+    ruta = str(ruta).lower()
+    for formato, (extension, _) in FORMATOS.items():
+        if ruta.endswith(extension) or (formato == "Parquet" and ruta.endswith(".pq")):
+            return formato
+    return "CSV"
+
+
+# ==================== FUENTES DE BLOQUES ====================
+
+def bloques_dataframe(df, tamano_bloque=TAMANO_BLOQUE):
+    """Recorre un DataFrame existente en bloques de filas"""
+    for inicio in range(0, len(df), tamano_bloque):
+        yield df.iloc[inicio:inicio + tamano_bloque]
+
+
+def bloques_barrido(resultado, tamano_bloque=TAMANO_BLOQUE):
+    """
+    Recorre el resultado de `barrido.barrido` como tabla larga: una fila por
+    punto de la rejilla con el valor de cada eje y de cada indicador. Las
+    filas se generan desde los arreglos compactos, bloque a bloque.
+    """
+    ejes = resultado["ejes"]
+    indicadores = [k for k in resultado if k != "ejes"]
+    forma = tuple(len(valores) for valores in ejes.values())
+    total = int(np.prod(forma))
+    planos = {k: resultado[k].reshape(-1) for k in indicadores}
+
+    for inicio in range(0, total, tamano_bloque):
+        fin = min(inicio + tamano_bloque, total)
+        indices = np.unravel_index(np.arange(inicio, fin), forma)
+        columnas = {nombre: valores[indice] for (nombre, valores), indice in zip(ejes.items(), indices)}
+        columnas.update({k: planos[k][inicio:fin] for k in indicadores})
+        yield pd.DataFrame(columnas)
+
+
+def bloques_montecarlo(base, especificacion, n_simulaciones, semilla=42, tamano_bloque=TAMANO_BLOQUE):
+    """
+    Reproduce una simulación Monte Carlo bloque a bloque: una fila por
+    muestra con sus parámetros y sus indicadores. Con la misma semilla y
+    tamaño de bloque las filas son las que resumió `montecarlo.simular`.
+    """
+    for muestras, resultados in montecarlo.iterar_bloques(
+        base, especificacion, n_simulaciones, tamano_bloque, semilla
+    ):
+        yield pd.DataFrame({**muestras, **resultados})
+
+
+# ==================== CODIFICACIÓN ====================
+
+class _Sumidero(io.RawIOBase):
+    """Archivo de solo escritura que acumula bytes hasta que se retiran"""
+
+    def __init__(self):
+        super().__init__()
+        self._partes = []
+        self._posicion = 0
+
+    def writable(self):
+        return True
+
+    def write(self, datos):
+        datos = bytes(datos)
+        self._partes.append(datos)
+        self._posicion += len(datos)
+        return len(datos)
+
+    def tell(self):
+        return self._posicion
+
+    def retirar(self):
+        datos = b"".join(self._partes)
+        self._partes.clear()
+        return datos
+
+
+def codificar(bloques, formato="CSV"):
+    """
+    Generador de bytes del archivo exportado: cada bloque de DataFrame se
+    codifica y se entrega apenas se escribe (Parquet en un row group por
+    bloque y Arrow IPC en un record batch por bloque).
+    """
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato de exportación no soportado: {formato}")
+
+    if formato == "CSV":
+        primero = True
+        for bloque in bloques:
+            yield bloque.to_csv(header=primero, index=False).encode("utf-8")
+            primero = False
+        return
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    sumidero = _Sumidero()
+    escritor = None
+    try:
+        for bloque in bloques:
+            tabla = pa.Table.from_pandas(bloque, preserve_index=False)
+            if escritor is None:
+                escritor = (pq.ParquetWriter(sumidero, tabla.schema) if formato == "Parquet"
+                            else pa.ipc.new_stream(sumidero, tabla.schema))
+            escritor.write_table(tabla)
+            yield sumidero.retirar()
+    finally:
+        if escritor is not None:
+            escritor.close()
+    yield sumidero.retirar()
+
+
+def exportar(bloques, destino, formato=None):
+    """
+    Escribe los bloques en `destino` (ruta o archivo binario abierto) sin
+    reunirlos en memoria. Retorna el número de bytes escritos.
+    """
+    if formato is None:
+        formato = formato_por_extension(getattr(destino, "name", destino))
+    if isinstance(destino, (str, bytes)) or hasattr(destino, "__fspath__"):
+        with open(destino, "wb") as archivo:
+            return exportar(bloques, archivo, formato)
+    escritos = 0
+    for datos in codificar(bloques, formato):
+        destino.write(datos)
+        escritos += len(datos)
+    return escritos
+
+
+# ==================== CORRIDAS EN FORMATO BINARIO ====================
+
+def _aplanar(valor, ruta, arreglos):
+    """Describe `valor` en JSON y separa sus arreglos NumPy en `arreglos`"""
+    if isinstance(valor, dict):
+        return {"dict": [[clave, _aplanar(v, f"{ruta}/{i}", arreglos)]
+                         for i, (clave, v) in enumerate(valor.items())]}
+    if isinstance(valor, (list, tuple)):
+        tipo = "tuple" if isinstance(valor, tuple) else "list"
+        return {tipo: [_aplanar(v, f"{ruta}/{i}", arreglos) for i, v in enumerate(valor)]}
+    if isinstance(valor, np.ndarray):
+        arreglos[ruta] = valor
+        return {"arreglo": ruta}
+    if isinstance(valor, np.generic):
+        valor = valor.item()
+    return {"valor": valor}
+
+
+def _reconstruir(estructura, arreglos):
+    if "dict" in estructura:
+        return {clave: _reconstruir(v, arreglos) for clave, v in estructura["dict"]}
+    if "tuple" in estructura:
+        return tuple(_reconstruir(v, arreglos) for v in estructura["tuple"])
+    if "list" in estructura:
+        return [_reconstruir(v, arreglos) for v in estructura["list"]]
+    if "arreglo" in estructura:
+        return arreglos[estructura["arreglo"]]
+    return estructura["valor"]
+
+
+def guardar_corrida(destino, resultado, **metadatos):
+    """
+    Guarda una corrida (resultado de un barrido, resumen de una simulación,
+    etc.) en un .npz comprimido: los arreglos se guardan en binario y el resto
+    de la estructura en JSON. `metadatos` (p. ej. los datos de entrada) se
+    recuperan junto con el resultado.
+    """
+    arreglos = {}
+    estructura = _aplanar({"resultado": resultado, "metadatos": metadatos}, "r", arreglos)
+    texto = json.dumps(estructura, ensure_ascii=False).encode("utf-8")
+    np.savez_compressed(destino, __estructura__=np.frombuffer(texto, dtype=np.uint8), **arreglos)
+
+
+def cargar_corrida(origen):
+    """Recarga una corrida guardada con `guardar_corrida`: (resultado, metadatos)"""
+    with np.load(origen, allow_pickle=False) as archivo:
+        arreglos = {clave: archivo[clave] for clave in archivo.files}
+    estructura = json.loads(arreglos.pop("__estructura__").tobytes().decode("utf-8"))
+    corrida = _reconstruir(estructura, arreglos)
+    return corrida["resultado"], corrida["metadatos"]
@@ -0,0 +1,101 @@
+"""
+Figuras de plotly reutilizables entre reruns.
+Cada figura se construye una vez por sesión (layout, plantilla y trazas) y en
+los reruns siguientes solo se reemplazan los datos de las trazas que
+cambiaron. Las series largas se reducen antes de enviarlas al navegador para
+acortar la serialización y el dibujo.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+# Puntos de una serie y barras de un histograma enviados al navegador
+MAXIMO_PUNTOS = 2000
+MAXIMO_BARRAS = 200
+
+_AUSENTE = object()
+
+
+def _iguales(anterior, nuevo):
+    if anterior is _AUSENTE:
+        return False
+    if isinstance(anterior, np.ndarray) or isinstance(nuevo, np.ndarray):
+        return np.array_equal(anterior, nuevo)
+    return anterior == nuevo
+
+
+class CacheFiguras:
+    """Figuras de una sesión: se construyen una vez y luego solo cambian sus datos"""
+
+    def __init__(self, max_figuras=16):
+        self.max_figuras = max_figuras
+        self._figuras = OrderedDict()
+        self.construidas = 0
+        self.reutilizadas = 0
+
+    def figura(self, nombre, construir, datos, clave=None):
+        """
+        Figura `nombre` con `datos`: una lista con las propiedades de cada
+        traza (x, y, text, marker_color, ...). `construir()` crea la figura
+        con su layout y sus trazas la primera vez y cada vez que cambia
+        `clave`, que debe reunir todo lo que afecta al layout o al número de
+        trazas (títulos, líneas de referencia). En los demás reruns solo se
+        asignan las propiedades cuyo valor cambió.
+        """
+        entrada = self._figuras.get(nombre)
+        if entrada is None or entrada[0] != clave:
+            figura = construir()
+            previos = [{} for _ in figura.data]
+            self.construidas += 1
+        else:
+            _, figura, previos = entrada
+            self.reutilizadas += 1
+
+        for traza, nuevos, anteriores in zip(figura.data, datos, previos):
+            cambios = {k: v for k, v in nuevos.items() if not _iguales(anteriores.get(k, _AUSENTE), v)}
+            if cambios:
+                traza.update(cambios)
+                anteriores.update(cambios)
+
+        self._figuras[nombre] = (clave, figura, previos)
+        self._figuras.move_to_end(nombre)
+        while len(self._figuras) > self.max_figuras:
+            self._figuras.popitem(last=False)
+        return figura
+
+
+def decimar(x, y, max_puntos=MAXIMO_PUNTOS):
+    """
+    Reduce una serie a lo más `max_puntos` puntos con decimación min-max:
+    de cada tramo se conservan el mínimo y el máximo, así que los picos y
+    los cruces por cero siguen visibles. Retorna (x, y).
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=float)
+    n = y.size
+    if n <= max_puntos:
+        return x, y
+
+    tramos = max(max_puntos // 2 - 1, 1)
+    tamano = -(-n // tramos)
+    tramos = -(-n // tamano)
+    # El último tramo se completa repitiendo el último valor
+    bloques = np.pad(y, (0, tramos * tamano - n), mode="edge").reshape(tramos, tamano)
+    inicio = np.arange(tramos) * tamano
+    indices = np.concatenate([inicio + bloques.argmin(axis=1), inicio + bloques.argmax(axis=1), [0, n - 1]])
+    indices = np.unique(np.minimum(indices, n - 1))
+    return x[indices], y[indices]
+
+
+def reagrupar_histograma(conteos, bordes, max_barras=MAXIMO_BARRAS):
+    """Suma barras contiguas hasta dejar a lo más `max_barras`: (conteos, bordes)"""
+    conteos = np.asarray(conteos)
+    bordes = np.asarray(bordes)
+    factor = -(-conteos.size // max_barras)
+    if factor <= 1:
+        return conteos, bordes
+    barras = -(-conteos.size // factor)
+    relleno = barras * factor - conteos.size
+    agrupados = np.pad(conteos, (0, relleno)).reshape(barras, factor).sum(axis=1)
+    return agrupados, np.append(bordes[:-1:factor], bordes[-1])
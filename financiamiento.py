@@ -0,0 +1,120 @@
+"""
+Financiamiento del proyecto: cronogramas de amortización y flujos financiados.
+Los cronogramas (francés, alemán y americano) se construyen en forma cerrada
+para un lote de préstamos a la vez, una fila por préstamo y una columna por
+mes, y luego se agregan en el servicio de deuda por período del proyecto.
+"""
+
+import numpy as np
+
+import finanzas
+
+# Sistemas de amortización (el índice es el código usado en los lotes)
+SISTEMAS = ["Francés", "Alemán", "Americano"]
+FRANCES, ALEMAN, AMERICANO = range(len(SISTEMAS))
+
+MESES_POR_ANIO = 12
+
+
+def codigo_sistema(sistema):
+    """Convierte nombres de sistema (o códigos) en un arreglo de códigos"""
+    sistema = np.asarray(sistema)
+    if sistema.dtype.kind not in "USO":
+        return sistema.astype(int)
+    desconocidos = set(sistema.ravel().tolist()) - set(SISTEMAS)
+    if desconocidos:
+        raise ValueError(f"Sistemas de amortización no soportados: {sorted(desconocidos)}")
+    return np.vectorize(SISTEMAS.index, otypes=[int])(sistema)
+
+
+def tasa_mensual(tasa_nominal, periodos_capitalizacion):
+    """Tasa efectiva mensual equivalente a una tasa nominal anual (decimal)"""
+    tasa_nominal = np.asarray(tasa_nominal, dtype=float)
+    periodos = np.asarray(periodos_capitalizacion, dtype=float)
+    return (1.0 + tasa_nominal / periodos) ** (periodos / MESES_POR_ANIO) - 1.0
+
+
+def tabla_amortizacion(principal, tasa, plazo_meses, sistema=FRANCES):
+    """
+    Cronograma mensual de un lote de préstamos.
+    `tasa` es la tasa mensual. Retorna un diccionario de arreglos (préstamos x
+    meses) con cuota, interés, amortización y saldo; los meses posteriores al
+    plazo de cada préstamo quedan en cero.
+    """
+    principal, tasa, plazo, sistema = (
+        np.atleast_1d(x).astype(float).ravel()[:, None] for x in np.broadcast_arrays(
+            np.asarray(principal, dtype=float), np.asarray(tasa, dtype=float),
+            np.asarray(plazo_meses, dtype=float), codigo_sistema(sistema),
+        )
+    )
+    meses = np.arange(1, int(plazo.max(initial=0)) + 1)
+    activo = meses <= plazo
+
+    cuota_francesa = principal / finanzas.factor_anualidad(tasa, plazo)
+    saldo_anterior = np.select(
+        [sistema == FRANCES, sistema == ALEMAN],
+        # Francés: saldo = VP de las cuotas restantes; alemán: amortización constante
+        [cuota_francesa * finanzas.factor_anualidad(tasa, np.maximum(plazo - meses + 1, 0)),
+         principal * (1.0 - (meses - 1) / plazo)],
+        default=np.broadcast_to(principal, activo.shape),
+    )
+    interes = tasa * saldo_anterior
+    amortizacion = np.select(
+        [sistema == FRANCES, sistema == ALEMAN],
+        [cuota_francesa - interes, np.broadcast_to(principal / plazo, activo.shape)],
+        default=np.where(meses == plazo, principal, 0.0),
+    )
+
+    interes = np.where(activo, interes, 0.0)
+    amortizacion = np.where(activo, amortizacion, 0.0)
+    return {
+        "cuota": interes + amortizacion,
+        "interes": interes,
+        "amortizacion": amortizacion,
+        "saldo": np.where(activo, saldo_anterior - amortizacion, 0.0),
+    }
+
+
+def agrupar_meses(mensual, periodos_por_anio=1, periodos=None):
+    """
+    Suma columnas mensuales en períodos de 12/`periodos_por_anio` meses y
+    completa con ceros hasta `periodos`.
+    """
+    mensual = np.atleast_2d(mensual)
+    meses_por_periodo = MESES_POR_ANIO // int(periodos_por_anio)
+    necesarios = -(-mensual.shape[-1] // meses_por_periodo)
+    periodos = max(necesarios, periodos or 0)
+    relleno = periodos * meses_por_periodo - mensual.shape[-1]
+    mensual = np.pad(mensual, ((0, 0), (0, relleno)))
+    return mensual.reshape(mensual.shape[0], periodos, meses_por_periodo).sum(axis=-1)
+
+
+def resumen_prestamos(principal, tasa_nominal, periodos_capitalizacion, plazo_meses, sistema=FRANCES):
+    """Cuota inicial, cuota máxima, intereses totales y TEA de un lote de préstamos"""
+    tasa = tasa_mensual(tasa_nominal, periodos_capitalizacion)
+    tabla = tabla_amortizacion(principal, tasa, plazo_meses, sistema)
+    return {
+        "cuota_inicial": tabla["cuota"][:, 0] if tabla["cuota"].shape[-1] else np.zeros(len(tabla["cuota"])),
+        "cuota_maxima": tabla["cuota"].max(axis=-1, initial=0.0),
+        "total_intereses": tabla["interes"].sum(axis=-1),
+        "tasa_efectiva_anual": np.broadcast_to(
+            finanzas.calcular_tasa_efectiva(np.asarray(tasa_nominal, dtype=float),
+                                            np.asarray(periodos_capitalizacion, dtype=float)),
+            tabla["cuota"].shape[:1],
+        ),
+    }
+
+
+def flujos_financiados(flujo_caja, inversion_inicial, principal, tasa_nominal,
+                       periodos_capitalizacion, plazo_meses, sistema=FRANCES):
+    """
+    Flujo del proyecto financiado, para un lote de préstamos: agrega el
+    servicio de la deuda de cada período al FlujoCaja del proyecto. El
+    horizonte se extiende hasta la última cuota si el préstamo dura más que
+    la vida útil. Retorna (aporte propio, FlujoCaja con servicio de deuda).
+    """
+    tasa = tasa_mensual(tasa_nominal, periodos_capitalizacion)
+    tabla = tabla_amortizacion(principal, tasa, plazo_meses, sistema)
+    servicio = agrupar_meses(tabla["cuota"], flujo_caja.periodos_por_anio, flujo_caja.n_periodos)
+    aporte = np.asarray(inversion_inicial, dtype=float) - np.asarray(principal, dtype=float)
+    return aporte, flujo_caja.con_componente("servicio_deuda", servicio)
@@ -0,0 +1,542 @@
+"""
+Núcleo de cálculo financiero vectorizado.
+Las funciones operan sobre arreglos NumPy y aceptan lotes (2-D) de proyectos
+o de tasas, de modo que escenarios y curvas de sensibilidad se evalúan con
+una sola operación de arreglos en lugar de bucles por período.
+"""
+
+import numpy as np
+
+from cache import CacheResultados
+from flujo_caja import FlujoCaja
+from instrumentacion import medir
+
+
+def _como_lote(flujos):
+    """Convierte flujos a un arreglo 2-D (proyectos x períodos)"""
+    return np.atleast_2d(np.asarray(flujos, dtype=float))
+
+
+def factores_descuento(tasas, n):
+    """Matriz de factores 1/(1+i)^t para t = 1..n, una fila por tasa"""
+    tasas = np.atleast_1d(np.asarray(tasas, dtype=float))
+    periodos = np.arange(1, n + 1)
+    return (1.0 + tasas[:, None]) ** -periodos
+
+
+# Las tablas más grandes (p. ej. las tasas de una simulación) no se guardan
+ELEMENTOS_TABLA_MAXIMOS = 1 << 16
+
+_tablas_descuento = CacheResultados(max_entradas=128)
+
+
+class TablaDescuento:
+    """
+    Factores de descuento de un lote de tasas para t = 1..n. Contiene los
+    factores 1/(1+i)^t, sus acumulados (factor P/A a cada plazo) y, al plazo
+    n, los factores de anualidad y de recuperación de capital. Los arreglos
+    son de solo lectura porque la misma tabla la comparten todos los
+    indicadores de una tasa y horizonte.
+    """
+
+    def __init__(self, tasas, n):
+        self.tasas = np.atleast_1d(np.asarray(tasas, dtype=float))
+        self.n = int(n)
+        self.factores = factores_descuento(self.tasas, self.n)
+        self.tasas.flags.writeable = False
+        self.factores.flags.writeable = False
+        self._acumulados = None
+
+    @property
+    def acumulados(self):
+        """Factores P/A para t = 1..n (se calculan la primera vez que se piden)"""
+        if self._acumulados is None:
+            acumulados = np.cumsum(self.factores, axis=-1)
+            acumulados.flags.writeable = False
+            self._acumulados = acumulados
+        return self._acumulados
+
+    @property
+    def factor_anualidad(self):
+        """Factor P/A al plazo n, uno por tasa"""
+        return self.acumulados[:, -1] if self.n else np.zeros(self.tasas.shape)
+
+    @property
+    def factor_recuperacion(self):
+        """Factor A/P = i / (1 - (1+i)^-n) al plazo n (1/n si i = 0)"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(self.tasas == 0, 1.0 / self.n,
+                            self.tasas / (1.0 - self.factores[:, -1]))
+
+
+def tabla_descuento(tasas, n):
+    """
+    TablaDescuento de (tasas, n), reutilizada desde una caché LRU mientras
+    el tamaño lo permita: VAN, VAE, B/C y payback descontado de una misma
+    TMAR, y la curva VAN vs tasa, comparten así los mismos factores.
+    """
+    tasas = np.atleast_1d(np.asarray(tasas, dtype=float))
+    if tasas.ndim != 1 or tasas.size * n > ELEMENTOS_TABLA_MAXIMOS:
+        return TablaDescuento(tasas, n)
+    clave = (int(n), tasas.tobytes())
+    return _tablas_descuento.obtener_o_calcular(clave, TablaDescuento, tasas, n)
+
+
+def valor_presente_lote(flujos, factores):
+    """Valor presente de cada fila de flujos con su fila de factores"""
+    return np.sum(_como_lote(flujos) * factores, axis=-1)
+
+
+def van_lote(inversion_inicial, flujos_netos, tasas):
+    """Calcula el VAN de un lote de proyectos y/o tasas de descuento"""
+    flujos = _como_lote(flujos_netos)
+    factores = tabla_descuento(tasas, flujos.shape[-1]).factores
+    return valor_presente_lote(flujos, factores) - np.asarray(inversion_inicial, dtype=float)
+
+
+def vae_lote(van, tasas, n):
+    """Convierte un lote de VAN en su Valor Anual Equivalente"""
+    van = np.asarray(van, dtype=float)
+    tasas = np.asarray(tasas, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        factor = (1.0 + tasas) ** n
+        recuperacion = tasas * factor / (factor - 1.0)
+    return np.where(tasas == 0, van / n, van * recuperacion)
+
+
+def bc_lote(beneficios, costos, tasas):
+    """Relación B/C de lotes de flujos de beneficios y costos"""
+    beneficios = _como_lote(beneficios)
+    costos = _como_lote(costos)
+    factores = tabla_descuento(tasas, beneficios.shape[-1]).factores
+    vp_beneficios = valor_presente_lote(beneficios, factores)
+    vp_costos = valor_presente_lote(costos, factores)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(vp_costos != 0, vp_beneficios / vp_costos, 0.0)
+
+
+def _periodo_recuperacion(inversion_inicial, flujos):
+    """Primer período en que los flujos acumulados cubren la inversión"""
+    inversion, flujos = np.broadcast_arrays(
+        np.asarray(inversion_inicial, dtype=float)[..., None], flujos
+    )
+    inversion = inversion[..., 0]
+    if flujos.shape[-1] == 0:
+        return np.full(inversion.shape, np.nan)
+
+    acumulado = np.cumsum(flujos, axis=-1)
+    alcanzado = acumulado >= inversion[..., None]
+    indice = np.argmax(alcanzado, axis=-1)
+
+    flujo = np.take_along_axis(flujos, indice[..., None], axis=-1)[..., 0]
+    anterior = np.take_along_axis(acumulado, indice[..., None], axis=-1)[..., 0] - flujo
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fraccion = np.where(flujo == 0, 0.0, (inversion - anterior) / flujo)
+
+    return np.where(alcanzado.any(axis=-1), indice + 1 + fraccion, np.nan)
+
+
+def payback_lote(inversion_inicial, flujos_netos):
+    """Payback simple de un lote de proyectos (NaN si no se recupera)"""
+    return _periodo_recuperacion(inversion_inicial, _como_lote(flujos_netos))
+
+
+def payback_descontado_lote(inversion_inicial, flujos_netos, tasas):
+    """Payback descontado de un lote de proyectos y/o tasas"""
+    flujos = _como_lote(flujos_netos)
+    factores = tabla_descuento(tasas, flujos.shape[-1]).factores
+    return _periodo_recuperacion(inversion_inicial, flujos * factores)
+
+
+def evaluar_lote(inversion_inicial, beneficios, costos, tasas):
+    """
+    Calcula VAN, VAE, B/C y ambos paybacks en una sola pasada.
+    Los factores de descuento se calculan una vez y se reutilizan.
+    """
+    beneficios = _como_lote(beneficios)
+    costos = _como_lote(costos)
+    n = beneficios.shape[-1]
+    tasas = np.asarray(tasas, dtype=float)
+    inversion = np.asarray(inversion_inicial, dtype=float)
+
+    factores = tabla_descuento(tasas, n).factores
+    flujos = beneficios - costos
+    descontados = flujos * factores
+
+    vp_beneficios = valor_presente_lote(beneficios, factores)
+    vp_costos = valor_presente_lote(costos, factores)
+    van = np.sum(descontados, axis=-1) - inversion
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bc = np.where(vp_costos != 0, vp_beneficios / vp_costos, 0.0)
+
+    return {
+        "van": van,
+        "vae": vae_lote(van, tasas, n),
+        "bc": bc,
+        "payback": _periodo_recuperacion(inversion, flujos),
+        "payback_descontado": _periodo_recuperacion(inversion, descontados),
+    }
+
+
+# ==================== TASA INTERNA DE RETORNO ====================
+
+# Estados reportados por los solucionadores de TIR
+TIR_UNICA = 0
+TIR_INEXISTENTE = 1
+TIR_MULTIPLE = 2
+
+# La TIR existe para tasas mayores que -100% (como en `numpy_financial.irr`);
+# la cota se ajusta por horizonte para que (1+i)^-n no desborde
+TASA_MINIMA = -1.0 + 1e-9
+
+
+def _tasa_minima(n):
+    """Cota inferior de búsqueda de la TIR para horizontes de `n` períodos"""
+    return np.maximum(TASA_MINIMA, np.expm1(-600.0 / np.maximum(n, 1)))
+
+
+def cambios_de_signo(flujos):
+    """Cuenta los cambios de signo de cada fila de flujos (ignora ceros)"""
+    signos = np.sign(_como_lote(flujos))
+    columnas = np.arange(signos.shape[-1])
+    # Arrastra el último signo no nulo sobre los ceros intermedios
+    ultimo = np.maximum.accumulate(np.where(signos != 0, columnas, 0), axis=-1)
+    signos = np.take_along_axis(signos, ultimo, axis=-1)
+    return np.sum(signos[..., 1:] * signos[..., :-1] < 0, axis=-1)
+
+
+def _newton_biseccion(funcion, bajo, alto, tol, max_iter):
+    """
+    Newton salvaguardado por bisección, vectorizado sobre filas independientes.
+    `funcion(tasas, filas)` devuelve (valor, derivada) para las filas activas.
+    Cada raíz debe estar encerrada en [bajo, alto] con signos opuestos.
+    """
+    raiz = 0.5 * (bajo + alto)
+    valor_bajo, _ = funcion(bajo, np.arange(bajo.size))
+    activas = np.arange(raiz.size)
+
+    for _ in range(max_iter):
+        if activas.size == 0:
+            break
+        r = raiz[activas]
+        valor, derivada = funcion(r, activas)
+
+        # Reducir el intervalo conservando el cambio de signo
+        lado_bajo = np.sign(valor) == np.sign(valor_bajo[activas])
+        bajo[activas] = np.where(lado_bajo, r, bajo[activas])
+        alto[activas] = np.where(lado_bajo, alto[activas], r)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            nueva = r - valor / derivada
+        fuera = ~((nueva > bajo[activas]) & (nueva < alto[activas]))
+        nueva = np.where(fuera, 0.5 * (bajo[activas] + alto[activas]), nueva)
+        nueva = np.where(valor == 0, r, nueva)
+
+        raiz[activas] = nueva
+        convergida = (np.abs(nueva - r) <= tol * (1.0 + np.abs(r))) | (valor == 0)
+        activas = activas[~convergida]
+
+    return raiz
+
+
+def _intervalos_por_rejilla(flujos, bajo, alto, puntos=1024, bloque=4096):
+    """
+    Explora una rejilla logarítmica de tasas para filas con varios cambios de
+    signo. La rejilla es común a cada bloque de filas, así que el VAN de
+    todas las filas en todos los puntos es un solo producto de matrices.
+    Retorna el intervalo con la raíz más cercana a cero y cuántas raíces se
+    detectaron en cada fila.
+    """
+    bajo_raiz = np.full(bajo.shape, np.nan)
+    alto_raiz = np.full(bajo.shape, np.nan)
+    raices = np.zeros(bajo.shape, dtype=int)
+    periodos = np.arange(flujos.shape[-1])
+
+    for inicio in range(0, bajo.size, bloque):
+        filas = slice(inicio, min(inicio + bloque, bajo.size))
+        # Más allá de la cota superior de cada fila el VAN no cambia de signo
+        rejilla = np.expm1(np.linspace(np.log1p(bajo[filas].min()), np.log1p(alto[filas].max()), puntos))
+        descuento = np.exp(-np.outer(periodos, np.log1p(rejilla)))
+        valores = flujos[filas] @ descuento
+
+        cruce = np.sign(valores[:, 1:]) * np.sign(valores[:, :-1]) < 0
+        raices[filas] = cruce.sum(axis=-1)
+
+        centro = np.abs(0.5 * (rejilla[1:] + rejilla[:-1]))
+        elegido = np.argmin(np.where(cruce, centro, np.inf), axis=-1)
+        hay = cruce.any(axis=-1)
+        bajo_raiz[filas] = np.where(hay, rejilla[elegido], np.nan)
+        alto_raiz[filas] = np.where(hay, rejilla[elegido + 1], np.nan)
+
+    return bajo_raiz, alto_raiz, raices
+
+
+def tir_lote(flujos, tol=1e-10, max_iter=100):
+    """
+    Calcula la TIR de un lote de vectores de flujos (columna 0 = período 0).
+    Retorna (tir, estado); la TIR es NaN cuando no existe en el intervalo
+    de búsqueda. Con varias raíces se elige la más cercana a cero, como
+    `numpy_financial.irr`, y el estado se marca como TIR_MULTIPLE.
+    """
+    flujos = _como_lote(flujos)
+    periodos = np.arange(flujos.shape[-1])
+    cambios = cambios_de_signo(flujos)
+
+    # Cota superior: a partir de ella el signo del VAN es el de la inversión
+    inicial = np.abs(flujos[:, 0])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cota = np.sum(np.abs(flujos[:, 1:]), axis=-1) / inicial
+    alto = np.where(np.isfinite(cota), np.maximum(cota, 0.0) + 1e-6, 1e3)
+    # Con horizontes largos (p. ej. 360 meses) se sube la cota inferior para
+    # que (1+i)^-n no desborde
+    bajo = np.full(alto.shape, _tasa_minima(periodos[-1]))
+
+    def van_y_derivada(tasas, filas):
+        descuento = (1.0 + tasas[:, None]) ** -periodos
+        flujos_filas = flujos[filas]
+        valor = np.sum(flujos_filas * descuento, axis=-1)
+        derivada = -np.sum(periodos * flujos_filas * descuento, axis=-1) / (1.0 + tasas)
+        return valor, derivada
+
+    # Un solo cambio de signo: raíz única, basta con verificar el intervalo
+    raices = np.zeros(alto.shape, dtype=int)
+    simples = np.flatnonzero(cambios == 1)
+    if simples.size:
+        valor_bajo, _ = van_y_derivada(bajo[simples], simples)
+        valor_alto, _ = van_y_derivada(alto[simples], simples)
+        raices[simples] = np.sign(valor_bajo) * np.sign(valor_alto) < 0
+
+    # Varios cambios de signo: localizar las raíces en una rejilla
+    compuestas = np.flatnonzero(cambios > 1)
+    if compuestas.size:
+        bajo[compuestas], alto[compuestas], raices[compuestas] = _intervalos_por_rejilla(
+            flujos[compuestas], bajo[compuestas], alto[compuestas]
+        )
+
+    tir = np.full(alto.shape, np.nan)
+    filas = np.flatnonzero(raices > 0)
+    if filas.size:
+        def funcion(tasas, activas):
+            return van_y_derivada(tasas, filas[activas])
+        tir[filas] = _newton_biseccion(funcion, bajo[filas], alto[filas], tol, max_iter)
+
+    estado = np.where(raices > 1, TIR_MULTIPLE, TIR_UNICA)
+    estado = np.where(raices > 0, estado, TIR_INEXISTENTE)
+    return tir, estado
+
+
+def _factor_anualidad_y_derivada(tasas, n):
+    """Factor P/A = (1-(1+i)^-n)/i y su derivada respecto de i"""
+    pequena = np.abs(tasas) < 1e-8
+    r = np.where(pequena, 1e-8, tasas)
+    descuento = (1.0 + r) ** -n
+    factor = (1.0 - descuento) / r
+    derivada = (n * descuento / (1.0 + r) - factor) / r
+    # Serie de Taylor alrededor de i = 0
+    factor = np.where(pequena, n - n * (n + 1) / 2.0 * tasas, factor)
+    derivada = np.where(pequena, -n * (n + 1) / 2.0, derivada)
+    return factor, derivada
+
+
+def factor_anualidad(tasas, n):
+    """Factor P/A = (1-(1+i)^-n)/i de un lote de tasas y horizontes"""
+    tasas, n = np.broadcast_arrays(np.asarray(tasas, dtype=float), np.asarray(n, dtype=float))
+    return _factor_anualidad_y_derivada(tasas, n)[0]
+
+
+def van_anualidad_lote(inversion_inicial, flujo_anual, n, tasas):
+    """VAN de flujos uniformes en forma cerrada, sin construir la matriz de flujos"""
+    return np.asarray(flujo_anual, dtype=float) * factor_anualidad(tasas, n) - np.asarray(inversion_inicial, dtype=float)
+
+
+def payback_anualidad_lote(inversion_inicial, flujo_anual, n, tasas=0.0):
+    """
+    Payback (simple con tasa 0, descontado en otro caso) de flujos uniformes en
+    forma cerrada. Coincide con `payback_lote`/`payback_descontado_lote`.
+    """
+    inversion, flujo, n, tasas = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (inversion_inicial, flujo_anual, n, tasas))
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Horizonte continuo en que el VP acumulado iguala la inversión
+        proporcion = inversion / flujo
+        continuo = np.where(
+            tasas == 0, proporcion, -np.log1p(-tasas * proporcion) / np.log1p(tasas)
+        )
+        periodo = np.maximum(np.ceil(continuo - 1e-9), 1.0)
+        acumulado_previo = flujo * factor_anualidad(tasas, periodo - 1)
+        flujo_periodo = flujo * (1.0 + tasas) ** -periodo
+        resultado = periodo + (inversion - acumulado_previo) / flujo_periodo
+
+    recupera = (flujo > 0) & np.isfinite(continuo) & (periodo <= n)
+    resultado = np.where(recupera, resultado, np.nan)
+    return np.where(inversion <= 0, 1.0, resultado)
+
+
+def tir_anualidad_lote(inversion_inicial, flujo_anual, n, tol=1e-10, max_iter=100):
+    """
+    TIR de flujos uniformes [-I, A, A, ..., A] usando la forma cerrada de la
+    anualidad: cada iteración cuesta O(1) por proyecto, sin importar n.
+    Retorna (tir, estado) igual que `tir_lote`.
+    """
+    inversion, flujo, n = np.broadcast_arrays(
+        np.asarray(inversion_inicial, dtype=float),
+        np.asarray(flujo_anual, dtype=float),
+        np.asarray(n, dtype=float),
+    )
+    inversion, flujo, n = (np.atleast_1d(x).ravel() for x in (inversion, flujo, n))
+
+    # Con I > 0 y A > 0 hay un único cambio de signo; la perpetuidad A/I acota la TIR
+    with np.errstate(divide="ignore", invalid="ignore"):
+        alto = np.where(inversion > 0, flujo / inversion, np.nan)
+    bajo = _tasa_minima(n)
+    valido = (inversion > 0) & (flujo > 0) & (n > 0)
+
+    def van_y_derivada(tasas, filas):
+        factor, derivada = _factor_anualidad_y_derivada(tasas, n[filas])
+        return flujo[filas] * factor - inversion[filas], flujo[filas] * derivada
+
+    filas = np.flatnonzero(valido)
+    if filas.size:
+        valor_bajo, _ = van_y_derivada(bajo[filas], filas)
+        valido[filas] = valor_bajo > 0
+        filas = np.flatnonzero(valido)
+
+    tir = np.full(alto.shape, np.nan)
+    if filas.size:
+        def funcion(tasas, activas):
+            return van_y_derivada(tasas, filas[activas])
+        tir[filas] = _newton_biseccion(funcion, bajo[filas], alto[filas], tol, max_iter)
+
+    estado = np.where(valido, TIR_UNICA, TIR_INEXISTENTE)
+    return tir, estado
+
+
+def tir_flujo_caja_lote(inversion_inicial, flujo_caja):
+    """
+    TIR anual de cada proyecto de un FlujoCaja, de cualquier granularidad.
+    Usa la forma cerrada de la anualidad si los flujos netos son uniformes.
+    """
+    netos = flujo_caja.netos()
+    if flujo_caja.es_uniforme():
+        tir, estado = tir_anualidad_lote(inversion_inicial, netos[:, 0], netos.shape[-1])
+    else:
+        inversion = np.broadcast_to(np.asarray(inversion_inicial, dtype=float), netos.shape[:1])
+        tir, estado = tir_lote(np.column_stack([-inversion, netos]))
+    return flujo_caja.anualizar_tasa(tir), estado
+
+
+# ==================== PROYECTOS DE FLUJO UNIFORME ====================
+
+def evaluar_anualidades(parametros, indicadores=("van", "tir", "bc", "payback_desc")):
+    """
+    Evalúa un lote de proyectos de flujo uniforme descritos por arreglos con
+    los nombres de DataManager.DEFAULTS (costo_*, ahorro_anual,
+    mantenimiento_anual, vida_util) más la tasa de descuento `tmar`.
+    """
+    inversion = parametros["costo_tanque"] + parametros["costo_bomba"] + parametros["costo_instalacion"]
+    ahorro = parametros["ahorro_anual"]
+    mantenimiento = parametros["mantenimiento_anual"]
+    flujo = ahorro - mantenimiento
+    n = parametros["vida_util"]
+    tmar = parametros["tmar"]
+
+    resultados = {}
+    if "van" in indicadores:
+        resultados["van"] = van_anualidad_lote(inversion, flujo, n, tmar)
+    if "tir" in indicadores:
+        resultados["tir"] = tir_anualidad_lote(inversion, flujo, n)[0]
+    if "bc" in indicadores:
+        # Con flujos uniformes el descuento se cancela: B/C = ahorro / mantenimiento
+        with np.errstate(divide="ignore", invalid="ignore"):
+            resultados["bc"] = np.where(mantenimiento != 0, ahorro / mantenimiento, 0.0)
+    if "payback_desc" in indicadores:
+        resultados["payback_desc"] = payback_anualidad_lote(inversion, flujo, n, tmar)
+    return resultados
+
+
+# ==================== API ESCALAR ====================
+# Funciones de cálculo de un solo proyecto, usadas por la aplicación y por
+# scripts externos. Internamente delegan en los núcleos vectorizados. Los
+# flujos pueden darse como lista de flujos netos anuales o como un FlujoCaja
+# (de cualquier granularidad); las tasas y los períodos se expresan en años.
+
+def calcular_tasa_efectiva(tasa_nominal, periodos):
+    """Convierte tasa nominal a efectiva"""
+    return (1 + tasa_nominal / periodos) ** periodos - 1
+
+
+@medir("calcular")
+def calcular_van(inversion_inicial, flujos_netos, tasa_descuento):
+    """Calcula el Valor Actual Neto"""
+    if isinstance(flujos_netos, FlujoCaja):
+        tasa_descuento = flujos_netos.tasa_periodo(tasa_descuento)
+        flujos_netos = flujos_netos.netos()[0]
+    return float(van_lote(inversion_inicial, flujos_netos, tasa_descuento)[0])
+
+
+@medir("calcular")
+def calcular_vae(van, tasa, n):
+    """Calcula el Valor Anual Equivalente (`n` en años o el FlujoCaja del proyecto)"""
+    if isinstance(n, FlujoCaja):
+        n = n.anios
+    if n > 0 and float(n).is_integer():
+        return float(van * tabla_descuento(tasa, int(n)).factor_recuperacion[0])
+    return float(vae_lote(van, tasa, n))
+
+
+@medir("calcular")
+def calcular_tir(inversion_inicial, flujos_netos):
+    """Calcula la Tasa Interna de Retorno"""
+    if isinstance(flujos_netos, FlujoCaja):
+        if flujos_netos.n_periodos == 0:
+            return 0
+        return float(tir_flujo_caja_lote(inversion_inicial, flujos_netos.proyecto(0))[0][0])
+    if len(flujos_netos) == 0:
+        return 0
+    # Flujos uniformes con I > 0 y A > 0: forma cerrada de la anualidad; los
+    # demás casos (p. ej. inversión y flujos negativos) van al solucionador general
+    uniformes = all(flujo == flujos_netos[0] for flujo in flujos_netos)
+    if uniformes and inversion_inicial > 0 and flujos_netos[0] > 0:
+        tir, _ = tir_anualidad_lote(inversion_inicial, flujos_netos[0], len(flujos_netos))
+    else:
+        tir, _ = tir_lote([-inversion_inicial] + list(flujos_netos))
+    return float(tir[0])
+
+
+@medir("calcular")
+def calcular_bc(beneficios, costos=None, tasa=None, n=None):
+    """
+    Calcula la relación Beneficio/Costo de montos anuales constantes durante
+    `n` años, o de un FlujoCaja: calcular_bc(flujo_caja, tasa=tmar).
+    """
+    if isinstance(beneficios, FlujoCaja):
+        tasa = beneficios.tasa_periodo(tasa)
+        return float(bc_lote(beneficios.beneficios(), beneficios.costos(), tasa)[0])
+    return float(bc_lote(np.full(n, beneficios), np.full(n, costos), tasa)[0])
+
+
+def como_periodo(valor):
+    """Convierte un período NaN (inversión no recuperada) en None"""
+    return None if np.isnan(valor) else float(valor)
+
+
+@medir("calcular")
+def calcular_payback(inversion_inicial, flujos_netos):
+    """Calcula el período de recuperación simple"""
+    if isinstance(flujos_netos, FlujoCaja):
+        periodo = payback_lote(inversion_inicial, flujos_netos.netos()[0])[0]
+        return como_periodo(periodo / flujos_netos.periodos_por_anio)
+    return como_periodo(payback_lote(inversion_inicial, flujos_netos)[0])
+
+
+@medir("calcular")
+def calcular_payback_descontado(inversion_inicial, flujos_netos, tasa):
+    """Calcula el período de recuperación descontado"""
+    if isinstance(flujos_netos, FlujoCaja):
+        periodo = payback_descontado_lote(
+            inversion_inicial, flujos_netos.netos()[0], flujos_netos.tasa_periodo(tasa)
+        )[0]
+        return como_periodo(periodo / flujos_netos.periodos_por_anio)
+    return como_periodo(payback_descontado_lote(inversion_inicial, flujos_netos, tasa)[0])
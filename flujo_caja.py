@@ -0,0 +1,139 @@
+"""
+Flujo de caja por período, respaldado por arreglos NumPy.
+Un FlujoCaja guarda un arreglo (proyectos x períodos) por componente
+(ahorro, mantenimiento, capex, rescate, impuestos y servicio de deuda) y se
+genera a partir de reglas de crecimiento sin bucles por período, de modo que
+cientos de períodos mensuales de miles de proyectos se construyen con
+operaciones de arreglos. El período 1 es el primero después de la inversión inicial.
+"""
+
+import numpy as np
+
+# Componentes del flujo; los montos se guardan en positivo
+COMPONENTES = ("ahorro", "mantenimiento", "capex", "rescate", "impuestos", "servicio_deuda")
+BENEFICIOS = ("ahorro", "rescate")
+COSTOS = ("mantenimiento", "capex", "impuestos", "servicio_deuda")
+
+
+class FlujoCaja:
+    """Componentes del flujo de caja de uno o varios proyectos por período"""
+
+    def __init__(self, componentes, periodos_por_anio=1):
+        arreglos = {k: np.atleast_2d(np.asarray(v, dtype=float)) for k, v in componentes.items()}
+        desconocidos = set(arreglos) - set(COMPONENTES)
+        if desconocidos:
+            raise ValueError(f"Componentes de flujo no soportados: {sorted(desconocidos)}")
+        forma = np.broadcast_shapes(*(a.shape for a in arreglos.values())) if arreglos else (1, 0)
+        self.componentes = {k: np.broadcast_to(arreglos.get(k, 0.0), forma) for k in COMPONENTES}
+        self.periodos_por_anio = int(periodos_por_anio)
+
+    @classmethod
+    def uniforme(cls, ahorro_anual, mantenimiento_anual, vida_util):
+        """Flujo anual constante, equivalente al modelo de anualidad"""
+        return cls.desde_reglas(ahorro_anual, mantenimiento_anual, vida_util)
+
+    @classmethod
+    def desde_reglas(cls, ahorro_anual, mantenimiento_anual, vida_util, crecimiento_ahorro=0.0,
+                     inflacion_costos=0.0, costo_reemplazo=0.0, anios_reemplazo=0,
+                     valor_rescate=0.0, tasa_impuesto=0.0, periodos_por_anio=1):
+        """
+        Genera el flujo a partir de reglas anuales. Todos los parámetros
+        aceptan escalares o un arreglo por proyecto:
+        - el ahorro crece cada año a `crecimiento_ahorro` (tarifas) y el
+          mantenimiento y los reemplazos a `inflacion_costos`;
+        - cada `anios_reemplazo` años (sin contar el último) se paga
+          `costo_reemplazo`, por ejemplo el cambio de la bomba;
+        - `valor_rescate` se recibe al final de la vida útil;
+        - los impuestos son `tasa_impuesto` sobre el ahorro menos el
+          mantenimiento, cuando es positivo.
+        Los montos anuales se reparten en partes iguales entre los períodos.
+        """
+        (ahorro, mantenimiento, vida, crecimiento, inflacion, reemplazo, cada,
+         rescate, impuesto) = (
+            np.atleast_1d(x).astype(float)[:, None] for x in np.broadcast_arrays(
+                ahorro_anual, mantenimiento_anual, vida_util, crecimiento_ahorro, inflacion_costos,
+                costo_reemplazo, anios_reemplazo, valor_rescate, tasa_impuesto,
+            )
+        )
+        ppa = int(periodos_por_anio)
+        ultimo = np.rint(vida * ppa)
+        periodos = np.arange(1, int(ultimo.max(initial=0)) + 1)
+        activo = periodos <= ultimo
+        # Año (0, 1, ...) al que pertenece cada período y si lo cierra
+        anio = (periodos - 1) // ppa
+        fin_de_anio = periodos % ppa == 0
+
+        ahorro = np.where(activo, ahorro / ppa * (1.0 + crecimiento) ** anio, 0.0)
+        mantenimiento = np.where(activo, mantenimiento / ppa * (1.0 + inflacion) ** anio, 0.0)
+        con_reemplazo = cada > 0
+        toca = fin_de_anio & con_reemplazo & ((anio + 1) % np.where(con_reemplazo, cada, 1) == 0)
+        capex = np.where(toca & (periodos < ultimo), reemplazo * (1.0 + inflacion) ** anio, 0.0)
+        rescate = np.where(periodos == ultimo, rescate, 0.0)
+        impuestos = np.maximum(ahorro - mantenimiento, 0.0) * impuesto
+
+        return cls({"ahorro": ahorro, "mantenimiento": mantenimiento, "capex": capex,
+                    "rescate": rescate, "impuestos": impuestos}, ppa)
+
+    @property
+    def n_proyectos(self):
+        return self.componentes["ahorro"].shape[0]
+
+    @property
+    def n_periodos(self):
+        return self.componentes["ahorro"].shape[1]
+
+    @property
+    def anios(self):
+        """Horizonte en años"""
+        return self.n_periodos / self.periodos_por_anio
+
+    def beneficios(self):
+        return sum(self.componentes[k] for k in BENEFICIOS)
+
+    def costos(self):
+        return sum(self.componentes[k] for k in COSTOS)
+
+    def netos(self):
+        """Flujo neto por período (proyectos x períodos)"""
+        return self.beneficios() - self.costos()
+
+    def es_uniforme(self):
+        """True si cada proyecto tiene el mismo flujo neto en todos sus períodos"""
+        netos = self.netos()
+        return bool(np.all(netos == netos[:, :1]))
+
+    def tasa_periodo(self, tasa_anual):
+        """Tasa efectiva por período equivalente a una tasa efectiva anual"""
+        return (1.0 + np.asarray(tasa_anual, dtype=float)) ** (1.0 / self.periodos_por_anio) - 1.0
+
+    def anualizar_tasa(self, tasa_periodo):
+        """Tasa efectiva anual equivalente a una tasa por período"""
+        return (1.0 + np.asarray(tasa_periodo, dtype=float)) ** self.periodos_por_anio - 1.0
+
+    def por_anio(self):
+        """Agrega los períodos en años (el último año incompleto se completa con ceros)"""
+        if self.periodos_por_anio == 1:
+            return self
+        anios = -(-self.n_periodos // self.periodos_por_anio)
+        relleno = anios * self.periodos_por_anio - self.n_periodos
+        return FlujoCaja({
+            k: np.pad(v, ((0, 0), (0, relleno))).reshape(self.n_proyectos, anios, -1).sum(axis=-1)
+            for k, v in self.componentes.items()
+        })
+
+    def proyecto(self, indice):
+        """FlujoCaja de un solo proyecto del lote"""
+        return FlujoCaja({k: v[indice:indice + 1] for k, v in self.componentes.items()},
+                         self.periodos_por_anio)
+
+    def con_componente(self, nombre, valores):
+        """Copia del flujo sumando `valores` (por período) a un componente"""
+        valores = np.atleast_2d(np.asarray(valores, dtype=float))
+        ancho = max(self.n_periodos, valores.shape[-1])
+
+        def extender(arreglo):
+            return np.pad(arreglo, ((0, 0), (0, ancho - arreglo.shape[-1])))
+
+        componentes = {k: extender(v) for k, v in self.componentes.items()}
+        componentes[nombre] = componentes[nombre] + extender(valores)
+        return FlujoCaja(componentes, self.periodos_por_anio)
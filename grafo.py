@@ -0,0 +1,100 @@
+"""
+Grafo de dependencias para el recálculo incremental de indicadores.
+Cada nodo declara de qué entradas (o de qué otros nodos) depende. Al cambiar
+una entrada se invalidan solo los nodos que dependen de ella, y cada nodo se
+recalcula de forma perezosa la próxima vez que se pide su valor.
+"""
+
+import time
+
+import instrumentacion
+
+_AUSENTE = object()
+
+
+class GrafoCalculo:
+    """Nodos con entradas declaradas, memorizados hasta que cambie una entrada"""
+
+    def __init__(self):
+        self._funciones = {}
+        self._entradas = {}
+        self._dependientes = {}
+        self._valores = {}
+        self._tiempos = {}
+
+    def agregar(self, nombre, funcion, entradas):
+        """Registra un nodo; `funcion` recibe los valores de `entradas` en orden"""
+        self._funciones[nombre] = funcion
+        self._entradas[nombre] = tuple(entradas)
+        for entrada in entradas:
+            self._dependientes.setdefault(entrada, set()).add(nombre)
+        self._tiempos[nombre] = {"calculos": 0, "reutilizados": 0, "ultimo": 0.0, "total": 0.0}
+
+    def nodo(self, nombre, entradas):
+        """Decorador equivalente a `agregar`"""
+        def registrar(funcion):
+            self.agregar(nombre, funcion, entradas)
+            return funcion
+        return registrar
+
+    def actualizar(self, valores):
+        """
+        Fija los valores de entrada e invalida los nodos que dependen de las
+        entradas que cambiaron. Retorna la lista de entradas cambiadas.
+        """
+        cambiadas = [nombre for nombre, valor in valores.items()
+                     if self._valores.get(nombre, _AUSENTE) != valor]
+        for nombre in cambiadas:
+            self._valores[nombre] = valores[nombre]
+            self._invalidar(nombre)
+        return cambiadas
+
+    def _invalidar(self, nombre):
+        pendientes = list(self._dependientes.get(nombre, ()))
+        while pendientes:
+            nodo = pendientes.pop()
+            # Un nodo ya invalidado no tiene dependientes calculados
+            if self._valores.pop(nodo, _AUSENTE) is not _AUSENTE:
+                pendientes.extend(self._dependientes.get(nodo, ()))
+
+    def obtener(self, nombre):
+        """Valor del nodo o entrada, recalculando solo si fue invalidado"""
+        valor = self._valores.get(nombre, _AUSENTE)
+        if valor is not _AUSENTE:
+            if nombre in self._tiempos:
+                self._tiempos[nombre]["reutilizados"] += 1
+            return valor
+        if nombre not in self._funciones:
+            raise KeyError(f"Entrada sin valor en el grafo: {nombre}")
+
+        argumentos = [self.obtener(entrada) for entrada in self._entradas[nombre]]
+        inicio = time.perf_counter()
+        valor = self._funciones[nombre](*argumentos)
+        transcurrido = time.perf_counter() - inicio
+
+        tiempos = self._tiempos[nombre]
+        tiempos["calculos"] += 1
+        tiempos["ultimo"] = transcurrido
+        tiempos["total"] += transcurrido
+        if instrumentacion.ACTIVA:
+            instrumentacion.registrar("indicador", nombre, transcurrido)
+        self._valores[nombre] = valor
+        return valor
+
+    def obtener_varios(self, nombres):
+        """Diccionario nombre -> valor de varios nodos"""
+        return {nombre: self.obtener(nombre) for nombre in nombres}
+
+    def tiempos(self):
+        """Estadísticas por nodo: cálculos, reutilizaciones y tiempos (ms)"""
+        return [
+            {
+                "nodo": nombre,
+                "calculos": tiempos["calculos"],
+                "reutilizados": tiempos["reutilizados"],
+                "ultimo_ms": tiempos["ultimo"] * 1000,
+                "total_ms": tiempos["total"] * 1000,
+                "vigente": nombre in self._valores,
+            }
+            for nombre, tiempos in self._tiempos.items()
+        ]
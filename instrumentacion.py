@@ -0,0 +1,172 @@
+"""
+Instrumentación opcional de las rutas calientes de la aplicación.
+Se activa con la variable de entorno INGECO_INSTRUMENTACION y registra, por
+rerun, el tiempo y el número de llamadas de las funciones calcular_*, de la
+construcción de tablas (Styler y st.dataframe) y de las figuras de plotly.
+
+Valores de INGECO_INSTRUMENTACION, separados por comas:
+    1                   solo el panel de depuración (?debug=1 en la URL)
+    jsonl:<ruta>        agrega una línea JSON por rerun al archivo
+    prometheus:<ruta>   escribe contadores acumulados para el textfile collector
+
+Desactivada, `medir` devuelve la función original y `bloque` un contexto
+vacío, así que el costo es nulo o de una llamada.
+"""
+
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+
+CONFIGURACION = os.environ.get("INGECO_INSTRUMENTACION", "")
+ACTIVA = bool(CONFIGURACION)
+
+_CONTEXTO_VACIO = contextlib.nullcontext()
+
+# Mediciones del rerun en curso: Streamlit ejecuta cada sesión en su propio hilo
+_local = threading.local()
+
+# Acumulados del proceso para Prometheus: (categoria, nombre) -> [llamadas, segundos]
+_acumulados = {}
+_lock = threading.Lock()
+_bibliotecas_instrumentadas = False
+
+
+def _destinos():
+    """Pares (tipo, ruta) de exportación configurados"""
+    destinos = []
+    for parte in CONFIGURACION.split(","):
+        tipo, _, ruta = parte.strip().partition(":")
+        if ruta and tipo in ("jsonl", "prometheus"):
+            destinos.append((tipo, ruta))
+    return destinos
+
+
+def registrar(categoria, nombre, segundos):
+    """Suma una medición al rerun en curso y a los acumulados del proceso"""
+    mediciones = getattr(_local, "mediciones", None)
+    if mediciones is not None:
+        llamadas, total = mediciones.get((categoria, nombre), (0, 0.0))
+        mediciones[(categoria, nombre)] = (llamadas + 1, total + segundos)
+    with _lock:
+        acumulado = _acumulados.setdefault((categoria, nombre), [0, 0.0])
+        acumulado[0] += 1
+        acumulado[1] += segundos
+
+
+def medir(categoria, nombre=None):
+    """Decorador que mide cada llamada; sin instrumentación no envuelve nada"""
+    def decorar(funcion):
+        if not ACTIVA:
+            return funcion
+        etiqueta = nombre or funcion.__name__
+
+        @functools.wraps(funcion)
+        def envoltura(*args, **kwargs):
+            inicio = time.perf_counter()
+            try:
+                return funcion(*args, **kwargs)
+            finally:
+                registrar(categoria, etiqueta, time.perf_counter() - inicio)
+        return envoltura
+    return decorar
+
+
+@contextlib.contextmanager
+def _medir_bloque(categoria, nombre):
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        registrar(categoria, nombre, time.perf_counter() - inicio)
+
+
+def bloque(categoria, nombre):
+    """Contexto que mide un bloque de código"""
+    return _medir_bloque(categoria, nombre) if ACTIVA else _CONTEXTO_VACIO
+
+
+def instrumentar_bibliotecas():
+    """
+    Envuelve la construcción de tablas y figuras: Styler.format,
+    st.dataframe, go.Figure (creación, trazas y layout) y st.plotly_chart.
+    Las de Streamlit se envuelven en DeltaGenerator, así que también se miden
+    las llamadas en columnas, contenedores y la barra lateral.
+    Solo se aplica una vez por proceso y solo con la instrumentación activa.
+    """
+    global _bibliotecas_instrumentadas
+    if not ACTIVA or _bibliotecas_instrumentadas:
+        return
+    import plotly.graph_objects as go
+    import streamlit as st
+    from pandas.io.formats.style import Styler
+    from streamlit.delta_generator import DeltaGenerator
+
+    Styler.format = medir("tabla", "Styler.format")(Styler.format)
+    DeltaGenerator.dataframe = medir("tabla", "st.dataframe")(DeltaGenerator.dataframe)
+    go.Figure.__init__ = medir("figura", "go.Figure")(go.Figure.__init__)
+    go.Figure.add_trace = medir("figura", "Figure.add_trace")(go.Figure.add_trace)
+    go.Figure.update_layout = medir("figura", "Figure.update_layout")(go.Figure.update_layout)
+    DeltaGenerator.plotly_chart = medir("figura", "st.plotly_chart")(DeltaGenerator.plotly_chart)
+    # st.dataframe y st.plotly_chart son métodos ya ligados al contenedor principal
+    st.dataframe = st._main.dataframe
+    st.plotly_chart = st._main.plotly_chart
+    _bibliotecas_instrumentadas = True
+
+
+def iniciar_rerun():
+    """Empieza a registrar las mediciones de un rerun del hilo actual"""
+    _local.mediciones = {}
+    _local.inicio = time.perf_counter()
+
+
+def finalizar_rerun(pagina, sesion=None):
+    """
+    Cierra el rerun, exporta a los destinos configurados y retorna el
+    resumen: página, duración total y mediciones por categoría y nombre.
+    """
+    mediciones = getattr(_local, "mediciones", None) or {}
+    resumen = {
+        "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "sesion": sesion,
+        "pagina": pagina,
+        "total_ms": (time.perf_counter() - getattr(_local, "inicio", time.perf_counter())) * 1000,
+        "mediciones": [
+            {"categoria": categoria, "nombre": nombre, "llamadas": llamadas, "total_ms": total * 1000}
+            for (categoria, nombre), (llamadas, total) in sorted(
+                mediciones.items(), key=lambda item: -item[1][1]
+            )
+        ],
+    }
+    _local.mediciones = None
+
+    for tipo, ruta in _destinos():
+        if tipo == "jsonl":
+            with _lock, open(ruta, "a", encoding="utf-8") as archivo:
+                archivo.write(json.dumps(resumen, ensure_ascii=False) + "\n")
+        else:
+            exportar_prometheus(ruta)
+    return resumen
+
+
+def metricas_prometheus(nombre="ingeco_instrumentacion"):
+    """Llamadas y segundos acumulados en formato de texto de Prometheus"""
+    with _lock:
+        acumulados = sorted(_acumulados.items())
+    lineas = [f"# TYPE {nombre}_llamadas_total counter"]
+    for (categoria, etiqueta), (llamadas, _) in acumulados:
+        lineas.append(f'{nombre}_llamadas_total{{categoria="{categoria}",nombre="{etiqueta}"}} {llamadas}')
+    lineas.append(f"# TYPE {nombre}_segundos_total counter")
+    for (categoria, etiqueta), (_, segundos) in acumulados:
+        lineas.append(f'{nombre}_segundos_total{{categoria="{categoria}",nombre="{etiqueta}"}} {segundos:.6f}')
+    return "\n".join(lineas) + "\n"
+
+
+def exportar_prometheus(ruta):
+    """Escribe las métricas para el textfile collector (reemplazo atómico)"""
+    temporal = f"{ruta}.tmp"
+    with open(temporal, "w", encoding="utf-8") as archivo:
+        archivo.write(metricas_prometheus())
+    os.replace(temporal, ruta)
@@ -0,0 +1,162 @@
+"""
+Modelo de datos del proyecto y de sus resultados.
+`Proyecto` y `ResultadoEvaluacion` son registros inmutables con __slots__:
+ocupan poca memoria, son hashables (sirven como claves de caché) y se
+comparten entre sesiones sin riesgo de que una página los modifique. Un lote
+de registros se convierte en columnas NumPy contiguas (de arreglo de
+estructuras a estructura de arreglos) para los núcleos vectorizados.
+"""
+
+from dataclasses import dataclass, fields, replace
+from operator import attrgetter
+
+import numpy as np
+
+
+@dataclass(frozen=True, slots=True)
+class Proyecto:
+    """Entradas de un proyecto, con los nombres y valores por defecto de DataManager"""
+
+    costo_tanque: float = 750.0
+    costo_bomba: float = 600.0
+    costo_instalacion: float = 400.0
+    vida_util: int = 8
+    ahorro_anual: float = 700.0
+    mantenimiento_anual: float = 100.0
+    tmar_porcentaje: float = 10.0
+    financiado: bool = False
+    porcentaje_financiado: float = 80.0
+    tasa_nominal: float = 12.0
+    periodos_capitalizacion: int = 12
+    plazo_meses: int = 24
+    sistema_amortizacion: str = "Francés"
+    crecimiento_ahorro: float = 0.0
+    inflacion_costos: float = 0.0
+    costo_reemplazo: float = 0.0
+    anios_reemplazo: int = 0
+    valor_rescate: float = 0.0
+    tasa_impuesto: float = 0.0
+
+    @classmethod
+    def desde_dict(cls, datos):
+        """
+        Proyecto a partir de un mapeo (datos de la sesión, una fila de una
+        cartera, ...). Las claves faltantes toman su valor por defecto y los
+        valores se convierten al tipo del campo, así que datos equivalentes
+        dan proyectos iguales. Un campo entero con decimales (vida útil de
+        7.9 años) es un ValueError en lugar de truncarse.
+        """
+        valores = {}
+        for nombre in TIPOS:
+            if nombre in datos:
+                valores[nombre] = _convertir(nombre, datos[nombre])
+        if "tmar_porcentaje" not in datos and "tmar" in datos:
+            valores["tmar_porcentaje"] = float(datos["tmar"]) * 100
+        return cls(**valores)
+
+    @property
+    def tmar(self):
+        """TMAR en formato decimal"""
+        return self.tmar_porcentaje / 100
+
+    @property
+    def inversion_inicial(self):
+        return self.costo_tanque + self.costo_bomba + self.costo_instalacion
+
+    @property
+    def flujo_neto_anual(self):
+        return self.ahorro_anual - self.mantenimiento_anual
+
+    def con(self, **cambios):
+        """Copia del proyecto con algunos campos cambiados"""
+        return replace(self, **cambios)
+
+    def como_dict(self):
+        """Diccionario de datos que consume la capa de evaluación (con `tmar` e `inversion_inicial`)"""
+        datos = dict(zip(CAMPOS, _valores(self)))
+        datos["tmar"] = self.tmar
+        datos["inversion_inicial"] = self.inversion_inicial
+        return datos
+
+
+@dataclass(frozen=True, slots=True)
+class ResultadoEvaluacion:
+    """Indicadores de un proyecto; `componentes` son pares (nombre, montos por período)"""
+
+    flujo_neto_anual: float
+    aporte_propio: float
+    componentes: tuple
+    flujos_netos: tuple
+    van: float
+    vae: float
+    tir: float
+    bc: float
+    payback_simple: float
+    payback_desc: float
+
+    def componente(self, nombre):
+        """Montos por período de un componente del flujo de caja"""
+        return dict(self.componentes)[nombre]
+
+    @property
+    def sin_aporte(self):
+        """True si se financia toda la inversión: la TIR y el payback no aplican"""
+        return self.aporte_propio <= 0
+
+
+CAMPOS = tuple(campo.name for campo in fields(Proyecto))
+TIPOS = {campo.name: campo.type for campo in fields(Proyecto)}
+VALORES_POR_DEFECTO = {campo.name: campo.default for campo in fields(Proyecto)}
+
+CAMPOS_NUMERICOS = tuple(nombre for nombre, tipo in TIPOS.items() if tipo in (float, int))
+INDICADORES = ("flujo_neto_anual", "aporte_propio", "van", "vae", "tir", "bc", "payback_simple", "payback_desc")
+
+_valores = attrgetter(*CAMPOS)
+_numericos = attrgetter(*CAMPOS_NUMERICOS)
+_indicadores = attrgetter(*INDICADORES)
+
+
+def _convertir(nombre, valor):
+    """Valor convertido al tipo del campo; los campos enteros no admiten decimales"""
+    tipo = TIPOS[nombre]
+    if tipo is int:
+        numero = float(valor)
+        if not numero.is_integer():
+            raise ValueError(f"{nombre} debe ser un número entero: {valor}")
+        return int(numero)
+    return tipo(valor)
+
+
+def columnas(proyectos):
+    """
+    Lote de proyectos como columnas (estructura de arreglos): un arreglo
+    contiguo por campo, más `tmar` e `inversion_inicial`, con los nombres
+    que esperan `evaluacion.evaluar_cartera` y `finanzas.evaluar_anualidades`.
+    """
+    proyectos = list(proyectos)
+    numericos = np.array([_numericos(p) for p in proyectos], dtype=float)
+    numericos = numericos.reshape(len(proyectos), len(CAMPOS_NUMERICOS))
+    resultado = {nombre: np.ascontiguousarray(numericos[:, j]) for j, nombre in enumerate(CAMPOS_NUMERICOS)}
+    resultado["financiado"] = np.fromiter((p.financiado for p in proyectos), dtype=bool, count=len(proyectos))
+    resultado["sistema_amortizacion"] = np.array([p.sistema_amortizacion for p in proyectos], dtype=object)
+    resultado["tmar"] = resultado["tmar_porcentaje"] / 100
+    resultado["inversion_inicial"] = (resultado["costo_tanque"] + resultado["costo_bomba"]
+                                      + resultado["costo_instalacion"])
+    return resultado
+
+
+def proyectos_desde_columnas(datos):
+    """Lote de columnas (o un DataFrame) como lista de Proyecto: la conversión inversa de `columnas`"""
+    listas = {nombre: np.asarray(datos[nombre]).tolist() for nombre in CAMPOS if nombre in datos}
+    if "tmar_porcentaje" not in listas and "tmar" in datos:
+        listas["tmar_porcentaje"] = (np.asarray(datos["tmar"], dtype=float) * 100).tolist()
+    return [Proyecto(**{nombre: _convertir(nombre, valor) for nombre, valor in zip(listas, fila)})
+            for fila in zip(*listas.values())]
+
+
+def columnas_resultados(resultados):
+    """Indicadores escalares de un lote de ResultadoEvaluacion como columnas NumPy"""
+    resultados = list(resultados)
+    valores = np.array([_indicadores(r) for r in resultados], dtype=float)
+    valores = valores.reshape(len(resultados), len(INDICADORES))
+    return {nombre: np.ascontiguousarray(valores[:, j]) for j, nombre in enumerate(INDICADORES)}
@@ -0,0 +1,205 @@
+"""
+Simulación Monte Carlo del riesgo del proyecto.
+Muestrea los parámetros de entrada desde distribuciones elegidas por el
+usuario y evalúa VAN, TIR y payback por bloques con el núcleo vectorizado.
+Las estadísticas se acumulan bloque a bloque (conteos, sumas e histogramas
+de rejilla fija), así que la memoria no crece con el número de simulaciones.
+"""
+
+import numpy as np
+
+import finanzas
+
+# Variables que pueden simularse y su valor mínimo admisible
+VARIABLES = {
+    "ahorro_anual": 0.0,
+    "mantenimiento_anual": 0.0,
+    "costo_tanque": 0.0,
+    "costo_bomba": 0.0,
+    "costo_instalacion": 0.0,
+    "vida_util": 1.0,
+    "tmar": 0.0,
+}
+
+DISTRIBUCIONES = ["Fija", "Normal", "Uniforme", "Triangular"]
+
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def especificacion_por_variacion(base, distribuciones):
+    """
+    Construye la especificación de muestreo a partir de una variación relativa.
+    `distribuciones` mapea variable -> (distribución, variación), por ejemplo
+    {"ahorro_anual": ("Normal", 0.15)}: media = base, desviación = 15% de la base.
+    Con ("Empírica", valores) la variable se remuestrea de `valores` (por
+    ejemplo, el ahorro simulado con cortes de agua).
+    """
+    especificacion = {}
+    for variable, (tipo, variacion) in distribuciones.items():
+        valor = float(base[variable])
+        delta = abs(valor) * variacion
+        if tipo == "Normal":
+            especificacion[variable] = ("Normal", (valor, delta))
+        elif tipo == "Uniforme":
+            especificacion[variable] = ("Uniforme", (valor - delta, valor + delta))
+        elif tipo == "Triangular":
+            especificacion[variable] = ("Triangular", (valor - delta, valor, valor + delta))
+        elif tipo == "Empírica":
+            especificacion[variable] = ("Empírica", np.asarray(variacion, dtype=float).ravel())
+    return especificacion
+
+
+def muestrear(base, especificacion, tamano, rng):
+    """Genera `tamano` muestras de cada variable; las no especificadas quedan fijas"""
+    muestras = {}
+    for variable, minimo in VARIABLES.items():
+        tipo, parametros = especificacion.get(variable, ("Fija", None))
+        if tipo == "Normal":
+            valores = rng.normal(parametros[0], parametros[1], tamano)
+        elif tipo == "Uniforme":
+            valores = rng.uniform(parametros[0], parametros[1], tamano)
+        elif tipo == "Triangular":
+            minimo_t, moda, maximo = parametros
+            if maximo > minimo_t:
+                valores = rng.triangular(minimo_t, moda, maximo, tamano)
+            else:
+                valores = np.full(tamano, float(moda))
+        elif tipo == "Empírica":
+            valores = rng.choice(parametros, tamano)
+        else:
+            valores = np.full(tamano, float(base[variable]))
+        muestras[variable] = np.maximum(valores, minimo)
+
+    muestras["vida_util"] = np.rint(muestras["vida_util"])
+    return muestras
+
+
+def evaluar_muestras(muestras):
+    """Evalúa VAN, TIR y payback descontado de un bloque de muestras"""
+    return finanzas.evaluar_anualidades(muestras, ("van", "tir", "payback_desc"))
+
+
+class HistogramaAcumulado:
+    """
+    Histograma de rejilla fija que se acumula por bloques.
+    Los valores fuera del rango se cuentan en las celdas extremas; con una
+    rejilla fina permite estimar percentiles sin guardar las muestras.
+    """
+
+    def __init__(self, minimo, maximo, celdas=4000):
+        if not maximo > minimo:
+            maximo = minimo + 1.0
+        self.bordes = np.linspace(minimo, maximo, celdas + 1)
+        self.conteos = np.zeros(celdas, dtype=np.int64)
+        self.validos = 0
+
+    @classmethod
+    def desde_piloto(cls, valores, celdas=4000):
+        """Define el rango a partir de un bloque piloto, con margen para las colas"""
+        valores = valores[np.isfinite(valores)]
+        if valores.size == 0:
+            return cls(0.0, 1.0, celdas)
+        bajo, alto = np.percentile(valores, [0.1, 99.9])
+        margen = 0.5 * (alto - bajo) or max(abs(bajo), 1.0) * 0.1
+        return cls(bajo - margen, alto + margen, celdas)
+
+    def agregar(self, valores):
+        valores = valores[np.isfinite(valores)]
+        celdas = np.searchsorted(self.bordes, valores, side="right") - 1
+        celdas = np.clip(celdas, 0, self.conteos.size - 1)
+        self.conteos += np.bincount(celdas, minlength=self.conteos.size)
+        self.validos += valores.size
+
+    def percentiles(self, qs):
+        """Percentiles interpolados dentro de cada celda"""
+        if self.validos == 0:
+            return {q: float("nan") for q in qs}
+        acumulado = np.cumsum(self.conteos)
+        resultado = {}
+        for q in qs:
+            objetivo = q / 100 * self.validos
+            celda = min(int(np.searchsorted(acumulado, objetivo)), self.conteos.size - 1)
+            previo = acumulado[celda - 1] if celda > 0 else 0
+            fraccion = (objetivo - previo) / self.conteos[celda] if self.conteos[celda] else 0.0
+            ancho = self.bordes[celda + 1] - self.bordes[celda]
+            resultado[q] = float(self.bordes[celda] + fraccion * ancho)
+        return resultado
+
+    def reagrupar(self, celdas=80):
+        """Histograma más grueso para graficar: (conteos, bordes)"""
+        factor = max(self.conteos.size // celdas, 1)
+        utiles = self.conteos.size - self.conteos.size % factor
+        conteos = self.conteos[:utiles].reshape(-1, factor).sum(axis=1)
+        conteos[-1] += self.conteos[utiles:].sum()
+        return conteos, self.bordes[:utiles + 1:factor]
+
+
+def iterar_bloques(base, especificacion, n_simulaciones, tamano_bloque=100_000, semilla=None):
+    """
+    Genera (muestras, resultados) bloque a bloque. Con la misma semilla la
+    secuencia es la de `simular`, así que las muestras pueden reproducirse
+    (por ejemplo para exportarlas) sin guardarlas durante la simulación.
+    """
+    rng = np.random.default_rng(semilla)
+    realizadas = 0
+    while realizadas < n_simulaciones:
+        tamano = min(tamano_bloque, n_simulaciones - realizadas)
+        muestras = muestrear(base, especificacion, tamano, rng)
+        yield muestras, evaluar_muestras(muestras)
+        realizadas += tamano
+
+
+def simular(base, especificacion, n_simulaciones, tamano_bloque=100_000, semilla=None, progreso=None):
+    """
+    Ejecuta la simulación por bloques y retorna estadísticas resumidas.
+    `base` son los datos de DataManager.get_all_data(); `progreso`, si se da,
+    recibe la fracción completada tras cada bloque y puede devolver False
+    para cancelar la simulación.
+    """
+    indicadores = ("van", "tir", "payback_desc")
+    histogramas = {}
+    sumas = {k: 0.0 for k in indicadores}
+    sumas_cuadrado = {k: 0.0 for k in indicadores}
+    validos = {k: 0 for k in indicadores}
+    van_negativo = 0
+    tir_bajo_tmar = 0
+    realizadas = 0
+
+    for muestras, resultados in iterar_bloques(base, especificacion, n_simulaciones, tamano_bloque, semilla):
+        for k in indicadores:
+            valores = resultados[k]
+            if k not in histogramas:
+                histogramas[k] = HistogramaAcumulado.desde_piloto(valores)
+            histogramas[k].agregar(valores)
+            finitos = valores[np.isfinite(valores)]
+            sumas[k] += finitos.sum()
+            sumas_cuadrado[k] += np.square(finitos).sum()
+            validos[k] += finitos.size
+
+        van_negativo += int(np.count_nonzero(resultados["van"] < 0))
+        # Una TIR inexistente (NaN) también se considera por debajo de la TMAR
+        tir_bajo_tmar += int(np.count_nonzero(~(resultados["tir"] > muestras["tmar"])))
+        realizadas += resultados["van"].size
+
+        if progreso is not None and progreso(realizadas / n_simulaciones) is False:
+            break
+
+    estadisticas = {}
+    for k in indicadores:
+        media = sumas[k] / validos[k] if validos[k] else float("nan")
+        varianza = sumas_cuadrado[k] / validos[k] - media ** 2 if validos[k] else float("nan")
+        estadisticas[k] = {
+            "media": media,
+            "desviacion": float(np.sqrt(max(varianza, 0.0))) if validos[k] else float("nan"),
+            "validos": validos[k],
+            "percentiles": histogramas[k].percentiles(PERCENTILES) if k in histogramas else {},
+            "histograma": histogramas[k].reagrupar() if k in histogramas else None,
+        }
+
+    return {
+        "n_simulaciones": realizadas,
+        "prob_van_negativo": van_negativo / realizadas if realizadas else float("nan"),
+        "prob_tir_menor_tmar": tir_bajo_tmar / realizadas if realizadas else float("nan"),
+        "prob_sin_recuperacion": 1 - validos["payback_desc"] / realizadas if realizadas else float("nan"),
+        "estadisticas": estadisticas,
+    }
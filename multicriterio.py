@@ -0,0 +1,176 @@
+"""
+Análisis multicriterio matricial.
+Las alternativas se describen con una matriz de puntajes (alternativas x
+criterios) y los pesos con un vector, o con una matriz de varios vectores de
+pesos (uno por fila). Suma ponderada, TOPSIS y AHP se reducen a productos de
+matrices, así que cientos de alternativas del catálogo y miles de vectores de
+pesos se evalúan sin bucles por alternativa.
+"""
+
+import numpy as np
+
+METODOS = ["Suma ponderada", "TOPSIS", "AHP"]
+
+# Índice aleatorio de Saaty para la razón de consistencia (n = 1..10)
+INDICE_ALEATORIO = (0.0, 0.0, 0.58, 0.90, 1.12, 1.24, 1.32, 1.41, 1.45, 1.49)
+
+# Vectores de pesos evaluados a la vez en el análisis de estabilidad
+BLOQUE_PESOS = 4096
+
+
+def _preparar(matriz, pesos, beneficio):
+    matriz = np.atleast_2d(np.asarray(matriz, dtype=float))
+    pesos = np.asarray(pesos, dtype=float)
+    pesos = pesos / pesos.sum(axis=-1, keepdims=True)
+    if beneficio is None:
+        beneficio = np.ones(matriz.shape[-1], dtype=bool)
+    return matriz, pesos, np.broadcast_to(np.asarray(beneficio, dtype=bool), matriz.shape[-1:])
+
+
+def normalizar_min_max(matriz, beneficio=None):
+    """
+    Lleva cada criterio a [0, 1] (1 = mejor). Los criterios de costo
+    (`beneficio` False) se invierten; un criterio constante vale 1.
+    """
+    matriz, _, beneficio = _preparar(matriz, 1.0, beneficio)
+    minimo, maximo = matriz.min(axis=0), matriz.max(axis=0)
+    rango = np.where(maximo > minimo, maximo - minimo, 1.0)
+    escalada = np.where(beneficio, matriz - minimo, maximo - matriz) / rango
+    return np.where(maximo > minimo, escalada, 1.0)
+
+
+def suma_ponderada(matriz, pesos, beneficio=None):
+    """
+    Puntaje ponderado de cada alternativa. Los puntajes se usan tal cual
+    (p. ej. calificaciones de 1 a 10); para atributos en distintas unidades
+    normalícelos antes con `normalizar_min_max`. Con una matriz de pesos
+    retorna una fila de puntajes por vector de pesos.
+    """
+    matriz, pesos, beneficio = _preparar(matriz, pesos, beneficio)
+    # Un criterio de costo suma su opuesto: menos es mejor
+    return pesos @ np.where(beneficio, matriz, -matriz).T
+
+
+def topsis(matriz, pesos, beneficio=None):
+    """
+    Cercanía relativa de cada alternativa a la solución ideal (0 a 1).
+    Como los pesos son no negativos, el ideal y el anti-ideal ponderados son
+    los de la matriz normalizada escalados por el peso, y las distancias al
+    cuadrado son un producto de matrices con los pesos al cuadrado.
+    """
+    matriz, pesos, beneficio = _preparar(matriz, pesos, beneficio)
+    normas = np.linalg.norm(matriz, axis=0)
+    normalizada = matriz / np.where(normas > 0, normas, 1.0)
+    mejor = np.where(beneficio, normalizada.max(axis=0), normalizada.min(axis=0))
+    peor = np.where(beneficio, normalizada.min(axis=0), normalizada.max(axis=0))
+
+    cuadrados = np.square(pesos)
+    distancia_ideal = np.sqrt(np.maximum(cuadrados @ np.square(normalizada - mejor).T, 0.0))
+    distancia_anti = np.sqrt(np.maximum(cuadrados @ np.square(normalizada - peor).T, 0.0))
+    total = distancia_ideal + distancia_anti
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(total > 0, distancia_anti / total, 1.0)
+
+
+def puntajes_ahp(matriz, pesos, beneficio=None):
+    """
+    Prioridad global AHP en modo distributivo: cada criterio se normaliza
+    para sumar 1 entre alternativas (los de costo por su inverso) y se
+    pondera con los pesos, por ejemplo los de `pesos_ahp`.
+    """
+    matriz, pesos, beneficio = _preparar(matriz, pesos, beneficio)
+    with np.errstate(divide="ignore"):
+        valores = np.where(beneficio, matriz, 1.0 / matriz)
+    prioridades = valores / valores.sum(axis=0)
+    return pesos @ prioridades.T
+
+
+def pesos_ahp(comparaciones):
+    """
+    Pesos AHP de una matriz de comparaciones por pares (a_ij = importancia
+    de i sobre j). Solo se usa el triángulo superior; el inferior se completa
+    con los recíprocos. Retorna (pesos, razón de consistencia).
+    """
+    comparaciones = np.asarray(comparaciones, dtype=float)
+    n = comparaciones.shape[0]
+    superior = np.triu(comparaciones, 1)
+    reciproca = superior + np.tril(1.0 / np.where(superior.T > 0, superior.T, 1.0), -1) + np.eye(n)
+
+    valores, vectores = np.linalg.eig(reciproca)
+    principal = np.argmax(valores.real)
+    pesos = np.abs(vectores[:, principal].real)
+    pesos = pesos / pesos.sum()
+
+    lambda_max = valores[principal].real
+    indice = INDICE_ALEATORIO[n - 1] if n <= len(INDICE_ALEATORIO) else INDICE_ALEATORIO[-1]
+    razon = (lambda_max - n) / (n - 1) / indice if n > 2 else 0.0
+    return pesos, float(max(razon, 0.0))
+
+
+def comparaciones_desde_pesos(pesos):
+    """Matriz de comparaciones perfectamente consistente (a_ij = w_i / w_j)"""
+    pesos = np.asarray(pesos, dtype=float)
+    return pesos[:, None] / pesos[None, :]
+
+
+def puntajes(matriz, pesos, beneficio=None, metodo="Suma ponderada"):
+    """Puntajes de las alternativas con el método indicado (mayor es mejor)"""
+    if metodo == "Suma ponderada":
+        return suma_ponderada(matriz, pesos, beneficio)
+    if metodo == "TOPSIS":
+        return topsis(matriz, pesos, beneficio)
+    if metodo == "AHP":
+        return puntajes_ahp(matriz, pesos, beneficio)
+    raise ValueError(f"Método multicriterio no soportado: {metodo}")
+
+
+def ranking(puntajes_alternativas):
+    """Posición (1 = mejor) de cada alternativa en cada fila de puntajes"""
+    orden = np.argsort(-np.asarray(puntajes_alternativas), axis=-1, kind="stable")
+    posiciones = np.empty_like(orden)
+    np.put_along_axis(posiciones, orden, np.arange(1, orden.shape[-1] + 1), axis=-1)
+    return posiciones
+
+
+def muestrear_pesos(n_muestras, pesos_base=None, concentracion=None, n_criterios=None, semilla=None):
+    """
+    Vectores de pesos sobre el símplex. Sin `concentracion` son uniformes
+    (Dirichlet(1, ..., 1)); con ella se concentran alrededor de `pesos_base`
+    (Dirichlet(concentracion * pesos_base)): cuanto mayor, más cerca.
+    """
+    rng = np.random.default_rng(semilla)
+    if pesos_base is None:
+        alfa = np.ones(n_criterios)
+    else:
+        pesos_base = np.asarray(pesos_base, dtype=float)
+        pesos_base = pesos_base / pesos_base.sum()
+        alfa = np.ones(pesos_base.size) if concentracion is None else \
+            np.maximum(concentracion * pesos_base, 1e-3)
+    return rng.dirichlet(alfa, n_muestras)
+
+
+def estabilidad_ranking(matriz, muestras_pesos, beneficio=None, metodo="Suma ponderada"):
+    """
+    Evalúa las alternativas con cada vector de pesos muestreado. Retorna la
+    fracción de vectores en que gana cada alternativa, su posición media y
+    la fracción en que queda entre las tres primeras.
+    """
+    muestras_pesos = np.atleast_2d(muestras_pesos)
+    n_alternativas = np.atleast_2d(matriz).shape[0]
+    victorias = np.zeros(n_alternativas)
+    suma_posiciones = np.zeros(n_alternativas)
+    en_podio = np.zeros(n_alternativas)
+
+    for inicio in range(0, muestras_pesos.shape[0], BLOQUE_PESOS):
+        bloque = puntajes(matriz, muestras_pesos[inicio:inicio + BLOQUE_PESOS], beneficio, metodo)
+        victorias += np.bincount(np.argmax(bloque, axis=-1), minlength=n_alternativas)
+        posiciones = ranking(bloque)
+        suma_posiciones += posiciones.sum(axis=0)
+        en_podio += (posiciones <= 3).sum(axis=0)
+
+    total = muestras_pesos.shape[0]
+    return {
+        "frecuencia_ganador": victorias / total,
+        "posicion_media": suma_posiciones / total,
+        "frecuencia_podio": en_podio / total,
+    }
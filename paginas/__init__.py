@@ -0,0 +1,4 @@
+"""
+Páginas de la aplicación, una por opción del menú.
+app.py importa cada módulo bajo demanda y llama a su función render().
+"""
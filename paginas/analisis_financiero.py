@@ -0,0 +1,249 @@
+"""
+Página 📊 Análisis Financiero: Indicadores financieros y flujo de caja proyectado.
+"""
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
+
+from data_manager import DataManager
+import reemplazo
+
+COLUMNAS_COMPONENTES = {
+    'ahorro': 'Ahorro',
+    'mantenimiento': 'Mantenimiento',
+    'capex': 'Reemplazos',
+    'impuestos': 'Impuestos',
+    'servicio_deuda': 'Servicio de Deuda',
+    'rescate': 'Valor de Rescate',
+}
+
+
+def _figura_flujo_caja():
+    """Layout y trazas del gráfico de flujos; los datos se asignan en cada rerun"""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(name='Flujo Neto Anual'))
+    fig.add_trace(go.Scatter(name='Flujo Acumulado', mode='lines+markers', line=dict(color='blue', width=3)))
+    fig.update_layout(
+        title="Flujo de Caja del Proyecto",
+        xaxis_title="Año",
+        yaxis_title="Monto (S/)",
+        hovermode='x unified',
+        height=500
+    )
+    return fig
+
+
+def _figura_costo_anual():
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(name='Costo Anual Equivalente', mode='lines+markers',
+                             line=dict(color='darkorange', width=3)))
+    fig.update_layout(
+        title="Costo Anual Equivalente de la Bomba según su Edad de Reemplazo",
+        xaxis_title="Edad de reemplazo (años)",
+        yaxis_title="Costo anual equivalente (S/)",
+        height=400
+    )
+    return fig
+
+
+def render():
+    """Dibuja la página 📊 Análisis Financiero"""
+    st.header("📊 Análisis Financiero del Proyecto")
+    
+    # Recuperar datos
+    if 'inversion_inicial' not in st.session_state:
+        st.warning("⚠️ Por favor, primero ingresa los datos en la sección 'Datos de Inversión'")
+    else:
+        proyecto = DataManager.get_proyecto()
+        inversion_inicial = proyecto.inversion_inicial
+        vida_util = proyecto.vida_util
+        tmar = proyecto.tmar
+        
+        # Cálculos incrementales: solo se recalcula lo que depende de datos cambiados
+        grafo = DataManager.get_grafo()
+        resultados = grafo.obtener("resultados")
+        flujo_neto_anual = resultados.flujo_neto_anual
+        flujos_netos = list(resultados.flujos_netos)
+        van = resultados.van
+        vae = resultados.vae
+        tir = resultados.tir
+        bc = resultados.bc
+        payback_simple = resultados.payback_simple
+        payback_desc = resultados.payback_desc
+        
+        # Métricas principales
+        st.subheader("📈 Indicadores Financieros Principales")
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.metric("Valor Actual Neto (VAN)", f"S/ {van:,.2f}", 
+                     "✅ Proyecto Viable" if van > 0 else "❌ No Viable")
+            st.metric("Valor Anual Equivalente (VAE)", f"S/ {vae:,.2f}")
+        
+        with col2:
+            if resultados.sin_aporte:
+                st.metric("Tasa Interna de Retorno (TIR)", "No aplica", "Sin aporte propio",
+                          delta_color="off")
+            else:
+                st.metric("Tasa Interna de Retorno (TIR)", f"{tir*100:.2f}%",
+                         f"{'✅' if tir > tmar else '❌'} TMAR: {tmar*100:.2f}%")
+            st.metric("Relación B/C", f"{bc:.3f}",
+                     "✅ Conveniente" if bc > 1 else "❌ No Conveniente")
+        
+        with col3:
+            if resultados.sin_aporte:
+                st.metric("Payback Simple", "No aplica")
+                st.metric("Payback Descontado", "No aplica")
+            else:
+                st.metric("Payback Simple", f"{payback_simple:.2f} años" if payback_simple else "N/A")
+                st.metric("Payback Descontado", f"{payback_desc:.2f} años" if payback_desc else "N/A")
+        
+        st.divider()
+        
+        # Interpretación
+        st.subheader("📝 Interpretación de Resultados")
+        
+        if van > 0:
+            st.success(f"""
+            ✅ **VAN = S/ {van:,.2f}** (Positivo)
+            - El proyecto es **económicamente viable**
+            - Se genera valor adicional de S/ {van:,.2f} en términos actuales
+            """)
+        else:
+            st.error(f"""
+            ❌ **VAN = S/ {van:,.2f}** (Negativo)
+            - El proyecto **NO es económicamente viable**
+            - Se perdería S/ {abs(van):,.2f} en términos actuales
+            """)
+        
+        if resultados.sin_aporte:
+            st.info("""
+            ℹ️ **TIR y payback: no aplican**
+            - Se financia toda la inversión, así que no hay aporte propio que rinda o se recupere
+            - Usa el VAN y la relación B/C para evaluar el proyecto
+            """)
+        elif tir > tmar:
+            st.success(f"""
+            ✅ **TIR = {tir*100:.2f}%** > **TMAR = {tmar*100:.2f}%**
+            - El proyecto es **rentable**
+            - La rentabilidad supera la tasa mínima requerida
+            """)
+        else:
+            st.error(f"""
+            ❌ **TIR = {tir*100:.2f}%** < **TMAR = {tmar*100:.2f}%**
+            - El proyecto **NO es rentable**
+            - No alcanza la tasa mínima de retorno esperada
+            """)
+        
+        if bc > 1:
+            st.success(f"""
+            ✅ **B/C = {bc:.3f}** (Mayor a 1)
+            - Por cada sol invertido, se recibe S/ {bc:.2f}
+            - El proyecto es **conveniente**
+            """)
+        else:
+            st.error(f"""
+            ❌ **B/C = {bc:.3f}** (Menor a 1)
+            - Por cada sol invertido, se recibe S/ {bc:.2f}
+            - El proyecto **NO es conveniente**
+            """)
+        
+        st.divider()
+        
+        # Flujo de Caja
+        st.subheader("💰 Flujo de Caja Proyectado")
+        
+        # Con financiamiento el horizonte puede extenderse hasta la última cuota
+        horizonte = len(flujos_netos)
+        años = list(range(0, horizonte + 1))
+        flujos = [-resultados.aporte_propio] + flujos_netos
+        flujos_acumulados = np.cumsum(flujos)
+        
+        # Se muestran solo los componentes del flujo que tienen montos
+        df_flujos = pd.DataFrame({'Año': años})
+        for componente, titulo in COLUMNAS_COMPONENTES.items():
+            montos = resultados.componente(componente)
+            if componente in ('ahorro', 'mantenimiento') or any(montos):
+                df_flujos[titulo] = [0] + list(montos)
+        df_flujos['Flujo Neto'] = flujos
+        df_flujos['Flujo Acumulado'] = flujos_acumulados
+        
+        st.dataframe(df_flujos.style.format(
+            'S/ {:,.2f}', subset=[c for c in df_flujos.columns if c != 'Año']
+        ), width='stretch', hide_index=True)
+        
+        # Gráfico de flujos: la figura se reutiliza y solo cambian sus datos
+        flujo_neto = df_flujos['Flujo Neto'].to_numpy()
+        fig = DataManager.get_figuras().figura("flujo_caja", _figura_flujo_caja, [
+            {"x": df_flujos['Año'].to_numpy(), "y": flujo_neto,
+             "marker_color": np.where(flujo_neto < 0, 'red', 'green')},
+            {"x": df_flujos['Año'].to_numpy(), "y": df_flujos['Flujo Acumulado'].to_numpy()},
+        ])
+        
+        st.plotly_chart(fig, width='stretch')
+        
+        # Vida económica y política de reemplazo de la bomba
+        st.subheader("🔧 Vida Económica y Reemplazo de la Bomba")
+        st.markdown("El mantenimiento de la bomba crece con su edad y su valor de rescate disminuye: "
+                    "la vida económica es la edad de reemplazo con menor costo anual equivalente")
+        
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            mantenimiento_bomba = st.number_input("Mantenimiento de la bomba, año 1 (S/)", min_value=0.0,
+                                                  value=40.0, step=10.0, key="reemplazo_mantenimiento")
+        with col2:
+            crecimiento_bomba = st.slider("Aumento anual del mantenimiento (%)", 0, 50, 15,
+                                          key="reemplazo_crecimiento") / 100
+        with col3:
+            depreciacion_bomba = st.slider("Depreciación anual del rescate (%)", 0, 60, 20,
+                                           key="reemplazo_depreciacion") / 100
+        with col4:
+            horizonte_reemplazo = st.number_input("Horizonte de planeación (años)", min_value=1, max_value=60,
+                                                  value=int(vida_util), key="reemplazo_horizonte")
+        
+        costo_bomba = proyecto.costo_bomba
+        mantenimiento, rescate = reemplazo.curvas_geometricas(costo_bomba, mantenimiento_bomba,
+                                                              crecimiento_bomba, depreciacion_bomba)
+        economica = reemplazo.vida_economica(costo_bomba, mantenimiento, rescate, tmar)
+        politica = reemplazo.politica_reemplazo(costo_bomba, mantenimiento, rescate, tmar,
+                                                int(horizonte_reemplazo))
+        vida_bomba = int(economica["vida_economica"][0])
+        anios_cambio = (np.flatnonzero(politica["reemplazos"][0]) + 1).tolist()
+        
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Vida Económica", f"{vida_bomba} años")
+        col2.metric("Costo Anual Equivalente", f"S/ {economica['costo_anual'][0]:,.2f}")
+        col3.metric("Costo Presente de la Política", f"S/ {politica['costo_presente'][0]:,.2f}")
+        
+        if anios_cambio:
+            st.info("🔄 Política óptima: reemplazar la bomba al inicio de los años "
+                    + ", ".join(str(anio) for anio in anios_cambio))
+        else:
+            st.success(f"✅ Política óptima: conservar la bomba durante los {int(horizonte_reemplazo)} años")
+        
+        costo_anual = economica["costo_anual_por_vida"][0]
+        fig_reemplazo = DataManager.get_figuras().figura("costo_anual_bomba", _figura_costo_anual, [
+            {"x": np.arange(1, costo_anual.size + 1), "y": costo_anual},
+        ])
+        st.plotly_chart(fig_reemplazo, width='stretch')
+        
+        if vida_bomba < vida_util:
+            st.caption(f"La vida económica ({vida_bomba} años) es menor que la vida útil del proyecto: "
+                       "el flujo de caja puede incluir el reemplazo periódico de la bomba.")
+            if st.button("🔧 Reemplazar la bomba cada vida económica en el flujo de caja", key="reemplazo_aplicar"):
+                DataManager.set_value("costo_reemplazo", float(costo_bomba))
+                DataManager.set_value("anios_reemplazo", vida_bomba)
+                st.rerun()
+        
+        # Tiempos del recálculo incremental
+        with st.expander("⏱️ Tiempos de cálculo por indicador"):
+            st.markdown("Solo se recalculan los indicadores que dependen de los datos modificados; "
+                        "por ejemplo, la TIR no se recalcula al cambiar la TMAR.")
+            df_tiempos = pd.DataFrame(grafo.tiempos()).rename(columns={
+                'nodo': 'Indicador', 'calculos': 'Cálculos', 'reutilizados': 'Reutilizados',
+                'ultimo_ms': 'Último (ms)', 'total_ms': 'Total (ms)', 'vigente': 'Vigente'
+            })
+            st.dataframe(df_tiempos.style.format({'Último (ms)': '{:.3f}', 'Total (ms)': '{:.3f}'}),
+                         width='stretch', hide_index=True)
@@ -0,0 +1,227 @@
+"""
+Página ⚖️ Análisis Multicriterio: Comparación de alternativas por suma ponderada, TOPSIS o AHP.
+"""
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
+
+import multicriterio
+from data_manager import DataManager
+
+CRITERIOS = ["Costo Inicial", "Capacidad/Presión", "Consumo Eléctrico", "Durabilidad", "Bajo Mantenimiento"]
+PESOS_INICIALES = [0.30, 0.25, 0.20, 0.15, 0.10]
+
+# Calificaciones de 1 a 10 (10 = mejor en el criterio)
+ALTERNATIVAS_INICIALES = pd.DataFrame(
+    [["Opción A", 9, 7, 9, 8, 9], ["Opción B", 7, 10, 8, 10, 7]],
+    columns=["Alternativa"] + CRITERIOS,
+)
+
+# Alternativas que se dibujan en el radar
+MAXIMO_RADAR = 8
+
+CATEGORIAS_RADAR = ['Costo', 'Capacidad', 'Consumo', 'Durabilidad', 'Mantenimiento']
+
+
+def _figura_radar(n_alternativas, titulo):
+    fig = go.Figure()
+    for _ in range(n_alternativas):
+        fig.add_trace(go.Scatterpolar(theta=CATEGORIAS_RADAR + CATEGORIAS_RADAR[:1], fill='toself'))
+    fig.update_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[0, 10])),
+        showlegend=True,
+        height=500,
+        title=titulo
+    )
+    return fig
+
+
+def _figura_estabilidad(n_muestras):
+    fig = go.Figure()
+    fig.add_trace(go.Bar(texttemplate='%{y:.1f}%', textposition='auto', marker_color='teal'))
+    fig.update_layout(
+        title=f"Frecuencia como ganadora ({n_muestras:,} vectores de pesos)",
+        xaxis_title="Alternativa",
+        yaxis_title="Gana (%)",
+        height=400
+    )
+    return fig
+
+
+def render():
+    """Dibuja la página ⚖️ Análisis Multicriterio"""
+    st.header("⚖️ Análisis Multicriterio - Comparación de Alternativas")
+    st.markdown("Compara diferentes opciones de tanques y bombas considerando múltiples atributos")
+
+    st.subheader("🎯 Definición de Criterios y Pesos")
+
+    col1, col2 = st.columns([1, 2])
+
+    with col1:
+        st.markdown("#### Asigna pesos a cada criterio")
+        pesos = np.array([
+            st.slider(criterio, 0.0, 1.0, peso, 0.05, key=f"peso_{i}")
+            for i, (criterio, peso) in enumerate(zip(CRITERIOS, PESOS_INICIALES))
+        ])
+
+        suma_pesos = pesos.sum()
+
+        if abs(suma_pesos - 1.0) > 0.01:
+            st.error(f"⚠️ La suma de pesos debe ser 1.0 (actual: {suma_pesos:.2f})")
+        else:
+            st.success(f"✅ Suma de pesos: {suma_pesos:.2f}")
+
+    with col2:
+        st.markdown("#### Descripción de Alternativas")
+        st.info("""
+        **Opción A: Sistema Económico**
+        - Tanque plástico 1,100 L
+        - Bomba pequeña ½ HP
+        - Menor costo inicial
+        - Capacidad estándar
+
+        **Opción B: Sistema Premium**
+        - Tanque reforzado 1,500 L
+        - Bomba potente ¾ HP
+        - Mayor inversión
+        - Mayor capacidad y durabilidad
+
+        Agrega filas a la tabla para comparar más alternativas del catálogo.
+        """)
+
+    st.divider()
+
+    st.subheader("📊 Evaluación de Alternativas")
+    st.markdown("Califica cada alternativa del 1 al 10 para cada criterio (10 = mejor)")
+
+    alternativas = st.data_editor(
+        ALTERNATIVAS_INICIALES,
+        num_rows="dynamic",
+        width='stretch',
+        hide_index=True,
+        column_config={
+            criterio: st.column_config.NumberColumn(criterio, min_value=1, max_value=10, step=1, required=True)
+            for criterio in CRITERIOS
+        },
+        key="alternativas_multicriterio",
+    ).dropna(subset=CRITERIOS)
+
+    metodo = st.radio("Método de evaluación", multicriterio.METODOS, horizontal=True, key="metodo_multicriterio")
+
+    if metodo == "AHP":
+        with st.expander("🔢 Comparaciones por pares (AHP)", expanded=False):
+            st.caption("Importancia del criterio de la fila sobre el de la columna (escala de Saaty 1/9 a 9). "
+                       "Solo se usa el triángulo superior; por defecto refleja los pesos de los deslizadores.")
+            comparaciones = st.data_editor(
+                pd.DataFrame(multicriterio.comparaciones_desde_pesos(np.maximum(pesos, 0.01)),
+                             index=CRITERIOS, columns=CRITERIOS).round(2),
+                width='stretch',
+                key="comparaciones_ahp",
+            )
+        pesos_ahp, razon_consistencia = multicriterio.pesos_ahp(comparaciones.to_numpy())
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Razón de Consistencia", f"{razon_consistencia:.3f}")
+        with col2:
+            if razon_consistencia <= 0.10:
+                st.success("✅ Comparaciones consistentes (RC ≤ 0.10)")
+            else:
+                st.warning("⚠️ Comparaciones inconsistentes (RC > 0.10): revisa la matriz")
+        pesos_evaluacion = pesos_ahp
+    else:
+        pesos_evaluacion = pesos
+
+    if len(alternativas) == 0:
+        st.warning("⚠️ Agrega al menos una alternativa")
+    elif abs(suma_pesos - 1.0) <= 0.01:
+        matriz = alternativas[CRITERIOS].to_numpy(dtype=float)
+        nombres = [nombre if isinstance(nombre, str) and nombre else f"Alternativa {i + 1}"
+                   for i, nombre in enumerate(alternativas["Alternativa"])]
+        formato = '{:.2f}' if metodo == "Suma ponderada" else '{:.3f}'
+        puntajes = multicriterio.puntajes(matriz, pesos_evaluacion, metodo=metodo)
+        posiciones = multicriterio.ranking(puntajes)
+        orden = np.argsort(posiciones)
+
+        st.divider()
+
+        st.subheader("🏆 Resultados del Análisis Multicriterio")
+
+        ganador = orden[0]
+        col1, col2, col3 = st.columns([1, 1, 1])
+
+        with col1:
+            st.metric(f"Puntuación {nombres[ganador]}", formato.format(puntajes[ganador]))
+
+        with col2:
+            st.metric("Alternativas evaluadas", f"{len(nombres)}")
+
+        with col3:
+            if len(nombres) > 1 and puntajes[ganador] == puntajes[orden[1]]:
+                st.info("🤝 **Empate**")
+            else:
+                st.success(f"🏆 **Ganador: {nombres[ganador]}**")
+                if len(nombres) > 1:
+                    st.metric("Ventaja sobre la segunda", "+" + formato.format(puntajes[ganador] - puntajes[orden[1]]))
+
+        # Tabla detallada: contribución ponderada de cada criterio
+        st.subheader("📋 Tabla de Evaluación Detallada")
+
+        df_multi = pd.DataFrame(matriz * pesos_evaluacion, index=nombres, columns=CRITERIOS)
+        df_multi.insert(0, 'Posición', posiciones)
+        df_multi['Puntaje'] = puntajes
+        df_multi = df_multi.iloc[orden]
+        df_multi.index.name = 'Alternativa'
+
+        st.caption("Calificación x peso por criterio" + ("" if metodo == "Suma ponderada" else
+                   f"; el puntaje es el de {metodo}"))
+        st.dataframe(df_multi.style.format({**{c: '{:.2f}' for c in CRITERIOS}, 'Puntaje': formato}),
+                     width='stretch')
+
+        # Gráfico radar
+        st.subheader("📡 Gráfico de Radar - Comparación Visual")
+
+        cache_figuras = DataManager.get_figuras()
+        en_radar = orden[:MAXIMO_RADAR]
+        titulo_radar = "Comparación de Atributos" + (f" (mejores {MAXIMO_RADAR})"
+                                                     if len(nombres) > MAXIMO_RADAR else "")
+        fig = cache_figuras.figura(
+            "radar", lambda: _figura_radar(len(en_radar), titulo_radar),
+            [{"r": np.append(matriz[indice], matriz[indice, 0]), "name": nombres[indice]} for indice in en_radar],
+            clave=(len(en_radar), titulo_radar),
+        )
+
+        st.plotly_chart(fig, width='stretch')
+
+        # Estabilidad del ranking ante cambios de pesos
+        st.subheader("🎲 Estabilidad del Ranking")
+        st.markdown("Muestrea vectores de pesos alrededor de los actuales y cuenta cuántas veces gana cada alternativa")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            n_muestras = st.select_slider("Vectores de pesos", options=[1_000, 5_000, 20_000], value=5_000,
+                                          key="mcda_muestras")
+        with col2:
+            concentracion = st.slider("Concentración alrededor de los pesos actuales", 5, 200, 50, 5,
+                                      key="mcda_concentracion",
+                                      help="Valores bajos exploran pesos muy distintos; valores altos, pesos cercanos")
+
+        muestras = multicriterio.muestrear_pesos(n_muestras, pesos_evaluacion, concentracion, semilla=42)
+        estabilidad = multicriterio.estabilidad_ranking(matriz, muestras, metodo=metodo)
+
+        frecuencia = estabilidad["frecuencia_ganador"]
+        mostradas = np.argsort(-frecuencia, kind="stable")[:15]
+        fig_estabilidad = cache_figuras.figura(
+            "estabilidad", lambda: _figura_estabilidad(n_muestras),
+            [{"x": [nombres[i] for i in mostradas], "y": frecuencia[mostradas] * 100}],
+            clave=n_muestras,
+        )
+        st.plotly_chart(fig_estabilidad, width='stretch')
+
+        if frecuencia[ganador] < 0.75:
+            st.warning(f"⚠️ {nombres[ganador]} gana solo en el {frecuencia[ganador]*100:.1f}% de los casos: "
+                       "el resultado es sensible a los pesos elegidos")
+        else:
+            st.success(f"✅ {nombres[ganador]} gana en el {frecuencia[ganador]*100:.1f}% de los casos: "
+                       "el resultado es robusto ante cambios moderados de pesos")
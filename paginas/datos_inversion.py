@@ -0,0 +1,550 @@
+"""
+Página 💰 Datos de Inversión: Ingreso de costos, parámetros y financiamiento del proyecto.
+"""
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
+
+from data_manager import DataManager
+import catalogo
+import financiamiento
+import simulacion_energia
+from evaluacion import comparar_ofertas
+
+
+def _tabla_catalogo(nombre, archivo):
+    """Tabla del catálogo subido (se lee una vez por archivo) o la del catálogo de ejemplo"""
+    if archivo is None:
+        return catalogo.catalogo_ejemplo()[nombre]
+    clave = f"catalogo_{nombre}"
+    guardada = st.session_state.get(clave)
+    if guardada is None or guardada[0] != archivo.file_id:
+        guardada = (archivo.file_id, catalogo.cargar_tabla(archivo, catalogo.CLAVES[nombre]))
+        st.session_state[clave] = guardada
+    return guardada[1]
+
+
+def _figura_nivel():
+    fig = go.Figure()
+    fig.add_trace(go.Bar(name='Agua Bombeada (L)', marker_color='lightskyblue'))
+    fig.add_trace(go.Scatter(name='Nivel del Tanque (L)', mode='lines', line=dict(color='navy', width=2)))
+    fig.update_layout(
+        title="Nivel del Tanque y Bombeo durante la Primera Semana",
+        xaxis_title="Hora",
+        yaxis_title="Litros",
+        hovermode='x unified',
+        height=400
+    )
+    return fig
+
+
+def render():
+    """Dibuja la página 💰 Datos de Inversión"""
+    st.header("💰 Configuración de Datos de Inversión")
+    
+    st.info("ℹ️ **Los valores que ingreses aquí se guardarán automáticamente y se mantendrán al cambiar entre páginas.**")
+
+    st.subheader("🔧 Costos Iniciales")
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        costo_tanque = st.number_input(
+            "Tanque de Agua (1,100 L) - S/",
+            min_value=0.0,
+            step=50.0,
+            value=st.session_state["costo_tanque"],
+            help="Este valor se guardará automáticamente"
+        )
+        if costo_tanque != st.session_state["costo_tanque"]:
+            st.session_state["costo_tanque"] = costo_tanque
+
+    with col2:
+        costo_bomba = st.number_input(
+            "Bomba Eléctrica ½ HP - S/",
+            min_value=0.0,
+            step=50.0,
+            value=st.session_state["costo_bomba"],
+            help="Este valor se guardará automáticamente"
+        )
+        if costo_bomba != st.session_state["costo_bomba"]:
+            st.session_state["costo_bomba"] = costo_bomba
+
+    with col3:
+        costo_instalacion = st.number_input(
+            "Tuberías e Instalación - S/",
+            min_value=0.0,
+            step=50.0,
+            value=st.session_state["costo_instalacion"],
+            help="Este valor se guardará automáticamente"
+        )
+        if costo_instalacion != st.session_state["costo_instalacion"]:
+            st.session_state["costo_instalacion"] = costo_instalacion
+
+    # Actualizar inversión inicial
+    DataManager.update_inversion_inicial()
+
+    st.success(
+        f"### 💵 Inversión Inicial Total: S/ {st.session_state['inversion_inicial']:,.2f}"
+    )
+
+    st.divider()
+
+    st.subheader("📅 Parámetros del Proyecto")
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        vida_util = st.number_input(
+            "Vida Útil (años)",
+            min_value=1,
+            max_value=20,
+            value=st.session_state["vida_util"],
+            help="Este valor se guardará automáticamente"
+        )
+        if vida_util != st.session_state["vida_util"]:
+            st.session_state["vida_util"] = vida_util
+
+    with col2:
+        ahorro_anual = st.number_input(
+            "Ahorro Anual Estimado - S/",
+            min_value=0.0,
+            step=50.0,
+            value=st.session_state["ahorro_anual"],
+            help="Este valor se guardará automáticamente"
+        )
+        if ahorro_anual != st.session_state["ahorro_anual"]:
+            st.session_state["ahorro_anual"] = ahorro_anual
+
+    with col3:
+        mantenimiento_anual = st.number_input(
+            "Mantenimiento Anual - S/",
+            min_value=0.0,
+            step=10.0,
+            value=st.session_state["mantenimiento_anual"],
+            help="Este valor se guardará automáticamente"
+        )
+        if mantenimiento_anual != st.session_state["mantenimiento_anual"]:
+            st.session_state["mantenimiento_anual"] = mantenimiento_anual
+
+    with col4:
+        tmar_porcentaje = st.number_input(
+            "TMAR (%)",
+            min_value=0.0,
+            max_value=50.0,
+            step=0.5,
+            value=st.session_state["tmar_porcentaje"],
+            help="Este valor se guardará automáticamente"
+        )
+        if tmar_porcentaje != st.session_state["tmar_porcentaje"]:
+            st.session_state["tmar_porcentaje"] = tmar_porcentaje
+
+    # Actualizar TMAR
+    DataManager.update_tmar()
+
+    st.divider()
+
+    st.subheader("📈 Proyección del Flujo de Caja (Opcional)")
+    st.markdown("Con todos los valores en cero el flujo neto es el mismo cada año")
+
+    campos_reglas = [
+        ("crecimiento_ahorro", "Crecimiento Anual del Ahorro (%)", 0.5,
+         "Por ejemplo, el alza anual de la tarifa de agua"),
+        ("inflacion_costos", "Inflación de Costos (%)", 0.5,
+         "Crecimiento anual del mantenimiento y de los reemplazos"),
+        ("tasa_impuesto", "Impuesto sobre el Ahorro Neto (%)", 1.0,
+         "Se aplica sobre el ahorro menos el mantenimiento de cada año"),
+        ("costo_reemplazo", "Costo de Reemplazo - S/", 50.0,
+         "Por ejemplo, el cambio de la bomba"),
+        ("anios_reemplazo", "Reemplazo cada (años)", 1,
+         "0 = sin reemplazos; no se reemplaza en el último año"),
+        ("valor_rescate", "Valor de Rescate - S/", 50.0,
+         "Valor de venta del equipo al final de la vida útil"),
+    ]
+    columnas = st.columns(3)
+    for i, (clave, etiqueta, paso, ayuda) in enumerate(campos_reglas):
+        with columnas[i % 3]:
+            entero = isinstance(paso, int)
+            valor = st.number_input(
+                etiqueta,
+                min_value=0 if entero else 0.0,
+                step=paso,
+                value=int(st.session_state[clave]) if entero else float(st.session_state[clave]),
+                help=ayuda
+            )
+            if valor != st.session_state[clave]:
+                st.session_state[clave] = valor
+
+    st.divider()
+
+    st.subheader("🏦 Financiamiento (Opcional)")
+    financiado = st.checkbox(
+        "¿El proyecto será financiado?",
+        value=st.session_state["financiado"],
+        help="Este valor se guardará automáticamente"
+    )
+    if financiado != st.session_state["financiado"]:
+        st.session_state["financiado"] = financiado
+
+    if financiado:
+        inversion = st.session_state["inversion_inicial"]
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            porcentaje_financiado = st.number_input(
+                "Porcentaje Financiado (%)",
+                min_value=0.0,
+                max_value=100.0,
+                step=5.0,
+                value=float(st.session_state["porcentaje_financiado"]),
+                help="Parte de la inversión inicial que cubre el préstamo; el resto es aporte propio"
+            )
+            if porcentaje_financiado != st.session_state["porcentaje_financiado"]:
+                st.session_state["porcentaje_financiado"] = porcentaje_financiado
+
+        principal = inversion * porcentaje_financiado / 100
+        col2.metric("Monto Financiado", f"S/ {principal:,.2f}")
+        col3.metric("Aporte Propio", f"S/ {inversion - principal:,.2f}")
+
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            tasa_nominal = st.number_input(
+                "Tasa Nominal Anual (%)",
+                min_value=0.0,
+                max_value=100.0,
+                step=0.5,
+                value=float(st.session_state["tasa_nominal"]),
+                help="Este valor se guardará automáticamente"
+            )
+            if tasa_nominal != st.session_state["tasa_nominal"]:
+                st.session_state["tasa_nominal"] = tasa_nominal
+
+        with col2:
+            periodos_capitalizacion = st.number_input(
+                "Capitalizaciones por Año",
+                min_value=1,
+                max_value=365,
+                step=1,
+                value=int(st.session_state["periodos_capitalizacion"]),
+                help="Mensual = 12, trimestral = 4, anual = 1"
+            )
+            if periodos_capitalizacion != st.session_state["periodos_capitalizacion"]:
+                st.session_state["periodos_capitalizacion"] = periodos_capitalizacion
+
+        with col3:
+            plazo_meses = st.number_input(
+                "Plazo (meses)",
+                min_value=1,
+                max_value=360,
+                step=6,
+                value=int(st.session_state["plazo_meses"]),
+                help="Este valor se guardará automáticamente"
+            )
+            if plazo_meses != st.session_state["plazo_meses"]:
+                st.session_state["plazo_meses"] = plazo_meses
+
+        with col4:
+            sistema = st.selectbox(
+                "Sistema de Amortización",
+                financiamiento.SISTEMAS,
+                index=financiamiento.SISTEMAS.index(st.session_state["sistema_amortizacion"]),
+                help="Francés: cuota fija | Alemán: amortización fija | Americano: capital al final"
+            )
+            if sistema != st.session_state["sistema_amortizacion"]:
+                st.session_state["sistema_amortizacion"] = sistema
+
+        tasa = financiamiento.tasa_mensual(tasa_nominal / 100, periodos_capitalizacion)
+        tabla = financiamiento.tabla_amortizacion(principal, tasa, plazo_meses, sistema)
+        resumen = financiamiento.resumen_prestamos(
+            principal, tasa_nominal / 100, periodos_capitalizacion, plazo_meses, sistema
+        )
+
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Tasa Efectiva Anual (TEA)", f"{resumen['tasa_efectiva_anual'][0]*100:.2f}%")
+        col2.metric("Cuota del Primer Mes", f"S/ {resumen['cuota_inicial'][0]:,.2f}")
+        col3.metric("Intereses Totales", f"S/ {resumen['total_intereses'][0]:,.2f}")
+        st.caption("El VAN y la TIR se calculan sobre el aporte propio y los flujos después del "
+                   "servicio de la deuda; si se financia toda la inversión, la TIR y el payback no aplican.")
+
+        with st.expander("📅 Cronograma de Pagos"):
+            df_cronograma = pd.DataFrame({
+                "Mes": range(1, int(plazo_meses) + 1),
+                "Cuota": tabla["cuota"][0],
+                "Interés": tabla["interes"][0],
+                "Amortización": tabla["amortizacion"][0],
+                "Saldo": tabla["saldo"][0],
+            })
+            st.dataframe(df_cronograma.style.format({
+                "Cuota": "S/ {:,.2f}",
+                "Interés": "S/ {:,.2f}",
+                "Amortización": "S/ {:,.2f}",
+                "Saldo": "S/ {:,.2f}"
+            }), width='stretch', hide_index=True)
+
+        with st.expander("🏦 Comparar Ofertas de Préstamo"):
+            st.markdown("Edita o agrega filas para comparar varias ofertas a la vez")
+            ofertas = st.data_editor(
+                pd.DataFrame({
+                    "tasa_nominal": [tasa_nominal, tasa_nominal + 2.0, tasa_nominal - 1.0],
+                    "periodos_capitalizacion": [periodos_capitalizacion] * 3,
+                    "plazo_meses": [plazo_meses, plazo_meses * 2, plazo_meses],
+                    "sistema_amortizacion": [sistema, sistema, "Alemán"],
+                }),
+                column_config={
+                    "tasa_nominal": st.column_config.NumberColumn("Tasa Nominal (%)", min_value=0.0),
+                    "periodos_capitalizacion": st.column_config.NumberColumn("Capitalizaciones", min_value=1),
+                    "plazo_meses": st.column_config.NumberColumn("Plazo (meses)", min_value=1),
+                    "sistema_amortizacion": st.column_config.SelectboxColumn(
+                        "Sistema", options=financiamiento.SISTEMAS, required=True
+                    ),
+                },
+                num_rows="dynamic",
+                hide_index=True,
+                key="ofertas_prestamo",
+            ).dropna()
+
+            if len(ofertas):
+                comparacion = comparar_ofertas(DataManager.get_all_data(), ofertas)
+                df_comparacion = pd.DataFrame({
+                    "Oferta": range(1, len(ofertas) + 1),
+                    "Sistema": ofertas["sistema_amortizacion"].to_numpy(),
+                    "TEA": comparacion["tasa_efectiva_anual"].to_numpy() * 100,
+                    "Primera Cuota": comparacion["cuota_inicial"].to_numpy(),
+                    "Intereses Totales": comparacion["total_intereses"].to_numpy(),
+                    "VAN": comparacion["van"].to_numpy(),
+                    "TIR": comparacion["tir"].to_numpy() * 100,
+                })
+                st.dataframe(df_comparacion.style.format({
+                    "TEA": "{:.2f}%",
+                    "Primera Cuota": "S/ {:,.2f}",
+                    "Intereses Totales": "S/ {:,.2f}",
+                    "VAN": "S/ {:,.2f}",
+                    "TIR": "{:.2f}%"
+                }, na_rep="N/A"), width='stretch', hide_index=True)
+
+    st.divider()
+
+    with st.expander("🛒 Selección desde el Catálogo de Equipos"):
+        st.markdown("Evalúa todas las combinaciones factibles de tanque, bomba e instalación con el ahorro, "
+                    "mantenimiento, vida útil y TMAR del proyecto, y elige una de las mejores")
+        st.caption("Sube tus propias tablas en CSV o JSON (columnas `nombre`, `costo`, `capacidad_litros` o "
+                   "`caudal_lpm`, y opcionalmente `mantenimiento_anual` adicional y `vida_util`); "
+                   "sin archivo se usa el catálogo de ejemplo.")
+        col1, col2, col3 = st.columns(3)
+        archivos = {}
+        for col, nombre, titulo in ((col1, "tanques", "Tanques"), (col2, "bombas", "Bombas"),
+                                    (col3, "instalaciones", "Instalaciones")):
+            with col:
+                archivos[nombre] = st.file_uploader(titulo, type=["csv", "json"], key=f"archivo_{nombre}")
+        try:
+            tablas = {nombre: _tabla_catalogo(nombre, archivo) for nombre, archivo in archivos.items()}
+        except ValueError as error:
+            st.error(f"❌ {error}")
+            tablas = None
+
+        if tablas is not None:
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                capacidad_minima = st.number_input("Capacidad mínima (L)", min_value=0.0, value=1100.0,
+                                                   step=100.0, key="catalogo_capacidad")
+            with col2:
+                caudal_minimo = st.number_input("Caudal mínimo (L/min)", min_value=0.0, value=30.0,
+                                                step=5.0, key="catalogo_caudal")
+            with col3:
+                criterio = st.radio("Ordenar por", list(catalogo.CRITERIOS), horizontal=True,
+                                    format_func=catalogo.CRITERIOS.get, key="catalogo_criterio")
+            with col4:
+                k = st.number_input("Mejores combinaciones", min_value=1, max_value=50, value=5,
+                                    key="catalogo_k")
+
+            seleccion = catalogo.mejores_combinaciones(
+                tablas["tanques"], tablas["bombas"], tablas["instalaciones"], DataManager.get_all_data(),
+                k=int(k), criterio=criterio, capacidad_minima=capacidad_minima, caudal_minimo=caudal_minimo,
+            )
+            mejores = seleccion["mejores"]
+            if mejores.empty:
+                st.warning("⚠️ Ninguna combinación del catálogo cumple la capacidad y el caudal mínimos")
+            else:
+                st.caption(f"{seleccion['factibles']:,} combinaciones factibles; "
+                           f"{seleccion['evaluadas']:,} evaluadas tras descartar las dominadas")
+                st.dataframe(pd.DataFrame({
+                    "Tanque": mejores["tanque"],
+                    "Bomba": mejores["bomba"],
+                    "Instalación": mejores["instalacion"],
+                    "Inversión": mejores["inversion_inicial"],
+                    "Vida Útil": mejores["vida_util"],
+                    "VAN": mejores["van"],
+                    "VAE": mejores["vae"],
+                    "TIR": mejores["tir"] * 100,
+                }).style.format({
+                    "Inversión": "S/ {:,.2f}",
+                    "Vida Útil": "{:.0f} años",
+                    "VAN": "S/ {:,.2f}",
+                    "VAE": "S/ {:,.2f}",
+                    "TIR": "{:.2f}%"
+                }, na_rep="N/A"), width='stretch')
+
+                col1, col2 = st.columns([3, 1])
+                with col1:
+                    fila = st.selectbox("Combinación", mejores.index,
+                                        format_func=lambda j: f"{j}: {mejores.at[j, 'tanque']} + "
+                                                              f"{mejores.at[j, 'bomba']} + {mejores.at[j, 'instalacion']}",
+                                        key="catalogo_fila")
+                with col2:
+                    if st.button("✅ Usar combinación", key="catalogo_usar"):
+                        for costo in ("costo_tanque", "costo_bomba", "costo_instalacion"):
+                            DataManager.set_value(costo, float(mejores.at[fila, costo]))
+                        st.rerun()
+
+    with st.expander("⚡ Simulación Horaria de Demanda y Consumo Eléctrico"):
+        st.markdown("Simula el nivel del tanque y el funcionamiento de la bomba hora por hora durante un año "
+                    "para estimar el ahorro anual: el agua que el tanque entrega fuera de las horas de "
+                    "suministro de la red, menos el costo de la energía de la bomba")
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            consumo_diario = st.number_input("Consumo diario (L)", min_value=0.0, value=600.0, step=50.0,
+                                             key="energia_consumo")
+            variacion = st.slider("Variación estacional (%)", 0, 50, 0, key="energia_estacional") / 100
+        with col2:
+            capacidad = st.number_input("Capacidad del tanque (L)", min_value=1.0, value=1100.0, step=100.0,
+                                        key="energia_capacidad")
+            suministro = st.slider("Horas con agua en la red", 0, 24, (6, 14), key="energia_suministro")
+        with col3:
+            caudal = st.number_input("Caudal de la bomba (L/min)", min_value=1.0, value=35.0, step=5.0,
+                                     key="energia_caudal")
+            potencia = st.number_input("Potencia de la bomba (HP)", min_value=0.1, value=0.5, step=0.25,
+                                       key="energia_potencia")
+        with col4:
+            eficiencia = st.slider("Eficiencia del motor (%)", 30, 100, 80, key="energia_eficiencia") / 100
+            valor_agua = st.number_input("Valor del agua no disponible (S/ por m³)", min_value=0.0, value=6.0,
+                                         step=1.0, key="energia_valor_agua",
+                                         help="Costo de conseguir el agua de otra forma (cisterna, bidones, "
+                                              "tiempo perdido) cuando la red no tiene suministro")
+
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            precio_base = st.number_input("Tarifa fuera de punta (S/ por kWh)", min_value=0.0, value=0.72,
+                                          step=0.01, key="energia_tarifa_base")
+        with col2:
+            precio_punta = st.number_input("Tarifa en horas punta (S/ por kWh)", min_value=0.0, value=0.95,
+                                           step=0.01, key="energia_tarifa_punta")
+        with col3:
+            punta = st.slider("Horas punta", 0, 24, (18, 23), key="energia_punta")
+        with col4:
+            fuera_de_punta = st.checkbox("Bombear solo fuera de punta", key="energia_fuera_punta")
+
+        horas_punta = simulacion_energia.mascara_horas(*punta)
+        tarifa = np.where(horas_punta, precio_punta, precio_base)
+        con_red = simulacion_energia.mascara_horas(*suministro)
+        permitido = simulacion_energia.horario(~horas_punta) if fuera_de_punta else True
+
+        # La configuración ingresada y los tanques del catálogo se simulan en un solo lote
+        tanques = tablas["tanques"] if tablas is not None else catalogo.catalogo_ejemplo()["tanques"]
+        capacidades = np.concatenate([[capacidad], tanques["capacidad_litros"]])
+        simulacion = simulacion_energia.simular(
+            simulacion_energia.perfil_demanda(consumo_diario, variacion_estacional=variacion),
+            capacidades, caudal, potencia, simulacion_energia.horario(tarifa),
+            suministro=simulacion_energia.horario(con_red),
+            bombeo_permitido=permitido,
+            eficiencia=eficiencia, valor_agua=valor_agua,
+            mantenimiento_anual=st.session_state["mantenimiento_anual"], detalle=True,
+        )
+        ahorro_simulado = float(simulacion["ahorro_anual"][0])
+        no_atendida = simulacion["demanda_no_atendida"] / np.maximum(simulacion["demanda"], 1e-9)
+
+        col1, col2, col3, col4, col5 = st.columns(5)
+        col1.metric("Energía", f"{simulacion['energia_kwh'][0]:,.1f} kWh/año")
+        col2.metric("Costo de Energía", f"S/ {simulacion['costo_energia'][0]:,.2f}")
+        col3.metric("Horas de Bombeo", f"{simulacion['horas_bombeo'][0]:,.0f} h/año")
+        col4.metric("Demanda no Atendida", f"{no_atendida[0]:.1%}")
+        col5.metric("Ahorro Anual Simulado", f"S/ {ahorro_simulado:,.2f}")
+
+        semana = slice(0, 7 * simulacion_energia.HORAS_DIA)
+        horas = np.arange(semana.stop)
+        fig_nivel = DataManager.get_figuras().figura("nivel_tanque", _figura_nivel, [
+            {"x": horas, "y": simulacion["bombeo"][0, semana] * caudal * 60},
+            {"x": horas, "y": simulacion["nivel"][0, semana]},
+        ])
+        st.plotly_chart(fig_nivel, width='stretch')
+
+        datos_proyecto = DataManager.get_all_data()
+        inversion = tanques["costo"] + datos_proyecto["costo_bomba"] + datos_proyecto["costo_instalacion"]
+        filas = slice(1, None)
+        indicadores = simulacion_energia.evaluar_configuraciones(
+            {"ahorro_anual": simulacion["ahorro_anual"][filas]}, datos_proyecto, inversion)
+        st.markdown("**Tanques del catálogo con la misma bomba y demanda**")
+        st.dataframe(pd.DataFrame({
+            "Tanque": tanques["nombre"],
+            "Capacidad": tanques["capacidad_litros"],
+            "Demanda no Atendida": no_atendida[filas],
+            "Costo de Energía": simulacion["costo_energia"][filas],
+            "Ahorro Anual": simulacion["ahorro_anual"][filas],
+            "VAN": indicadores["van"],
+        }).style.format({
+            "Capacidad": "{:,.0f} L",
+            "Demanda no Atendida": "{:.1%}",
+            "Costo de Energía": "S/ {:,.2f}",
+            "Ahorro Anual": "S/ {:,.2f}",
+            "VAN": "S/ {:,.2f}"
+        }, na_rep="N/A"), width='stretch', hide_index=True)
+
+        if st.button("✅ Usar el ahorro simulado como Ahorro Anual", key="energia_usar"):
+            DataManager.set_value("ahorro_anual", round(max(ahorro_simulado, 0.0), 2))
+            st.rerun()
+
+    st.divider()
+    
+    # Validación de datos
+    errores = DataManager.validate_data()
+    if errores:
+        st.warning("⚠️ **Advertencias:**")
+        for error in errores:
+            st.warning(f"• {error}")
+
+    st.divider()
+
+    st.subheader("📊 Resumen de Datos Ingresados")
+    
+    # Obtener datos actuales
+    datos = DataManager.get_all_data()
+    
+    df_resumen = pd.DataFrame({
+        "Concepto": [
+            "Tanque de Agua",
+            "Bomba Eléctrica",
+            "Instalación",
+            "TOTAL INVERSIÓN",
+            "Ahorro Anual",
+            "Mantenimiento Anual",
+            "Flujo Neto Anual",
+            "Vida Útil",
+            "TMAR"
+        ],
+        "Valor": [
+            f"S/ {datos['costo_tanque']:,.2f}",
+            f"S/ {datos['costo_bomba']:,.2f}",
+            f"S/ {datos['costo_instalacion']:,.2f}",
+            f"S/ {datos['inversion_inicial']:,.2f}",
+            f"S/ {datos['ahorro_anual']:,.2f}",
+            f"S/ {datos['mantenimiento_anual']:,.2f}",
+            f"S/ {datos['ahorro_anual'] - datos['mantenimiento_anual']:,.2f}",
+            f"{datos['vida_util']} años",
+            f"{datos['tmar']*100:.2f}%"
+        ]
+    })
+
+    st.dataframe(df_resumen, width='stretch', hide_index=True)
+    
+    # Hacer backup cada vez que se muestra esta página
+    DataManager.backup_data()
+    
+    # Botón para resetear valores
+    st.divider()
+    col1, col2, col3 = st.columns([1, 1, 2])
+    with col1:
+        if st.button("🔄 Resetear a valores por defecto", type="secondary"):
+            DataManager.reset_to_defaults()
+            st.rerun()
+    with col2:
+        st.success("✅ Todos los cambios se guardan automáticamente")
@@ -0,0 +1,255 @@
+"""
+Página 📖 Glosario: Glosario de conceptos de ingeniería económica.
+"""
+
+import streamlit as st
+
+
+def render():
+    """Dibuja la página 📖 Glosario"""
+    st.header("📖 Glosario de Conceptos de Ingeniería Económica")
+    st.markdown("Conceptos fundamentales aplicados en este sistema de evaluación")
+    
+    # Organizar en tabs
+    tab1, tab2, tab3 = st.tabs(["📊 Indicadores Principales", "💹 Tasas y Análisis", "🎯 Métodos de Evaluación"])
+    
+    with tab1:
+        st.subheader("Indicadores Financieros Principales")
+        
+        st.markdown("---")
+        st.markdown("### 💵 VAN - Valor Actual Neto (Valor Presente Neto)")
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            st.markdown("""
+            **Definición:** Mide la rentabilidad de un proyecto en términos de dinero actual, 
+            descontando todos los flujos futuros a valor presente.
+            
+            **Fórmula:**
+            
+            $$ VAN = -I_0 + \\sum_{t=1}^{n} \\frac{F_t}{(1+i)^t} $$
+            
+            Donde:
+            - $I_0$ = Inversión inicial
+            - $F_t$ = Flujo de caja en el período t
+            - $i$ = Tasa de descuento (TMAR)
+            - $n$ = Número de períodos
+            
+            **Criterio de decisión:**
+            - VAN > 0 → Proyecto viable (genera valor)
+            - VAN = 0 → Indiferente
+            - VAN < 0 → Proyecto no viable (destruye valor)
+            """)
+        with col2:
+            st.success("**Ventajas:**")
+            st.write("✅ Considera valor del dinero en el tiempo")
+            st.write("✅ Fácil interpretación")
+            st.write("✅ Permite sumar proyectos")
+        
+        st.markdown("---")
+        st.markdown("### 📈 TIR - Tasa Interna de Retorno")
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            st.markdown("""
+            **Definición:** Es la tasa de descuento que hace que el VAN sea igual a cero. 
+            Representa la rentabilidad porcentual del proyecto.
+            
+            **Fórmula:**
+            
+            $$ 0 = -I_0 + \\sum_{t=1}^{n} \\frac{F_t}{(1+TIR)^t} $$
+            
+            **Criterio de decisión:**
+            - TIR > TMAR → Proyecto rentable
+            - TIR = TMAR → Indiferente
+            - TIR < TMAR → Proyecto no rentable
+            
+            **Interpretación:** Si TIR = 15%, significa que el proyecto genera un rendimiento 
+            del 15% anual sobre la inversión.
+            """)
+        with col2:
+            st.info("**Aplicación:**")
+            st.write("📊 Mide rentabilidad")
+            st.write("📊 Compara con TMAR")
+            st.write("📊 Independiente de tasa externa")
+        
+        st.markdown("---")
+        st.markdown("### 💰 VAE - Valor Anual Equivalente")
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            st.markdown("""
+            **Definición:** Convierte el VAN en una anualidad uniforme equivalente durante 
+            la vida del proyecto.
+            
+            **Fórmula:**
+            
+            $$ VAE = VAN \\times \\frac{i(1+i)^n}{(1+i)^n - 1} $$
+            
+            **Utilidad:** Permite comparar proyectos con diferentes vidas útiles al expresar 
+            el valor en términos anuales constantes.
+            """)
+        with col2:
+            st.success("**Uso:**")
+            st.write("✅ Comparar proyectos")
+            st.write("✅ Vidas útiles diferentes")
+            st.write("✅ Presupuestos anuales")
+    
+    with tab2:
+        st.subheader("Tasas de Interés y Análisis de Riesgo")
+        
+        st.markdown("---")
+        st.markdown("### 🏦 Tasas de Interés: Nominal vs Efectiva")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("""
+            **Tasa Nominal Anual (TNA):**
+            
+            Es la tasa de interés anual sin considerar la capitalización de intereses.
+            
+            **Ejemplo:** TNA = 12% anual
+            """)
+        with col2:
+            st.markdown("""
+            **Tasa Efectiva Anual (TEA):**
+            
+            Considera el efecto de la capitalización de intereses en períodos menores al año.
+            
+            **Fórmula:**
+            
+            $$ TEA = \\left(1 + \\frac{TNA}{m}\\right)^m - 1 $$
+            
+            Donde m = número de capitalizaciones por año
+            """)
+        
+        st.info("""
+        **Ejemplo práctico:**
+        - TNA = 12% anual con capitalización mensual
+        - TEA = (1 + 0.12/12)^12 - 1 = 12.68%
+        - La TEA es mayor porque considera el interés compuesto
+        """)
+        
+        st.markdown("---")
+        st.markdown("### 🎯 TMAR - Tasa Mínima Aceptable de Retorno")
+        st.markdown("""
+        **Definición:** Es la tasa mínima de ganancia que un inversionista está dispuesto 
+        a aceptar para realizar un proyecto.
+        
+        **Componentes:**
+        
+        $$ TMAR = i_f + f + i_f \\times f $$
+        
+        Donde:
+        - $i_f$ = Inflación esperada
+        - $f$ = Premio al riesgo
+        
+        **Factores que la determinan:**
+        - Tasa de inflación
+        - Riesgo del proyecto
+        - Costo de oportunidad
+        - Tasa de interés bancaria
+        - Rendimiento mínimo esperado
+        
+        **Uso en este proyecto:** Se utiliza como tasa de descuento para calcular el VAN 
+        y como referencia para comparar con la TIR.
+        """)
+        
+        st.markdown("---")
+        st.markdown("### 📉 Análisis de Sensibilidad")
+        st.markdown("""
+        **Definición:** Técnica que permite evaluar cómo cambian los resultados del proyecto 
+        ante variaciones en los parámetros clave.
+        
+        **Tipos de escenarios:**
+        
+        1. **Optimista:** Aumentan los beneficios o disminuyen los costos
+        2. **Probable:** Valores esperados o más probables
+        3. **Pesimista:** Disminuyen beneficios o aumentan costos
+        
+        **Objetivo:** Identificar qué variables tienen mayor impacto en la rentabilidad 
+        y evaluar el riesgo del proyecto.
+        """)
+    
+    with tab3:
+        st.subheader("Métodos de Evaluación y Comparación")
+        
+        st.markdown("---")
+        st.markdown("### ⚖️ Análisis Beneficio/Costo (B/C)")
+        st.markdown("""
+        **Definición:** Relación entre el valor presente de los beneficios y el valor 
+        presente de los costos.
+        
+        **Fórmula:**
+        
+        $$ B/C = \\frac{\\sum_{t=1}^{n} \\frac{B_t}{(1+i)^t}}{\\sum_{t=1}^{n} \\frac{C_t}{(1+i)^t}} $$
+        
+        **Criterio de decisión:**
+        - B/C > 1 → Beneficios superan costos (Proyecto conveniente)
+        - B/C = 1 → Beneficios igualan costos (Indiferente)
+        - B/C < 1 → Costos superan beneficios (No conveniente)
+        
+        **Interpretación:** Si B/C = 1.5, por cada sol invertido se obtienen S/ 1.50 
+        en beneficios.
+        """)
+        
+        st.markdown("---")
+        st.markdown("### ⏱️ Período de Recuperación (Payback)")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("""
+            **Payback Simple:**
+            
+            Tiempo necesario para recuperar la inversión inicial sin considerar el 
+            valor del dinero en el tiempo.
+            
+            **Cálculo:** Se acumulan los flujos hasta igualar la inversión inicial.
+            """)
+        with col2:
+            st.markdown("""
+            **Payback Descontado:**
+            
+            Tiempo necesario para recuperar la inversión considerando el valor del 
+            dinero en el tiempo (flujos descontados).
+            
+            **Ventaja:** Más realista que el payback simple.
+            """)
+        
+        st.warning("""
+        **Limitaciones del Payback:**
+        - No considera flujos después del período de recuperación
+        - No mide rentabilidad, solo liquidez
+        - Debe usarse como complemento, no como único criterio
+        """)
+        
+        st.markdown("---")
+        st.markdown("### 🏆 Análisis Multicriterio (Método de Pesos Ponderados)")
+        st.markdown("""
+        **Definición:** Técnica de decisión que permite comparar alternativas considerando 
+        múltiples criterios (no solo económicos).
+        
+        **Proceso:**
+        
+        1. **Identificar criterios:** Costo, calidad, durabilidad, etc.
+        2. **Asignar pesos:** Según importancia de cada criterio (suma = 1.0)
+        3. **Calificar alternativas:** Puntuar cada opción en cada criterio
+        4. **Calcular puntaje ponderado:**
+        
+        $$ P = \\sum_{i=1}^{n} w_i \\times c_i $$
+        
+        Donde:
+        - $P$ = Puntaje total
+        - $w_i$ = Peso del criterio i
+        - $c_i$ = Calificación en el criterio i
+        
+        5. **Seleccionar:** La alternativa con mayor puntaje
+        
+        **Ventajas:**
+        - Considera aspectos cualitativos y cuantitativos
+        - Estructura la toma de decisiones
+        - Permite involucrar múltiples stakeholders
+        """)
+    
+    st.divider()
+    st.info("""
+    💡 **Nota importante:** Todos estos conceptos están implementados en las diferentes 
+    secciones de esta aplicación. Puedes verlos en acción ingresando tus datos y 
+    navegando por las opciones del menú.
+    """)
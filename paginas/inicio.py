@@ -0,0 +1,91 @@
+"""
+Página 📝 Inicio: Presentación del sistema y datos base de ejemplo.
+"""
+
+import streamlit as st
+
+
+def render():
+    """Dibuja la página 📝 Inicio"""
+    st.header("💧 Bienvenido al Sistema de Evaluación Económica")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.markdown("""
+        ### 📌 ¿Qué es este sistema?
+        
+        Este sistema es una **herramienta web interactiva** diseñada para evaluar la viabilidad 
+        económica de proyectos de inversión, específicamente orientada a la instalación de 
+        sistemas de agua domésticos (tanque de agua con bomba eléctrica).
+        
+        ### 👥 ¿A quién está dirigido?
+        
+        - **Estudiantes** de Ingeniería Económica, Administración y carreras afines
+        - **Propietarios de viviendas** que enfrentan problemas de presión o cortes de agua
+        - **Profesionales** que requieren evaluar proyectos de inversión pequeños
+        - **Inversionistas** que buscan analizar la rentabilidad de mejoras en inmuebles
+        - **Consultores** que necesitan herramientas rápidas de evaluación económica
+        
+        ### 🎯 ¿Para qué se usa?
+        
+        **Casos de uso principales:**
+        
+        ✅ **Análisis de inversión doméstica**: Determinar si invertir en un tanque de agua es conveniente
+        
+        ✅ **Proyectos académicos**: Aplicar conceptos de ingeniería económica en casos reales
+        
+        ✅ **Comparación de alternativas**: Evaluar diferentes opciones de sistemas de agua
+        
+        ✅ **Toma de decisiones**: Obtener respaldo cuantitativo para decisiones de inversión
+        
+        ✅ **Análisis de escenarios**: Evaluar riesgos y oportunidades en diferentes contextos
+        
+        ### 💡 ¿Cuándo usar esta herramienta?
+        
+        - Cuando enfrentes **cortes de agua frecuentes** en tu zona
+        - Si tu vivienda tiene **baja presión de agua** constante
+        - Antes de realizar una **inversión en mejoras del hogar**
+        - Para **valorizar tu propiedad** con mejoras justificadas
+        - Cuando necesites **justificar económicamente** una compra
+        - Para **aprender** conceptos de ingeniería económica con ejemplos prácticos
+        
+        ### 🔍 ¿Qué te ofrece?
+        
+        - Cálculos automáticos de indicadores financieros (VAN, TIR, B/C, Payback)
+        - Análisis de sensibilidad con múltiples escenarios
+        - Comparación de alternativas mediante análisis multicriterio
+        - Visualizaciones interactivas y gráficos profesionales
+        - Interpretación clara de resultados
+        - Recomendaciones fundamentadas
+        
+        ---
+        
+        💡 **Consejo**: Si es tu primera vez, te recomendamos revisar el **Glosario** para 
+        familiarizarte con los conceptos, y luego el **Manual de Uso** para conocer el flujo 
+        de trabajo sugerido.
+        """)
+    
+    with col2:
+        st.success("### 🎓 Características")
+        st.write("✅ Interfaz intuitiva")
+        st.write("✅ Cálculos automáticos")
+        st.write("✅ Gráficos interactivos")
+        st.write("✅ Análisis completo")
+        st.write("✅ Resultados claros")
+        
+        st.divider()
+        
+        st.info("### 📋 Datos Base de Ejemplo")
+        st.metric("Inversión Estimada", "S/ 1,750")
+        st.metric("Ahorro Anual", "S/ 600 - 800")
+        st.metric("Vida Útil", "8 años")
+        st.metric("Mantenimiento Anual", "S/ 100")
+        
+        st.divider()
+        
+        st.warning("### ⚡ Inicio Rápido")
+        st.write("1️⃣ Lee el **Glosario**")
+        st.write("2️⃣ Revisa el **Manual**")
+        st.write("3️⃣ Ingresa tus **Datos**")
+        st.write("4️⃣ Analiza los **Resultados**")
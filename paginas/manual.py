@@ -0,0 +1,305 @@
+"""
+Página 📚 Manual de Uso: Guía paso a paso y preguntas frecuentes.
+"""
+
+import streamlit as st
+
+
+def render():
+    """Dibuja la página 📚 Manual de Uso"""
+    st.header("📚 Manual de Uso del Sistema")
+    st.markdown("Guía paso a paso para utilizar correctamente esta herramienta")
+    
+    st.divider()
+    
+    # Flujo de trabajo
+    st.subheader("🔄 Flujo de Trabajo Recomendado")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.info("""
+        ### 📖 PASO 1
+        **Familiarización**
+        
+        1. Lee la sección **Inicio**
+        2. Revisa el **Glosario**
+        3. Comprende los conceptos
+        """)
+    
+    with col2:
+        st.success("""
+        ### 💰 PASO 2
+        **Ingreso de Datos**
+        
+        1. Ve a **Datos de Inversión**
+        2. Configura los costos
+        3. Define parámetros
+        4. Guarda los datos
+        """)
+    
+    with col3:
+        st.warning("""
+        ### 📊 PASO 3
+        **Análisis de Resultados**
+        
+        1. Revisa **Análisis Financiero**
+        2. Explora **Sensibilidad**
+        3. Compara en **Multicriterio**
+        4. Lee **Resultados Integrales**
+        """)
+    
+    st.divider()
+    
+    # Instrucciones detalladas por sección
+    st.subheader("📋 Instrucciones Detalladas por Sección")
+    
+    with st.expander("💰 Cómo usar: DATOS DE INVERSIÓN", expanded=True):
+        st.markdown("""
+        Esta es la sección más importante porque aquí defines todos los parámetros de tu proyecto.
+        
+        **1. Costos Iniciales:**
+        - Ingresa el costo del **tanque de agua** (ejemplo: S/ 750)
+        - Ingresa el costo de la **bomba eléctrica** (ejemplo: S/ 600)
+        - Ingresa el costo de **tuberías e instalación** (ejemplo: S/ 400)
+        - El sistema calculará automáticamente la **inversión total**
+        
+        **2. Parámetros del Proyecto:**
+        - **Vida Útil:** Años que durará funcionando el sistema (típicamente 8-10 años)
+        - **Ahorro Anual:** Cuánto dinero ahorrarás por año (ejemplo: S/ 700)
+          - Considera: menor compra de agua, menos problemas, etc.
+        - **Mantenimiento Anual:** Costo anual de mantenimiento (ejemplo: S/ 100)
+        - **TMAR:** Tasa mínima que esperas ganar (10-12% es típico para proyectos domésticos)
+        
+        **3. Financiamiento (Opcional):**
+        - Marca la casilla si vas a financiar la inversión
+        - Indica qué **porcentaje de la inversión** cubre el préstamo; el resto es tu aporte propio
+        - Ingresa la **tasa nominal** del préstamo
+        - Define los **períodos de capitalización** (mensual = 12)
+        - Indica el **plazo del préstamo** en meses
+        - El sistema calculará la cuota mensual y tasa efectiva
+        
+        **4. Verificación:**
+        - Revisa la **tabla resumen** al final
+        - Verifica que todos los datos sean correctos
+        - Los datos se guardan automáticamente
+        
+        ⚠️ **Importante:** Todos los datos que ingreses aquí se usarán en las demás secciones.
+        """)
+    
+    with st.expander("📊 Cómo usar: ANÁLISIS FINANCIERO"):
+        st.markdown("""
+        Esta sección calcula automáticamente todos los indicadores financieros.
+        
+        **Qué encontrarás:**
+        
+        1. **Métricas Principales (tarjetas superiores):**
+           - VAN: Si es positivo, el proyecto genera valor ✅
+           - TIR: Compárala con tu TMAR. Si TIR > TMAR → viable ✅
+           - B/C: Si es mayor a 1, es conveniente ✅
+           - Payback: Cuánto tiempo tardas en recuperar tu inversión
+        
+        2. **Interpretación de Resultados:**
+           - Cajas de color con explicaciones claras
+           - Verde ✅ = bueno, Rojo ❌ = malo
+           - Lee cada interpretación cuidadosamente
+        
+        3. **Flujo de Caja Proyectado:**
+           - Tabla detallada año por año
+           - Gráfico interactivo con barras y líneas
+           - Puedes hacer hover para ver valores exactos
+        
+        **Cómo interpretar:**
+        - Si VAN, TIR y B/C son favorables → **Proyecto viable**
+        - Si la mayoría son desfavorables → **Revisar datos o no invertir**
+        - Si hay resultados mixtos → **Revisar en análisis de sensibilidad**
+        """)
+    
+    with st.expander("🔍 Cómo usar: ANÁLISIS DE SENSIBILIDAD"):
+        st.markdown("""
+        Aquí evaluarás qué pasa si las cosas no salen exactamente como planeaste.
+        
+        **Escenarios:**
+        
+        1. **Optimista (😃):**
+           - Ajusta el slider para ver qué pasa si ahorras MÁS de lo esperado
+           - Ejemplo: +15% = en vez de ahorrar S/ 700, ahorras S/ 805
+        
+        2. **Probable (😐):**
+           - Es el escenario base con tus datos originales
+           - Sin cambios
+        
+        3. **Pesimista (😟):**
+           - Ajusta el slider para ver qué pasa si ahorras MENOS
+           - Ejemplo: -15% = en vez de S/ 700, solo ahorras S/ 595
+        
+        **Análisis:**
+        - Compara los tres escenarios en la tabla
+        - Revisa el **Diagrama de Tornado** (gráfico de barras horizontal)
+        - Observa el gráfico **VAN vs TMAR**
+        
+        **Pregunta clave:** ¿El proyecto sigue siendo viable incluso en el escenario pesimista?
+        - Si SÍ → Proyecto muy robusto ✅
+        - Si NO → Proyecto riesgoso ⚠️
+        """)
+    
+    with st.expander("⚖️ Cómo usar: ANÁLISIS MULTICRITERIO"):
+        st.markdown("""
+        Compara diferentes alternativas considerando múltiples factores, no solo el costo.
+        
+        **Paso 1: Asignar Pesos**
+        - Usa los sliders de la izquierda
+        - Distribuye 1.0 (100%) entre los criterios
+        - Si el costo es muy importante, dale más peso (ej: 0.40)
+        - La suma DEBE ser 1.0 ✅
+        
+        **Paso 2: Calificar Alternativas**
+        - **Opción A** (Sistema Económico): califica del 1 al 10 cada criterio
+        - **Opción B** (Sistema Premium): califica del 1 al 10 cada criterio
+        - Agrega filas a la tabla para comparar más alternativas
+        - Mientras más alto el número, mejor
+        
+        **Criterios típicos:**
+        - **Costo:** 10 = muy barato, 1 = muy caro
+        - **Capacidad:** 10 = excelente presión/capacidad, 1 = baja
+        - **Consumo eléctrico:** 10 = consume poco, 1 = consume mucho
+        - **Durabilidad:** 10 = dura muchos años, 1 = se daña rápido
+        - **Mantenimiento:** 10 = casi no requiere, 1 = requiere mucho
+        
+        **Resultado:**
+        - El sistema calcula el puntaje con el método elegido (suma ponderada, TOPSIS o AHP)
+        - Gana la opción con mayor puntaje
+        - La **estabilidad del ranking** muestra qué tan seguido gana cada opción si los pesos cambian
+        - Revisa el **gráfico de radar** para ver visualmente las diferencias
+        """)
+    
+    with st.expander("📈 Cómo usar: RESULTADOS INTEGRALES"):
+        st.markdown("""
+        Esta es la sección final donde obtienes la decisión y recomendación.
+        
+        **Dashboard de Indicadores:**
+        - Resumen visual de todas las métricas
+        - Fácil de leer y compartir
+        
+        **Matriz de Decisión:**
+        - Verifica cuántos criterios cumple el proyecto
+        - Si cumple 3 o 4 de 4 → **Altamente recomendado** ✅
+        - Si cumple 2 → **Viable con condiciones** ⚠️
+        - Si cumple 0 o 1 → **No recomendado** ❌
+        
+        **Conclusión Final:**
+        - Lee la recomendación completa
+        - Incluye justificación detallada
+        - Considera beneficios no económicos (calidad de vida, valorización, etc.)
+        
+        **Resumen Ejecutivo:**
+        - Tabla final con todos los datos
+        - Puedes tomar captura de pantalla para presentar
+        - Útil para decisiones en familia o asesorías
+        """)
+    
+    st.divider()
+    
+    st.subheader("💡 Consejos y Mejores Prácticas")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.success("""
+        ### ✅ HACER:
+        
+        - **Datos realistas:** Usa costos y ahorros verificables
+        - **Consultar precios:** Cotiza en ferreterías reales
+        - **Estimar conservador:** Es mejor subestimar ahorros que sobreestimarlos
+        - **Revisar todos los escenarios:** No solo el probable
+        - **Documentar fuentes:** Anota de dónde sacaste los datos
+        - **Comparar alternativas:** Evalúa al menos 2 opciones
+        - **Considerar no económicos:** Calidad de vida, comodidad, salud
+        - **Guardar resultados:** Toma capturas de pantalla
+        """)
+    
+    with col2:
+        st.error("""
+        ### ❌ NO HACER:
+        
+        - **Datos inventados:** No uses valores al azar
+        - **Solo ver el VAN:** Revisa todos los indicadores
+        - **Ignorar el riesgo:** Siempre haz análisis de sensibilidad
+        - **TMAR muy baja:** Ser realista (10-15% típico)
+        - **Olvidar mantenimiento:** Siempre hay costos recurrentes
+        - **Vida útil exagerada:** Ser conservador (8-10 años)
+        - **Decisión apresurada:** Analiza bien todos los resultados
+        - **Ignorar advertencias:** Si sale rojo ❌, hay un problema
+        """)
+    
+    st.divider()
+    
+    st.subheader("❓ Preguntas Frecuentes (FAQ)")
+    
+    with st.expander("¿Qué hago si el VAN es negativo?"):
+        st.markdown("""
+        Si el VAN es negativo, el proyecto NO es viable económicamente. Opciones:
+        
+        1. **Reducir costos iniciales:** Busca proveedores más baratos
+        2. **Aumentar ahorros:** Identifica más beneficios (¿vender agua a vecinos?)
+        3. **Extender vida útil:** ¿Puede durar más de 8 años con buen mantenimiento?
+        4. **Reducir TMAR:** ¿Es muy alta tu expectativa de retorno?
+        5. **Considerar NO invertir:** A veces es la mejor decisión
+        """)
+    
+    with st.expander("¿Cómo sé si mis datos son buenos?"):
+        st.markdown("""
+        **Para costos:**
+        - Cotiza en al menos 3 ferreterías
+        - Suma TODOS los costos (incluye transporte, instalador, accesorios)
+        - Agrega 10-15% de imprevistos
+        
+        **Para ahorros:**
+        - Calcula cuánto gastas en agua por cisterna
+        - Estima pérdidas por no tener agua (tiempo, productos dañados)
+        - Considera mejora en calidad de vida (difícil de cuantificar)
+        - Sé conservador, mejor subestimar que sobreestimar
+        """)
+    
+    with st.expander("¿Qué TMAR debo usar?"):
+        st.markdown("""
+        **Guía para elegir TMAR:**
+        
+        - **8-10%:** Si es tu casa y valoras mucho la comodidad
+        - **10-12%:** Típico para proyectos domésticos
+        - **12-15%:** Si tienes otras opciones de inversión
+        - **15-20%:** Si el proyecto es riesgoso
+        
+        **Referencia:** Si podrías invertir ese dinero en un plazo fijo al 8%, 
+        tu TMAR debería ser al menos 8% + premio al riesgo (2-4%).
+        """)
+    
+    with st.expander("¿Puedo usar esto para otros proyectos?"):
+        st.markdown("""
+        Sí, aunque está diseñado para tanques de agua, la metodología aplica a:
+        
+        ✅ Paneles solares
+        ✅ Sistemas de ahorro de energía
+        ✅ Mejoras en el hogar (ventanas, aislamiento)
+        ✅ Equipos que generen ahorros recurrentes
+        ✅ Proyectos pequeños de negocio
+        
+        Solo ajusta los nombres y valores según tu proyecto.
+        """)
+    
+    st.divider()
+    
+    st.info("""
+    ### 🎓 Recursos Adicionales
+    
+    **Para profundizar en los conceptos:**
+    - Revisa el **Glosario** para definiciones completas
+    - Busca videos de ingeniería económica en YouTube
+    - Consulta libros: "Ingeniería Económica" de Blank & Tarquin
+    
+    **Para obtener datos:**
+    - Ferreterías locales (Sodimac, Maestro, etc.)
+    - Cotizaciones de plomeros/instaladores
+    - Recibos de agua de los últimos meses
+    - Consulta a vecinos con sistemas similares
+    """)
@@ -0,0 +1,251 @@
+"""
+Página 📈 Resultados Integrales: Dashboard, matriz de decisión y conclusión final.
+"""
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
+
+from data_manager import DataManager
+
+INDICADORES_RESUMEN = ['VAN<br>(normalizado)', 'TIR<br>(%)', 'B/C<br>(x3)', 'Payback<br>(invertido)']
+
+
+def _figura_indicadores():
+    """Layout del resumen de indicadores; los valores se asignan en cada rerun"""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=INDICADORES_RESUMEN, texttemplate='%{y:.1f}', textposition='auto'))
+    fig.update_layout(
+        title="Indicadores Clave del Proyecto (Valores Normalizados 0-10)",
+        yaxis_title="Puntuación",
+        height=400,
+        yaxis=dict(range=[0, 10])
+    )
+    return fig
+
+
+def render():
+    """Dibuja la página 📈 Resultados Integrales"""
+    st.header("📈 Resultados Integrales y Conclusiones")
+    
+    if 'inversion_inicial' not in st.session_state:
+        st.warning("⚠️ Por favor, primero ingresa los datos en la sección 'Datos de Inversión'")
+    else:
+        proyecto = DataManager.get_proyecto()
+        inversion_inicial = proyecto.inversion_inicial
+        vida_util = proyecto.vida_util
+        ahorro_anual = proyecto.ahorro_anual
+        mantenimiento_anual = proyecto.mantenimiento_anual
+        tmar = proyecto.tmar
+        
+        # Cálculos incrementales: solo se recalcula lo que depende de datos cambiados
+        grafo = DataManager.get_grafo()
+        resultados = grafo.obtener("resultados")
+        flujo_neto_anual = resultados.flujo_neto_anual
+        flujos_netos = list(resultados.flujos_netos)
+        van = resultados.van
+        vae = resultados.vae
+        tir = resultados.tir
+        bc = resultados.bc
+        payback_simple = resultados.payback_simple
+        payback_desc = resultados.payback_desc
+        
+        # Sin aporte propio la TIR y el payback no aplican
+        if resultados.sin_aporte:
+            texto_tir = texto_payback_simple = texto_payback_desc = "No aplica"
+        else:
+            texto_tir = f"{tir*100:.2f}%"
+            texto_payback_simple = f"{payback_simple:.2f} años" if payback_simple else "N/A"
+            texto_payback_desc = f"{payback_desc:.2f} años" if payback_desc else "N/A"
+        
+        # Dashboard de métricas
+        st.subheader("📊 Dashboard de Indicadores")
+        
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric("VAN", f"S/ {van:,.2f}", 
+                     "Viable" if van > 0 else "No Viable",
+                     delta_color="normal" if van > 0 else "inverse")
+        
+        with col2:
+            st.metric("TIR", texto_tir,
+                     f"vs TMAR {tmar*100:.2f}%",
+                     delta_color="off" if resultados.sin_aporte else "normal" if tir > tmar else "inverse")
+        
+        with col3:
+            st.metric("B/C", f"{bc:.3f}",
+                     "Conveniente" if bc > 1 else "No Conveniente",
+                     delta_color="normal" if bc > 1 else "inverse")
+        
+        with col4:
+            st.metric("Payback", "No aplica" if resultados.sin_aporte else
+                     f"{payback_desc:.1f} años" if payback_desc else "N/A",
+                     f"de {vida_util} años")
+        
+        st.divider()
+        
+        # Matriz de decisión
+        st.subheader("✅ Matriz de Decisión")
+        
+        decision = grafo.obtener("veredicto")
+        criterios = decision['criterios']
+        criterios_cumplidos = decision['criterios_cumplidos']
+        total_criterios = decision['total_criterios']
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            if criterios['van']:
+                st.success("✅ VAN > 0: Proyecto crea valor")
+            else:
+                st.error("❌ VAN < 0: Proyecto destruye valor")
+            
+            if criterios['tir'] is None:
+                st.info("ℹ️ TIR: no aplica sin aporte propio")
+            elif criterios['tir']:
+                st.success(f"✅ TIR ({tir*100:.2f}%) > TMAR ({tmar*100:.2f}%)")
+            else:
+                st.error(f"❌ TIR ({tir*100:.2f}%) < TMAR ({tmar*100:.2f}%)")
+        
+        with col2:
+            if criterios['bc']:
+                st.success(f"✅ B/C ({bc:.2f}) > 1: Beneficios superan costos")
+            else:
+                st.error(f"❌ B/C ({bc:.2f}) < 1: Costos superan beneficios")
+            
+            if criterios['payback'] is None:
+                st.info("ℹ️ Payback: no aplica sin aporte propio")
+            elif criterios['payback']:
+                st.success(f"✅ Payback ({payback_desc:.1f} años) < Vida Útil ({vida_util} años)")
+            else:
+                st.warning("⚠️ Payback muy largo o indefinido")
+        
+        st.divider()
+        
+        # Conclusión final
+        st.subheader("🎯 Conclusión y Recomendación Final")
+        
+        porcentaje_aprobacion = decision['porcentaje_aprobacion']
+        
+        if porcentaje_aprobacion >= 75:
+            st.success(f"""
+            ### ✅ PROYECTO ALTAMENTE RECOMENDADO
+            
+            **Criterios cumplidos: {criterios_cumplidos} de {total_criterios} ({porcentaje_aprobacion:.0f}%)**
+            
+            #### Justificación:
+            - El proyecto presenta indicadores financieros favorables
+            - La inversión de S/ {inversion_inicial:,.2f} se recupera en: {texto_payback_desc}
+            - Se genera un valor actual neto de S/ {van:,.2f}
+            - Rentabilidad (TIR): {texto_tir}; mínimo requerido: {tmar*100:.2f}%
+            - Por cada sol invertido se obtienen S/ {bc:.2f} en beneficios
+            
+            #### Recomendación:
+            **PROCEDER CON LA INVERSIÓN**. El proyecto no solo es viable económicamente, 
+            sino que además proporcionará beneficios adicionales como:
+            - Mejora en la calidad de vida (agua con presión constante)
+            - Independencia de cortes de servicio
+            - Valorización de la vivienda
+            """)
+        elif porcentaje_aprobacion >= 50:
+            st.warning(f"""
+            ### ⚠️ PROYECTO VIABLE CON CONDICIONES
+            
+            **Criterios cumplidos: {criterios_cumplidos} de {total_criterios} ({porcentaje_aprobacion:.0f}%)**
+            
+            #### Situación:
+            - El proyecto cumple algunos criterios de viabilidad
+            - Existen riesgos que deben considerarse
+            - VAN: S/ {van:,.2f}
+            - TIR: {texto_tir} vs TMAR: {tmar*100:.2f}%
+            
+            #### Recomendación:
+            **EVALUAR OPCIONES**:
+            - Considerar financiamiento si es posible
+            - Buscar proveedores con mejores precios
+            - Evaluar alternativas de menor costo
+            - Realizar análisis de sensibilidad detallado
+            """)
+        else:
+            st.error(f"""
+            ### ❌ PROYECTO NO RECOMENDADO
+            
+            **Criterios cumplidos: {criterios_cumplidos} de {total_criterios} ({porcentaje_aprobacion:.0f}%)**
+            
+            #### Problemas identificados:
+            - La mayoría de indicadores financieros son desfavorables
+            - VAN: S/ {van:,.2f} (Negativo)
+            - TIR: {texto_tir} vs TMAR: {tmar*100:.2f}%
+            - La inversión no se justifica económicamente
+            
+            #### Recomendación:
+            **NO PROCEDER** con la inversión actual. Considerar:
+            - Reevaluar costos de inversión
+            - Buscar alternativas más económicas
+            - Esperar a que mejoren las condiciones
+            - Explorar otras soluciones al problema de agua
+            """)
+        
+        st.divider()
+        
+        # Gráfico de resumen
+        st.subheader("📊 Resumen Visual de Indicadores")
+        
+        # Normalizar valores para visualización
+        van_norm = min(van / 1000, 10) if van > 0 else 0
+        tir_norm = 0 if resultados.sin_aporte else min(tir * 100 / 10, 10)
+        bc_norm = min(bc * 3, 10)
+        payback_norm = 10 - min(payback_desc / vida_util * 10, 10) if payback_desc and not resultados.sin_aporte else 0
+        
+        valores = np.array([van_norm, tir_norm, bc_norm, payback_norm])
+        colores = np.select([valores >= 5, valores >= 3], ['green', 'orange'], 'red')
+        
+        fig = DataManager.get_figuras().figura("indicadores", _figura_indicadores, [
+            {"y": valores, "marker_color": colores},
+        ])
+        
+        st.plotly_chart(fig, width='stretch')
+        
+        # Tabla de resumen ejecutivo
+        st.subheader("📋 Resumen Ejecutivo")
+        
+        df_ejecutivo = pd.DataFrame({
+            'Concepto': [
+                'Inversión Inicial',
+                'Vida Útil del Proyecto',
+                'Ahorro Anual Bruto',
+                'Mantenimiento Anual',
+                'Flujo Neto Anual',
+                'TMAR',
+                '',
+                'VAN',
+                'VAE',
+                'TIR',
+                'Relación B/C',
+                'Payback Simple',
+                'Payback Descontado',
+                '',
+                'DECISIÓN'
+            ],
+            'Valor': [
+                f'S/ {inversion_inicial:,.2f}',
+                f'{vida_util} años',
+                f'S/ {ahorro_anual:,.2f}',
+                f'S/ {mantenimiento_anual:,.2f}',
+                f'S/ {flujo_neto_anual:,.2f}',
+                f'{tmar*100:.2f}%',
+                '',
+                f'S/ {van:,.2f}',
+                f'S/ {vae:,.2f}',
+                texto_tir,
+                f'{bc:.3f}',
+                texto_payback_simple,
+                texto_payback_desc,
+                '',
+                decision['decision']
+            ]
+        })
+        
+        st.dataframe(df_ejecutivo, width='stretch', hide_index=True)
@@ -0,0 +1,693 @@
+"""
+Página 🔍 Análisis de Sensibilidad: Escenarios, sensibilidad a la TMAR, cortes de agua, Monte Carlo y mapas de calor.
+"""
+
+import io
+import os
+import tempfile
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
+
+from data_manager import DataManager
+from sesiones import id_sesion_actual
+from trabajos import gestor_trabajos, TERMINADO, ERROR, CANCELADO
+import cortes
+import equilibrio
+import exportacion
+import figuras
+import montecarlo
+from evaluacion import (trabajo_montecarlo, trabajo_cortes, trabajo_barrido, ejes_por_variacion,
+                        tornado_cacheado, ENTRADAS_REGLAS)
+
+
+ETIQUETAS_ENTRADAS = {
+    "ahorro_anual": "Ahorro Anual",
+    "mantenimiento_anual": "Mantenimiento Anual",
+    "costo_tanque": "Costo del Tanque",
+    "costo_bomba": "Costo de la Bomba",
+    "costo_instalacion": "Costo de Instalación",
+    "vida_util": "Vida Útil",
+    "tmar": "TMAR",
+    "crecimiento_ahorro": "Crecimiento del Ahorro",
+    "inflacion_costos": "Inflación de Costos",
+    "costo_reemplazo": "Costo de Reemplazo",
+    "valor_rescate": "Valor de Rescate",
+    "tasa_impuesto": "Tasa de Impuesto",
+}
+
+
+# Segundos entre consultas del avance de un trabajo en segundo plano
+INTERVALO_SONDEO = 0.5
+
+# Streamlit no transmite las descargas por partes: guarda el archivo completo
+# en memoria mientras dura la sesión, así que se limita su número de filas
+FILAS_MAXIMAS_DESCARGA = int(os.environ.get("INGECO_DESCARGA_FILAS_MAX", 500_000))
+
+
+@st.fragment(run_every=INTERVALO_SONDEO)
+def _avance_trabajo(id_trabajo, etiqueta, bandera):
+    """Barra de avance que se actualiza sola; al terminar el trabajo vuelve a dibujar la página"""
+    trabajo = gestor_trabajos.trabajo(id_trabajo)
+    if trabajo is None or trabajo.finalizado:
+        st.rerun()
+    st.progress(trabajo.progreso, text=f"{etiqueta}... {trabajo.progreso:.0%}")
+    if st.button("⏹️ Cancelar", key=f"cancelar_{trabajo.nombre}"):
+        gestor_trabajos.cancelar(id_sesion_actual(), trabajo.nombre)
+        st.session_state[bandera] = False
+        st.rerun()
+
+
+def _resultado_trabajo(trabajo, etiqueta, bandera):
+    """
+    Resultado del trabajo si ya terminó; si sigue en curso muestra su avance
+    (la página no se bloquea) y retorna None. `bandera` es la clave de
+    session_state que mantiene el análisis activo entre reruns.
+    """
+    if trabajo.estado == TERMINADO:
+        return trabajo.resultado
+    if trabajo.estado == ERROR:
+        st.error(f"❌ Error en el cálculo: {trabajo.error}")
+        if st.button("🔄 Reintentar", key=f"reintentar_{trabajo.nombre}"):
+            gestor_trabajos.reintentar(id_sesion_actual(), trabajo.nombre)
+            st.rerun()
+    elif trabajo.estado == CANCELADO:
+        st.info("⏹️ Cálculo cancelado")
+    else:
+        _avance_trabajo(trabajo.id, etiqueta, bandera)
+    return None
+
+
+def _formato_equilibrio(variable, valor):
+    if not np.isfinite(valor):
+        return "—"
+    if variable == "tmar":
+        return f"{valor*100:.2f}%"
+    if variable == "vida_util":
+        return f"{valor:.1f} años"
+    return f"S/ {valor:,.2f}"
+
+
+def _figura_escenarios():
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        y=['Pesimista', 'Probable', 'Optimista'],
+        orientation='h',
+        marker=dict(color=['red', 'orange', 'green']),
+        texttemplate='S/ %{x:,.0f}',
+        textposition='auto'
+    ))
+    fig.update_layout(
+        title="Sensibilidad del VAN según Escenarios",
+        xaxis_title="VAN (S/)",
+        yaxis_title="Escenario",
+        height=400
+    )
+    return fig
+
+
+def _figura_tornado(indicador, variacion):
+    nombre = "VAN (S/)" if indicador == "VAN" else "TIR (%)"
+    fig = go.Figure()
+    fig.add_trace(go.Bar(orientation='h', name=f"-{variacion*100:.0f}%", marker_color='indianred'))
+    fig.add_trace(go.Bar(orientation='h', name=f"+{variacion*100:.0f}%", marker_color='seagreen'))
+    fig.update_layout(
+        title=f"Diagrama de Tornado: {indicador} con cada entrada ±{variacion*100:.0f}%",
+        xaxis_title=nombre,
+        yaxis=dict(autorange='reversed'),
+        barmode='overlay',
+        height=450
+    )
+    return fig
+
+
+def _figura_van_tasas(tmar):
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(mode='lines+markers', name='VAN', line=dict(color='blue', width=3)))
+    fig.add_hline(y=0, line_dash="dash", line_color="red", annotation_text="VAN = 0")
+    fig.add_vline(x=tmar*100, line_dash="dash", line_color="green",
+                  annotation_text=f"TMAR actual: {tmar*100:.1f}%")
+    fig.update_layout(
+        title="Variación del VAN según Tasa de Descuento",
+        xaxis_title="Tasa de Descuento (%)",
+        yaxis_title="VAN (S/)",
+        height=500,
+        hovermode='x unified'
+    )
+    return fig
+
+
+def _figura_ahorro_cortes(vida_util):
+    fig = go.Figure()
+    fig.add_trace(go.Bar(name='Frecuencia', marker_color='steelblue'))
+    fig.update_layout(
+        title=f"Ahorro Anual Equivalente por Cortes de Agua (vidas de {vida_util} años)",
+        xaxis_title="Ahorro anual equivalente (S/)",
+        yaxis_title="Frecuencia relativa",
+        bargap=0,
+        height=400
+    )
+    return fig
+
+
+def _figura_montecarlo(n_simulaciones):
+    fig = go.Figure()
+    fig.add_trace(go.Bar(name='Frecuencia'))
+    fig.add_vline(x=0, line_dash="dash", line_color="red", annotation_text="VAN = 0")
+    fig.update_layout(
+        title=f"Distribución del VAN ({n_simulaciones:,} simulaciones)",
+        xaxis_title="VAN (S/)",
+        yaxis_title="Frecuencia relativa",
+        bargap=0,
+        height=450
+    )
+    return fig
+
+
+def _figura_barrido(titulo, titulo_x, titulo_y, nombre_indicador, umbral):
+    fig = go.Figure()
+    fig.add_trace(go.Heatmap(colorscale='RdYlGn', zmid=umbral, colorbar=dict(title=nombre_indicador)))
+    fig.add_trace(go.Contour(contours=dict(start=umbral, end=umbral, coloring='lines', showlabels=True),
+                             line=dict(color='black', width=2, dash='dash'),
+                             showscale=False, name='Umbral'))
+    fig.update_layout(title=titulo, xaxis_title=titulo_x, yaxis_title=titulo_y, height=550)
+    return fig
+
+
+def _exportar_a_disco(generar_bloques, formato):
+    """
+    Contenido del archivo exportado, generado al pulsar la descarga: los
+    bloques se escriben en un archivo temporal y solo el contenido final se
+    entrega a Streamlit, que lo conserva en memoria (una copia).
+    """
+    def generar():
+        with tempfile.TemporaryFile() as archivo:
+            exportacion.exportar(generar_bloques(), archivo, formato)
+            archivo.seek(0)
+            return archivo.read()
+    return generar
+
+
+def _corrida_npz(corrida, metadatos):
+    """Corrida comprimida en .npz, generada al pulsar la descarga"""
+    def generar():
+        binario = io.BytesIO()
+        exportacion.guardar_corrida(binario, corrida, **metadatos)
+        return binario
+    return generar
+
+
+def _describir_corrida(valor, campo=""):
+    """Filas (campo, valor) de las entradas de una corrida; los arreglos se resumen por su forma y rango"""
+    if isinstance(valor, dict):
+        filas = []
+        for clave, v in valor.items():
+            filas.extend(_describir_corrida(v, f"{campo}.{clave}" if campo else str(clave)))
+        return filas
+    if isinstance(valor, np.ndarray):
+        if valor.size and np.issubdtype(valor.dtype, np.number):
+            return [(campo, f"arreglo {valor.shape}, de {np.nanmin(valor):,.4g} a {np.nanmax(valor):,.4g}")]
+        return [(campo, f"arreglo {valor.shape}")]
+    return [(campo, str(valor))]
+
+
+def _descargas(clave, generar_bloques, filas, nombre_archivo, corrida, **metadatos):
+    """
+    Botones para exportar una corrida grande: sus `filas` se escriben por
+    bloques (CSV, Parquet o Arrow) al pulsar la descarga, hasta
+    FILAS_MAXIMAS_DESCARGA filas, y la corrida resumida, con sus `metadatos`
+    de entrada, se ofrece como .npz para recargarla sin recalcular.
+    """
+    col1, col2, col3 = st.columns([1, 1, 1])
+    with col1:
+        formato = st.selectbox("Formato de exportación", list(exportacion.FORMATOS),
+                               key=f"formato_{clave}")
+    extension, mime = exportacion.FORMATOS[formato]
+    with col2:
+        if filas > FILAS_MAXIMAS_DESCARGA:
+            st.caption(f"⚠️ {filas:,} filas superan el límite de descarga ({FILAS_MAXIMAS_DESCARGA:,}); "
+                       "exporta a un archivo con `exportacion.exportar` o `cli.py`")
+        else:
+            st.download_button(f"⬇️ Descargar {formato}", _exportar_a_disco(generar_bloques, formato),
+                               file_name=nombre_archivo + extension, mime=mime, key=f"descargar_{clave}")
+    with col3:
+        st.download_button("💾 Guardar corrida (.npz)", _corrida_npz(corrida, metadatos),
+                           file_name=nombre_archivo + ".npz", mime="application/octet-stream",
+                           key=f"corrida_{clave}")
+
+
+def _corrida_cargada(clave, campos_resultado, campos_entradas):
+    """
+    Selector de una corrida .npz guardada. Si hay una, retorna
+    (resultado, entradas) para dibujarla con las vistas normales de la
+    sección en lugar de calcularla; si no, None. La corrida debe tener los
+    campos dados en su resultado y en sus entradas.
+    """
+    archivo = st.file_uploader("📂 Cargar una corrida guardada (.npz)", type=["npz"], key=f"cargar_{clave}")
+    if archivo is None:
+        return None
+    # El archivo se lee una sola vez aunque la página se vuelva a dibujar
+    leida = st.session_state.get(f"leida_{clave}")
+    if leida is None or leida[0] != archivo.file_id:
+        try:
+            leida = (archivo.file_id, *exportacion.cargar_corrida(archivo))
+        except (ValueError, KeyError, OSError) as error:
+            st.error(f"❌ No se pudo leer la corrida: {error}")
+            return None
+        st.session_state[f"leida_{clave}"] = leida
+    _, resultado, entradas = leida
+    if not (isinstance(resultado, dict) and set(campos_resultado) <= set(resultado)
+            and set(campos_entradas) <= set(entradas)):
+        st.error("❌ El archivo no es una corrida guardada de esta sección")
+        return None
+
+    st.info(f"📂 Se muestra la corrida cargada **{archivo.name}**; quita el archivo para volver al cálculo actual")
+    with st.expander("Entradas de la corrida cargada"):
+        st.dataframe(pd.DataFrame(_describir_corrida(entradas), columns=["Campo", "Valor"]),
+                     width='stretch', hide_index=True)
+    return resultado, entradas
+
+
+def render():
+    """Dibuja la página 🔍 Análisis de Sensibilidad"""
+    st.header("🔍 Análisis de Sensibilidad")
+    st.markdown("Evalúa cómo cambian los resultados ante variaciones en los parámetros clave")
+    
+    if 'inversion_inicial' not in st.session_state:
+        st.warning("⚠️ Por favor, primero ingresa los datos en la sección 'Datos de Inversión'")
+    else:
+        datos = DataManager.get_all_data()
+        tmar = datos['tmar']
+        
+        st.subheader("🎲 Escenarios de Análisis")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.info("### 😃 Escenario Optimista")
+            var_optimista = st.slider("Ahorro aumenta:", 0, 30, 15, key='opt') / 100
+        
+        with col2:
+            st.warning("### 😐 Escenario Probable")
+        
+        with col3:
+            st.error("### 😟 Escenario Pesimista")
+            var_pesimista = st.slider("Ahorro disminuye:", 0, 30, 15, key='pes') / 100
+        
+        # Con la TMAR solo cambian los VAN; las TIR y la curva VAN vs tasa se reutilizan
+        grafo = DataManager.get_grafo()
+        grafo.actualizar({"var_optimista": var_optimista, "var_pesimista": var_pesimista})
+        resultados_escenarios = {}
+        for nodo in ("tir_escenarios", "van_escenarios", "curva_van_tasas"):
+            resultados_escenarios.update(grafo.obtener(nodo))
+        ahorro_opt, ahorro_prob, ahorro_pes = resultados_escenarios['ahorros']
+        van_opt, van_prob, van_pes = resultados_escenarios['vans']
+        tir_opt, tir_prob, tir_pes = resultados_escenarios['tirs']
+        
+        with col1:
+            st.metric("Ahorro Anual", f"S/ {ahorro_opt:,.2f}")
+            st.metric("VAN", f"S/ {van_opt:,.2f}")
+            st.metric("TIR", f"{tir_opt*100:.2f}%")
+        
+        with col2:
+            st.metric("Ahorro Anual", f"S/ {ahorro_prob:,.2f}")
+            st.metric("VAN", f"S/ {van_prob:,.2f}")
+            st.metric("TIR", f"{tir_prob*100:.2f}%")
+        
+        with col3:
+            st.metric("Ahorro Anual", f"S/ {ahorro_pes:,.2f}")
+            st.metric("VAN", f"S/ {van_pes:,.2f}")
+            st.metric("TIR", f"{tir_pes*100:.2f}%")
+        
+        st.divider()
+        
+        # Tabla comparativa
+        st.subheader("📊 Comparación de Escenarios")
+        df_escenarios = pd.DataFrame({
+            'Escenario': ['Optimista', 'Probable', 'Pesimista'],
+            'Ahorro Anual': [ahorro_opt, ahorro_prob, ahorro_pes],
+            'VAN': [van_opt, van_prob, van_pes],
+            'TIR (%)': [tir_opt*100, tir_prob*100, tir_pes*100],
+            'Decisión': [
+                '✅ Viable' if van_opt > 0 else '❌ No Viable',
+                '✅ Viable' if van_prob > 0 else '❌ No Viable',
+                '✅ Viable' if van_pes > 0 else '❌ No Viable'
+            ]
+        })
+        
+        st.dataframe(df_escenarios.style.format({
+            'Ahorro Anual': 'S/ {:,.2f}',
+            'VAN': 'S/ {:,.2f}',
+            'TIR (%)': '{:.2f}%'
+        }), width='stretch', hide_index=True)
+        
+        # VAN por escenario
+        st.subheader("📊 VAN según Escenarios")
+        
+        cache_figuras = DataManager.get_figuras()
+        fig = cache_figuras.figura("escenarios", _figura_escenarios, [{"x": [van_pes, van_prob, van_opt]}])
+        
+        st.plotly_chart(fig, width='stretch')
+        
+        st.divider()
+        
+        # Diagrama de tornado: cada entrada por separado
+        st.subheader("🌪️ Diagrama de Tornado - Sensibilidad por Entrada")
+        st.markdown("Mueve cada entrada por separado y ordena las entradas según el cambio que producen en el VAN")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            variacion_tornado = st.slider("Variación de cada entrada (±%)", 5, 50, 10, 5, key='tornado_variacion') / 100
+        with col2:
+            indicador_tornado = st.radio("Indicador", ["VAN", "TIR"], horizontal=True, key='tornado_indicador')
+        
+        analisis_tornado = tornado_cacheado(datos, variacion_tornado)
+        tabla_tornado = analisis_tornado["tabla"]
+        etiquetas = [ETIQUETAS_ENTRADAS[v] for v in tabla_tornado["variable"]]
+        if indicador_tornado == "VAN":
+            base_tornado = analisis_tornado["van_base"]
+            bajo = tabla_tornado["delta_van_bajo"].to_numpy()
+            alto = tabla_tornado["delta_van_alto"].to_numpy()
+        else:
+            base_tornado = analisis_tornado["tir_base"] * 100
+            bajo = tabla_tornado["delta_tir_bajo"].to_numpy() * 100
+            alto = tabla_tornado["delta_tir_alto"].to_numpy() * 100
+        
+        fig_tornado = cache_figuras.figura(
+            "tornado", lambda: _figura_tornado(indicador_tornado, variacion_tornado),
+            [{"y": etiquetas, "x": bajo, "base": base_tornado},
+             {"y": etiquetas, "x": alto, "base": base_tornado}],
+            clave=(indicador_tornado, variacion_tornado),
+        )
+        st.plotly_chart(fig_tornado, width='stretch')
+        
+        df_tornado = pd.DataFrame({
+            "Entrada": etiquetas,
+            "VAN bajo": tabla_tornado["van_bajo"],
+            "VAN alto": tabla_tornado["van_alto"],
+            "Impacto VAN": tabla_tornado["impacto_van"],
+            "TIR baja (%)": tabla_tornado["tir_bajo"] * 100,
+            "TIR alta (%)": tabla_tornado["tir_alto"] * 100,
+        })
+        st.dataframe(df_tornado.style.format({
+            'VAN bajo': 'S/ {:,.2f}',
+            'VAN alto': 'S/ {:,.2f}',
+            'Impacto VAN': 'S/ {:,.2f}',
+            'TIR baja (%)': '{:.2f}%',
+            'TIR alta (%)': '{:.2f}%'
+        }), width='stretch', hide_index=True)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            formato_tornado = st.selectbox("Formato de exportación", list(exportacion.FORMATOS),
+                                           key="formato_tornado")
+        extension, mime = exportacion.FORMATOS[formato_tornado]
+        with col2:
+            st.download_button(f"⬇️ Descargar {formato_tornado}",
+                               b"".join(exportacion.codificar([tabla_tornado], formato_tornado)),
+                               file_name="tornado" + extension, mime=mime, key="descargar_tornado")
+        
+        st.divider()
+        
+        # Análisis de variación de TMAR
+        st.subheader("📉 Sensibilidad del VAN vs TMAR")
+        
+        tasas = resultados_escenarios['tasas']
+        vans_tasas = resultados_escenarios['vans_tasas']
+        
+        # Curvas largas se reducen antes de enviarlas al navegador
+        x_tasas, y_tasas = figuras.decimar(tasas*100, vans_tasas)
+        fig2 = cache_figuras.figura("van_tasas", lambda: _figura_van_tasas(tmar),
+                                    [{"x": x_tasas, "y": y_tasas}], clave=tmar)
+        
+        st.plotly_chart(fig2, width='stretch')
+        
+        st.divider()
+        
+        # Valores críticos de cada entrada
+        st.subheader("⚖️ Valores de Equilibrio")
+        st.markdown("Valor de cada entrada con el que el proyecto queda justo en el umbral, "
+                    "manteniendo las demás entradas fijas")
+
+        criticos = grafo.obtener("equilibrio")
+        filas = []
+        for variable in equilibrio.VARIABLES:
+            actual = datos[variable]
+            fila = {"Entrada": ETIQUETAS_ENTRADAS[variable], "Valor actual": _formato_equilibrio(variable, actual)}
+            for criterio, titulo in equilibrio.CRITERIOS.items():
+                fila[titulo] = _formato_equilibrio(variable, criticos[criterio][variable])
+            critico_van = criticos["van"][variable]
+            fila["Margen (VAN = 0)"] = (f"{(critico_van - actual) / actual * 100:+.1f}%"
+                                        if actual and np.isfinite(critico_van) else "—")
+            filas.append(fila)
+
+        st.dataframe(pd.DataFrame(filas), width='stretch', hide_index=True)
+        st.caption("El margen es el cambio relativo que lleva el VAN a cero. "
+                   "— indica que el criterio no depende de la entrada o que no hay un valor admisible.")
+
+        st.divider()
+
+        # Cortes de agua
+        st.subheader("🚱 Cortes de Agua y Valor del Tanque")
+        st.markdown("Simula miles de años de cortes aleatorios (llegadas de Poisson y duraciones aleatorias) "
+                    "y estima la demanda que el tanque cubre durante los cortes y su valor")
+        
+        with st.form("form_cortes"):
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                frecuencia = st.number_input("Cortes por año", min_value=0.0, value=52.0, step=4.0,
+                                             key="cortes_frecuencia")
+                duracion = st.number_input("Duración media (h)", min_value=0.1, value=10.0, step=1.0,
+                                           key="cortes_duracion")
+            with col2:
+                distribucion = st.selectbox("Distribución de la duración", cortes.DISTRIBUCIONES_DURACION,
+                                            key="cortes_distribucion")
+                variacion_duracion = st.slider("Coef. de variación de la duración", 0.1, 3.0, 1.0,
+                                               key="cortes_variacion",
+                                               help="Solo para las distribuciones Lognormal y Gamma")
+            with col3:
+                capacidad = st.number_input("Capacidad del tanque (L)", min_value=1.0, value=1100.0,
+                                            step=100.0, key="cortes_capacidad")
+                consumo = st.number_input("Consumo diario (L)", min_value=0.0, value=600.0, step=50.0,
+                                          key="cortes_consumo")
+            with col4:
+                caudal = st.number_input("Caudal de la bomba (L/min)", min_value=1.0, value=35.0, step=5.0,
+                                         key="cortes_caudal")
+                valor_agua = st.number_input("Valor del agua durante un corte (S/ por m³)", min_value=0.0,
+                                             value=25.0, step=5.0, key="cortes_valor_agua")
+            anios = st.select_slider("Años simulados", options=[1_000, 10_000, 50_000], value=10_000,
+                                     key="cortes_anios")
+            ejecutar_cortes = st.form_submit_button("▶️ Simular cortes")
+        
+        ahorro_cortes = None
+        simulacion_cortes = None
+        if ejecutar_cortes or st.session_state.get("cortes_ejecutada"):
+            st.session_state["cortes_ejecutada"] = True
+            trabajo = trabajo_cortes(id_sesion_actual(), capacidad, consumo, caudal, frecuencia, duracion,
+                                     distribucion, variacion_duracion, valor_agua, anios)
+            simulacion_cortes = _resultado_trabajo(trabajo, "Simulando cortes", "cortes_ejecutada")
+        if simulacion_cortes is not None:
+            vida = int(datos['vida_util'])
+            ahorro_cortes = cortes.ahorro_equivalente(simulacion_cortes["ahorro_anual"], vida, tmar)[0]
+            resumen_cortes = cortes.resumen(ahorro_cortes)
+            demanda_corte = simulacion_cortes["demanda_corte"][0].sum()
+            cubierta = simulacion_cortes["demanda_evitada"][0].sum() / demanda_corte if demanda_corte else 1.0
+            
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("Horas sin Servicio", f"{simulacion_cortes['horas_corte'].mean():,.0f} h/año")
+            col2.metric("Demanda Cubierta por el Tanque", f"{cubierta:.1%}")
+            col3.metric("Ahorro Anual Esperado", f"S/ {resumen_cortes['media']:,.2f}")
+            col4.metric("Ahorro P5 - P95", f"S/ {resumen_cortes['percentiles'][5]:,.0f} a "
+                                           f"{resumen_cortes['percentiles'][95]:,.0f}")
+            
+            conteos, bordes = np.histogram(ahorro_cortes, bins=40)
+            fig_cortes = cache_figuras.figura(
+                "ahorro_cortes", lambda: _figura_ahorro_cortes(vida),
+                [{"x": (bordes[:-1] + bordes[1:]) / 2, "y": conteos / max(ahorro_cortes.size, 1)}],
+                clave=vida,
+            )
+            st.plotly_chart(fig_cortes, width='stretch')
+            st.caption(f"{ahorro_cortes.size:,} vidas del proyecto de {vida} años: cada una resume sus ahorros "
+                       "anuales en un ahorro uniforme equivalente a la TMAR. La simulación Monte Carlo puede "
+                       "usar esta distribución como Ahorro Anual.")
+
+        st.divider()
+
+        # Simulación Monte Carlo
+        st.subheader("🎲 Simulación Monte Carlo")
+        st.markdown("Muestrea los parámetros desde distribuciones de probabilidad y estima el riesgo del proyecto")
+        if any(datos[clave] for clave in ENTRADAS_REGLAS):
+            st.caption("ℹ️ La simulación y los mapas de calor usan flujos uniformes (sin crecimiento, "
+                       "reemplazos, rescate ni impuestos) para evaluar millones de casos en forma cerrada.")
+        
+        etiquetas_mc = {
+            "ahorro_anual": "Ahorro Anual",
+            "mantenimiento_anual": "Mantenimiento Anual",
+            "costo_tanque": "Costo Tanque",
+            "costo_bomba": "Costo Bomba",
+            "costo_instalacion": "Costo Instalación",
+            "vida_util": "Vida Útil",
+            "tmar": "TMAR",
+        }
+        
+        with st.form("form_montecarlo"):
+            distribuciones = {}
+            columnas_mc = st.columns(4)
+            for i, (variable, etiqueta) in enumerate(etiquetas_mc.items()):
+                with columnas_mc[i % 4]:
+                    tipo = st.selectbox(etiqueta, montecarlo.DISTRIBUCIONES,
+                                        index=1 if variable == "ahorro_anual" else 0,
+                                        key=f"mc_dist_{variable}")
+                    variacion = st.slider(f"Variación {etiqueta} (%)", 0, 50, 15,
+                                          key=f"mc_var_{variable}") / 100
+                    if tipo != "Fija":
+                        distribuciones[variable] = (tipo, variacion)
+            usar_cortes = ahorro_cortes is not None and st.checkbox(
+                "Ahorro Anual según la simulación de cortes de agua", key="mc_ahorro_cortes")
+            if usar_cortes:
+                distribuciones["ahorro_anual"] = ("Empírica", ahorro_cortes)
+            n_simulaciones = st.select_slider("Número de simulaciones",
+                                              options=[10_000, 100_000, 1_000_000], value=100_000)
+            ejecutar_mc = st.form_submit_button("▶️ Ejecutar simulación")
+        
+        simulacion = None
+        cargada = _corrida_cargada("montecarlo", ("estadisticas", "n_simulaciones"),
+                                   ("datos", "especificacion", "n_simulaciones"))
+        if cargada is not None:
+            simulacion, entradas_mc = cargada
+        elif ejecutar_mc or st.session_state.get("mc_ejecutada"):
+            st.session_state["mc_ejecutada"] = True
+            trabajo = trabajo_montecarlo(id_sesion_actual(), datos, distribuciones, n_simulaciones)
+            simulacion = _resultado_trabajo(trabajo, "Simulando", "mc_ejecutada")
+            entradas_mc = {
+                "datos": datos,
+                "especificacion": montecarlo.especificacion_por_variacion(datos, distribuciones),
+                "n_simulaciones": n_simulaciones,
+            }
+        if simulacion is not None:
+            estadisticas_van = simulacion["estadisticas"]["van"]
+            percentiles_van = estadisticas_van["percentiles"]
+            
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("P(VAN < 0)", f"{simulacion['prob_van_negativo']*100:.2f}%")
+            with col2:
+                st.metric("VAN Esperado", f"S/ {estadisticas_van['media']:,.2f}")
+            with col3:
+                st.metric("VAN P5 - P95", f"S/ {percentiles_van[5]:,.0f} a {percentiles_van[95]:,.0f}")
+            with col4:
+                st.metric("P(TIR < TMAR)", f"{simulacion['prob_tir_menor_tmar']*100:.2f}%")
+            
+            conteos, bordes = figuras.reagrupar_histograma(*estadisticas_van["histograma"])
+            centros = (bordes[:-1] + bordes[1:]) / 2
+            fig_mc = cache_figuras.figura(
+                "montecarlo", lambda: _figura_montecarlo(simulacion["n_simulaciones"]),
+                [{"x": centros, "y": conteos / simulacion["n_simulaciones"],
+                  "marker_color": np.where(centros < 0, 'red', 'green')}],
+                clave=simulacion["n_simulaciones"],
+            )
+            st.plotly_chart(fig_mc, width='stretch')
+            
+            df_percentiles = pd.DataFrame({
+                'Percentil': [f"P{q}" for q in montecarlo.PERCENTILES],
+                'VAN': [percentiles_van[q] for q in montecarlo.PERCENTILES],
+                'TIR (%)': [simulacion["estadisticas"]["tir"]["percentiles"][q] * 100
+                            for q in montecarlo.PERCENTILES],
+                'Payback Descontado': [simulacion["estadisticas"]["payback_desc"]["percentiles"][q]
+                                       for q in montecarlo.PERCENTILES],
+            })
+            st.dataframe(df_percentiles.style.format({
+                'VAN': 'S/ {:,.2f}',
+                'TIR (%)': '{:.2f}%',
+                'Payback Descontado': '{:.2f} años'
+            }), width='stretch', hide_index=True)
+            
+            if simulacion["prob_sin_recuperacion"] > 0:
+                st.warning(f"⚠️ En el {simulacion['prob_sin_recuperacion']*100:.2f}% de las simulaciones "
+                           "la inversión no se recupera dentro de la vida útil")
+
+            _descargas("montecarlo",
+                       lambda: exportacion.bloques_montecarlo(entradas_mc["datos"], entradas_mc["especificacion"],
+                                                              entradas_mc["n_simulaciones"]),
+                       entradas_mc["n_simulaciones"], "simulacion_montecarlo", simulacion, **entradas_mc)
+
+        st.divider()
+        
+        # Sensibilidad bidimensional
+        st.subheader("🗺️ Sensibilidad Bidimensional")
+        st.markdown("Evalúa un indicador sobre todas las combinaciones de dos parámetros")
+        
+        etiquetas_barrido = {
+            "tmar": "TMAR",
+            "ahorro_anual": "Ahorro Anual",
+            "mantenimiento_anual": "Mantenimiento Anual",
+            "vida_util": "Vida Útil",
+            "costo_tanque": "Costo Tanque",
+            "costo_bomba": "Costo Bomba",
+            "costo_instalacion": "Costo Instalación",
+        }
+        indicadores_barrido = {"VAN": ("van", 0.0), "TIR": ("tir", tmar), "B/C": ("bc", 1.0)}
+        variables_barrido = list(etiquetas_barrido)
+        
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            var_x = st.selectbox("Eje X", variables_barrido, index=0,
+                                 format_func=etiquetas_barrido.get, key="barrido_x")
+        with col2:
+            var_y = st.selectbox("Eje Y", variables_barrido, index=1,
+                                 format_func=etiquetas_barrido.get, key="barrido_y")
+        with col3:
+            nombre_indicador = st.selectbox("Indicador", list(indicadores_barrido), key="barrido_indicador")
+        with col4:
+            variacion_barrido = st.slider("Variación (±%)", 10, 90, 50, 5, key="barrido_variacion") / 100
+        
+        superficie = None
+        cargada = _corrida_cargada("barrido", ("ejes",), ("datos", "indicadores"))
+        nombres_indicadores = {clave: nombre for nombre, (clave, _) in indicadores_barrido.items()}
+        if cargada is not None:
+            ejes = cargada[0]["ejes"]
+            indicador = cargada[1]["indicadores"][0]
+            if len(ejes) != 2 or not set(ejes) <= set(etiquetas_barrido) or indicador not in nombres_indicadores:
+                st.error("❌ La corrida cargada no es un mapa de dos parámetros de esta página")
+            else:
+                superficie, entradas_barrido = cargada
+                var_x, var_y = ejes
+                nombre_indicador = nombres_indicadores[indicador]
+                umbral = {"van": 0.0, "tir": entradas_barrido["datos"]["tmar"], "bc": 1.0}[indicador]
+        elif var_x == var_y:
+            st.warning("⚠️ Selecciona dos parámetros distintos")
+        else:
+            indicador, umbral = indicadores_barrido[nombre_indicador]
+            ejes = ejes_por_variacion(datos, [var_x, var_y], variacion_barrido)
+            entradas_barrido = {"datos": datos, "ejes": ejes, "indicadores": (indicador,)}
+            # El mapa se calcula solo; si se cancela, se retoma con el botón
+            if not st.session_state.get("barrido_activo", True):
+                if st.button("▶️ Calcular mapa de calor", key="calcular_barrido"):
+                    st.session_state["barrido_activo"] = True
+                    st.rerun()
+            else:
+                trabajo = trabajo_barrido(id_sesion_actual(), datos, ejes, (indicador,))
+                superficie = _resultado_trabajo(trabajo, "Calculando el mapa de calor", "barrido_activo")
+        
+        if superficie is not None:
+            escala_x = 100 if var_x == "tmar" else 1
+            escala_y = 100 if var_y == "tmar" else 1
+            escala_z = 100 if indicador == "tir" else 1
+            z = superficie[indicador].T * escala_z
+            
+            layout_barrido = (
+                f"{nombre_indicador} según {etiquetas_barrido[var_x]} y {etiquetas_barrido[var_y]}",
+                etiquetas_barrido[var_x] + (" (%)" if var_x == "tmar" else ""),
+                etiquetas_barrido[var_y] + (" (%)" if var_y == "tmar" else ""),
+                nombre_indicador,
+                umbral * escala_z,
+            )
+            datos_superficie = {"x": ejes[var_x] * escala_x, "y": ejes[var_y] * escala_y, "z": z}
+            fig3 = cache_figuras.figura("barrido", lambda: _figura_barrido(*layout_barrido),
+                                        [datos_superficie, datos_superficie], clave=layout_barrido)
+            st.plotly_chart(fig3, width='stretch')
+            st.caption("La línea punteada marca el umbral de decisión (VAN = 0, TIR = TMAR o B/C = 1)")
+            _descargas("barrido", lambda: exportacion.bloques_barrido(superficie), z.size,
+                       f"barrido_{var_x}_{var_y}", superficie, **entradas_barrido)
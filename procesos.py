@@ -0,0 +1,56 @@
+"""
+Grupo de procesos compartido para los cálculos en paralelo (barridos de
+parámetros y evaluación de carteras por lotes).
+Los procesos se inician con "spawn": el barrido se lanza desde los hilos de
+Streamlit y de los trabajos en segundo plano, y un fork desde un proceso con
+hilos puede heredar locks tomados por otro hilo y bloquear al hijo. Iniciar
+procesos con spawn es lento (cada uno importa NumPy), así que el grupo se
+crea con el primer uso y se reutiliza en las llamadas siguientes.
+
+El número de procesos se configura con INGECO_PROCESOS (por defecto, uno
+por procesador).
+"""
+
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+_pool = None
+_lock = threading.Lock()
+
+
+def procesos_disponibles():
+    """Número de procesos del grupo compartido"""
+    return int(os.environ.get("INGECO_PROCESOS", os.cpu_count() or 1))
+
+
+def grupo_procesos(max_procesos=None):
+    """
+    ProcessPoolExecutor compartido (contexto spawn). El primer uso lo crea con
+    `max_procesos` procesos (por defecto, `procesos_disponibles()`); los
+    siguientes lo reutilizan. Si un proceso murió y el grupo quedó roto, se
+    crea uno nuevo.
+    """
+    global _pool
+    with _lock:
+        if _pool is not None and getattr(_pool, "_broken", False):
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=max_procesos or procesos_disponibles(),
+                                        mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def cerrar():
+    """Detiene el grupo compartido; el próximo uso crea uno nuevo"""
+    global _pool
+    with _lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+atexit.register(cerrar)
@@ -0,0 +1,149 @@
+"""
+Vida económica y política óptima de reemplazo de equipos (por ejemplo, la bomba).
+El mantenimiento crece con la edad del equipo y su valor de rescate decrece.
+La vida económica es la edad de reemplazo con menor costo anual equivalente;
+la política óptima en un horizonte de planeación se obtiene por programación
+dinámica sobre (año, edad). Todas las funciones reciben una instalación por
+fila y resuelven el lote completo con operaciones de arreglos.
+"""
+
+import numpy as np
+
+import finanzas
+from cache import CacheResultados
+
+# Edad máxima que puede alcanzar un equipo antes de reemplazarlo obligatoriamente
+EDAD_MAXIMA = 30
+
+# Instalaciones resueltas a la vez por la programación dinámica
+BLOQUE_INSTALACIONES = 4096
+
+# Las tablas de valor más grandes (p. ej. las de una cartera completa) no se guardan
+ELEMENTOS_TABLA_MAXIMOS = 1 << 18
+
+_tablas_valor = CacheResultados(max_entradas=64)
+
+
+def curvas_geometricas(costo, mantenimiento_inicial, crecimiento, depreciacion, edad_maxima=EDAD_MAXIMA):
+    """
+    Curvas por edad de un lote de equipos: el mantenimiento del año de edad
+    a (a = 1..edad_maxima) crece a `crecimiento` anual desde
+    `mantenimiento_inicial`, y el rescate a la edad a (a = 0..edad_maxima)
+    se deprecia a `depreciacion` anual (saldo decreciente) desde `costo`.
+    Retorna (mantenimiento, rescate) con una fila por equipo.
+    """
+    costo, inicial, crecimiento, depreciacion = (
+        np.atleast_1d(x).astype(float)[:, None] for x in np.broadcast_arrays(
+            costo, mantenimiento_inicial, crecimiento, depreciacion,
+        )
+    )
+    edades = np.arange(edad_maxima + 1)
+    mantenimiento = inicial * (1.0 + crecimiento) ** edades[:-1]
+    rescate = costo * (1.0 - depreciacion) ** edades
+    return mantenimiento, rescate
+
+
+def _preparar(costo, mantenimiento, rescate, tasa):
+    mantenimiento = np.atleast_2d(np.asarray(mantenimiento, dtype=float))
+    filas = mantenimiento.shape[0]
+    rescate = np.broadcast_to(np.atleast_2d(np.asarray(rescate, dtype=float)),
+                              (filas, mantenimiento.shape[1] + 1))
+    costo = np.broadcast_to(np.asarray(costo, dtype=float), (filas,))
+    tasa = np.broadcast_to(np.asarray(tasa, dtype=float), (filas,))
+    return costo, mantenimiento, rescate, tasa
+
+
+def vida_economica(costo, mantenimiento, rescate, tasa):
+    """
+    Vida económica de cada equipo: para cada edad de reemplazo L se calcula
+    el costo anual equivalente de comprar, mantener L años y vender al
+    rescate de la edad L, y se elige el menor. `mantenimiento` (equipos x
+    edades 1..E) y `rescate` (equipos x edades 0..E) son como los de
+    `curvas_geometricas`. Retorna {"vida_economica", "costo_anual",
+    "costo_anual_por_vida"}.
+    """
+    costo, mantenimiento, rescate, tasa = _preparar(costo, mantenimiento, rescate, tasa)
+    edades = mantenimiento.shape[1]
+    tabla = finanzas.tabla_descuento(tasa, edades)
+    factores = tabla.factores
+
+    # Valor presente de poseer el equipo L años, para L = 1..E
+    valor_presente = (costo[:, None] + np.cumsum(mantenimiento * factores, axis=1)
+                      - rescate[:, 1:] * factores)
+    costo_anual = valor_presente / tabla.acumulados
+    indice = np.argmin(costo_anual, axis=1)
+    return {
+        "vida_economica": indice + 1,
+        "costo_anual": np.take_along_axis(costo_anual, indice[:, None], axis=1)[:, 0],
+        "costo_anual_por_vida": costo_anual,
+    }
+
+
+def _resolver_tabla(costo, mantenimiento, rescate, tasa, horizonte):
+    """
+    Programación dinámica hacia atrás. V(t, a) es el costo presente mínimo
+    desde el inicio del año t con un equipo de edad a; al final del
+    horizonte el equipo se vende a su rescate. En cada año se decide
+    mantener (la edad pasa a a + 1) o reemplazar (se vende al rescate de la
+    edad a y se compra uno nuevo). Retorna (V(0, ·), decisiones), con
+    decisiones[t, i, a] True si conviene reemplazar.
+    """
+    filas, edades = mantenimiento.shape
+    descuento = 1.0 / (1.0 + tasa[:, None])
+    valor = -rescate
+    decisiones = np.empty((horizonte, filas, edades + 1), dtype=bool)
+    mantener = np.empty((filas, edades + 1))
+    mantener[:, -1] = np.inf
+    for t in range(horizonte - 1, -1, -1):
+        mantener[:, :-1] = descuento * (mantenimiento + valor[:, 1:])
+        reemplazar = (costo[:, None] - rescate) + descuento * (mantenimiento[:, :1] + valor[:, 1:2])
+        decisiones[t] = reemplazar < mantener
+        valor = np.where(decisiones[t], reemplazar, mantener)
+    return valor, decisiones
+
+
+def tabla_valor(costo, mantenimiento, rescate, tasa, horizonte):
+    """
+    Tabla de valor y decisiones de `_resolver_tabla`, reutilizada desde una
+    caché LRU mientras el tamaño lo permita: políticas desde distintas
+    edades iniciales con los mismos equipos comparten la misma tabla.
+    """
+    costo, mantenimiento, rescate, tasa = _preparar(costo, mantenimiento, rescate, tasa)
+    if mantenimiento.size * horizonte > ELEMENTOS_TABLA_MAXIMOS:
+        return _resolver_tabla(costo, mantenimiento, rescate, tasa, horizonte)
+    clave = (int(horizonte), mantenimiento.shape, costo.tobytes(), mantenimiento.tobytes(),
+             np.ascontiguousarray(rescate).tobytes(), tasa.tobytes())
+    return _tablas_valor.obtener_o_calcular(clave, _resolver_tabla, costo, mantenimiento, rescate, tasa,
+                                            int(horizonte))
+
+
+def politica_reemplazo(costo, mantenimiento, rescate, tasa, horizonte, edad_inicial=0):
+    """
+    Política óptima de reemplazo de cada equipo durante `horizonte` años a
+    partir de `edad_inicial` (0 = recién comprado). Retorna
+    {"costo_presente", "reemplazos", "edades"}: el costo presente mínimo, si
+    se reemplaza al inicio de cada año y la edad del equipo al final de cada
+    año (equipos x años). Los lotes grandes se resuelven por bloques.
+    """
+    costo, mantenimiento, rescate, tasa = _preparar(costo, mantenimiento, rescate, tasa)
+    filas, edades = mantenimiento.shape
+    edad = np.broadcast_to(np.asarray(edad_inicial, dtype=int), (filas,)).copy()
+    if np.any((edad < 0) | (edad > edades)):
+        raise ValueError(f"La edad inicial debe estar entre 0 y {edades}")
+
+    costo_presente = np.empty(filas)
+    reemplazos = np.zeros((filas, horizonte), dtype=bool)
+    edades_fin = np.empty((filas, horizonte), dtype=int)
+    for inicio in range(0, filas, BLOQUE_INSTALACIONES):
+        bloque = slice(inicio, inicio + BLOQUE_INSTALACIONES)
+        valor, decisiones = tabla_valor(costo[bloque], mantenimiento[bloque], rescate[bloque],
+                                        tasa[bloque], horizonte)
+        actual = edad[bloque]
+        indices = np.arange(actual.size)
+        costo_presente[bloque] = valor[indices, actual]
+        for t in range(horizonte):
+            reemplaza = decisiones[t, indices, actual]
+            reemplazos[bloque, t] = reemplaza
+            actual = np.where(reemplaza, 1, actual + 1)
+            edades_fin[bloque, t] = actual
+    return {"costo_presente": costo_presente, "reemplazos": reemplazos, "edades": edades_fin}
@@ -0,0 +1,178 @@
+"""
+Almacenes de respaldo de datos por sesión.
+Cada sesión de Streamlit guarda su respaldo bajo su propio id, de modo que
+las sesiones concurrentes nunca se mezclan. Las sesiones inactivas se
+eliminan automáticamente.
+"""
+
+import json
+import os
+from abc import ABC, abstractmethod
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+# Segundos sin actividad tras los cuales se descarta el respaldo de una sesión
+INACTIVIDAD_MAXIMA = 6 * 3600
+
+
+def id_sesion_actual():
+    """Id de la sesión de Streamlit en curso ("local" fuera de Streamlit)"""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        contexto = get_script_run_ctx()
+    except ImportError:
+        contexto = None
+    return contexto.session_id if contexto is not None else "local"
+
+
+class AlmacenSesiones(ABC):
+    """Interfaz común de los almacenes de respaldo por sesión"""
+
+    @abstractmethod
+    def guardar(self, id_sesion, datos):
+        """Guarda (o reemplaza) el respaldo de la sesión"""
+
+    @abstractmethod
+    def cargar(self, id_sesion):
+        """Retorna el respaldo de la sesión o None si no existe"""
+
+    @abstractmethod
+    def eliminar(self, id_sesion):
+        """Elimina el respaldo de la sesión si existe"""
+
+    @abstractmethod
+    def purgar_inactivas(self):
+        """Elimina los respaldos de sesiones inactivas y retorna cuántos fueron"""
+
+
+class AlmacenMemoria(AlmacenSesiones):
+    """
+    Respaldo en memoria protegido por un lock.
+    Las sesiones se mantienen ordenadas por último acceso, así que guardar,
+    cargar y purgar las inactivas cuestan O(1) amortizado.
+    """
+
+    def __init__(self, inactividad_maxima=INACTIVIDAD_MAXIMA):
+        self.inactividad_maxima = inactividad_maxima
+        self._sesiones = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _purgar(self, ahora):
+        eliminadas = 0
+        while self._sesiones:
+            id_sesion, (acceso, _) = next(iter(self._sesiones.items()))
+            if ahora - acceso <= self.inactividad_maxima:
+                break
+            del self._sesiones[id_sesion]
+            eliminadas += 1
+        return eliminadas
+
+    def guardar(self, id_sesion, datos):
+        ahora = time.monotonic()
+        with self._lock:
+            self._sesiones[id_sesion] = (ahora, dict(datos))
+            self._sesiones.move_to_end(id_sesion)
+            self._purgar(ahora)
+
+    def cargar(self, id_sesion):
+        ahora = time.monotonic()
+        with self._lock:
+            self._purgar(ahora)
+            entrada = self._sesiones.get(id_sesion)
+            if entrada is None:
+                return None
+            self._sesiones[id_sesion] = (ahora, entrada[1])
+            self._sesiones.move_to_end(id_sesion)
+            return dict(entrada[1])
+
+    def eliminar(self, id_sesion):
+        with self._lock:
+            self._sesiones.pop(id_sesion, None)
+
+    def purgar_inactivas(self):
+        with self._lock:
+            return self._purgar(time.monotonic())
+
+    def __len__(self):
+        return len(self._sesiones)
+
+
+class AlmacenSQLite(AlmacenSesiones):
+    """
+    Respaldo persistente en SQLite, compartible entre procesos.
+    La purga de sesiones inactivas se hace cada cierto número de escrituras.
+    """
+
+    def __init__(self, ruta, inactividad_maxima=INACTIVIDAD_MAXIMA, purgar_cada=100):
+        self.ruta = ruta
+        self.inactividad_maxima = inactividad_maxima
+        self.purgar_cada = purgar_cada
+        self._escrituras = 0
+        self._lock = threading.Lock()
+        self._conexion = sqlite3.connect(ruta, check_same_thread=False, timeout=10)
+        with self._conexion:
+            self._conexion.execute("PRAGMA journal_mode=WAL")
+            self._conexion.execute(
+                "CREATE TABLE IF NOT EXISTS sesiones ("
+                "id TEXT PRIMARY KEY, datos TEXT NOT NULL, actualizado REAL NOT NULL)"
+            )
+            self._conexion.execute(
+                "CREATE INDEX IF NOT EXISTS idx_sesiones_actualizado ON sesiones (actualizado)"
+            )
+
+    def guardar(self, id_sesion, datos):
+        with self._lock, self._conexion:
+            self._conexion.execute(
+                "INSERT OR REPLACE INTO sesiones (id, datos, actualizado) VALUES (?, ?, ?)",
+                (id_sesion, json.dumps(datos), time.time()),
+            )
+            self._escrituras += 1
+            if self._escrituras % self.purgar_cada == 0:
+                self._purgar()
+
+    def cargar(self, id_sesion):
+        with self._lock, self._conexion:
+            fila = self._conexion.execute(
+                "SELECT datos, actualizado FROM sesiones WHERE id = ?", (id_sesion,)
+            ).fetchone()
+            if fila is None:
+                return None
+            ahora = time.time()
+            if ahora - fila[1] > self.inactividad_maxima:
+                self._conexion.execute("DELETE FROM sesiones WHERE id = ?", (id_sesion,))
+                return None
+            self._conexion.execute(
+                "UPDATE sesiones SET actualizado = ? WHERE id = ?", (ahora, id_sesion)
+            )
+            return json.loads(fila[0])
+
+    def eliminar(self, id_sesion):
+        with self._lock, self._conexion:
+            self._conexion.execute("DELETE FROM sesiones WHERE id = ?", (id_sesion,))
+
+    def _purgar(self):
+        limite = time.time() - self.inactividad_maxima
+        return self._conexion.execute(
+            "DELETE FROM sesiones WHERE actualizado < ?", (limite,)
+        ).rowcount
+
+    def purgar_inactivas(self):
+        with self._lock, self._conexion:
+            return self._purgar()
+
+
+def crear_almacen():
+    """
+    Crea el almacén configurado en la variable INGECO_ALMACEN_SESIONES:
+    "memoria" (por defecto) o "sqlite:<ruta>".
+    """
+    configuracion = os.environ.get("INGECO_ALMACEN_SESIONES", "memoria")
+    if configuracion.startswith("sqlite:"):
+        return AlmacenSQLite(configuracion[len("sqlite:"):])
+    return AlmacenMemoria()
+
+
+# Instancia compartida por todas las sesiones del proceso
+almacen_sesiones = crear_almacen()
@@ -0,0 +1,57 @@
+"""Barrido de parámetros: valores por punto, avance y cancelación"""
+
+import numpy as np
+import pytest
+
+import barrido
+import finanzas
+import modelo
+import procesos
+
+
+@pytest.fixture
+def base():
+    return modelo.Proyecto().como_dict()
+
+
+def test_barrido_como_evaluacion_por_punto(base):
+    ejes = {"tmar": [0.05, 0.1, 0.2], "ahorro_anual": [400.0, 700.0]}
+    resultado = barrido.barrido(base, ejes, ("van", "tir"), max_workers=1)
+    assert resultado["van"].shape == (3, 2)
+    for i, tmar in enumerate(ejes["tmar"]):
+        for j, ahorro in enumerate(ejes["ahorro_anual"]):
+            flujos = [ahorro - base["mantenimiento_anual"]] * base["vida_util"]
+            assert resultado["van"][i, j] == pytest.approx(
+                finanzas.calcular_van(base["inversion_inicial"], flujos, tmar), rel=1e-5)
+            assert resultado["tir"][i, j] == pytest.approx(
+                finanzas.calcular_tir(base["inversion_inicial"], flujos), rel=1e-5)
+
+
+def test_barrido_reporta_avance_y_se_cancela(base):
+    avances = []
+
+    def progreso(fraccion):
+        avances.append(fraccion)
+        return len(avances) < 2
+
+    ejes = {"tmar": np.linspace(0.01, 0.3, 100), "ahorro_anual": np.linspace(100.0, 1000.0, 50)}
+    resultado = barrido.barrido(base, ejes, ("van",), max_workers=1, tamano_bloque=1_000, progreso=progreso)
+    assert avances == [0.2, 0.4]
+    plano = resultado["van"].ravel()
+    assert np.isfinite(plano[:2_000]).all() and np.isnan(plano[2_000:]).all()
+
+
+def test_barrido_en_paralelo_reutiliza_el_grupo(base):
+    ejes = {"tmar": np.linspace(0.01, 0.3, 500), "ahorro_anual": np.linspace(100.0, 1000.0, 500)}
+    secuencial = barrido.barrido(base, ejes, ("van", "tir"), max_workers=1)
+    try:
+        paralelo = barrido.barrido(base, ejes, ("van", "tir"), max_workers=2)
+        pool = procesos.grupo_procesos()
+        assert pool._mp_context.get_start_method() == "spawn"
+        otra = barrido.barrido(base, ejes, ("van",), max_workers=2)
+        assert procesos.grupo_procesos() is pool
+    finally:
+        procesos.cerrar()
+    for indicador in ("van", "tir"):
+        np.testing.assert_array_equal(paralelo[indicador], secuencial[indicador])
+    np.testing.assert_array_equal(otra["van"], secuencial["van"])
@@ -0,0 +1,43 @@
+"""Horas sin servicio y ahorro equivalente de la simulación de cortes"""
+
+import numpy as np
+import pytest
+
+import cortes
+import finanzas
+
+
+def test_horas_sin_servicio_une_intervalos():
+    # Cortes superpuestos en el día 0 y uno que cruza del día 1 al 2
+    inicios = np.array([2.0, 5.0, 30.0, 46.0])
+    fines = np.array([8.0, 10.0, 31.0, 52.0])
+    np.testing.assert_allclose(cortes.horas_sin_servicio(inicios, fines, 3), [8.0, 3.0, 4.0])
+    np.testing.assert_allclose(cortes.horas_sin_servicio(np.array([]), np.array([]), 2), [0.0, 0.0])
+
+
+def test_ahorro_equivalente():
+    ahorro = np.arange(1.0, 18.0)[None, :]
+    equivalente = cortes.ahorro_equivalente(ahorro, 8, 0.1)
+    assert equivalente.shape == (1, 2)
+    for periodo in range(2):
+        vidas = ahorro[0, periodo * 8:(periodo + 1) * 8]
+        van = finanzas.calcular_van(0.0, vidas.tolist(), 0.1)
+        assert equivalente[0, periodo] == pytest.approx(finanzas.calcular_vae(van, 0.1, 8))
+
+
+def test_ahorro_equivalente_sin_vidas_completas():
+    assert cortes.ahorro_equivalente(np.ones((3, 5)), 8, 0.1).shape == (3, 0)
+    with pytest.raises(ValueError):
+        cortes.ahorro_equivalente(np.ones((1, 5)), 0, 0.1)
+
+
+def test_simular_cortes_se_puede_cancelar():
+    avances = []
+
+    def progreso(fraccion):
+        avances.append(fraccion)
+        return False
+
+    resultado = cortes.simular_cortes(1100.0, 600.0, 35.0, 4.0, 12.0, anios=1_000, semilla=1, progreso=progreso)
+    assert len(avances) == 1
+    assert 0 < resultado["ahorro_anual"].shape[1] < 1_000
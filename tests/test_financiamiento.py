@@ -0,0 +1,102 @@
+"""Cronogramas de amortización frente a un recorrido mes a mes y proyectos financiados"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import evaluacion
+import financiamiento
+import finanzas
+from financiamiento import ALEMAN, AMERICANO, FRANCES
+from flujo_caja import FlujoCaja
+from modelo import Proyecto
+
+
+def cronograma_iterativo(principal, tasa, plazo, sistema):
+    if sistema == FRANCES:
+        cuota = principal / plazo if tasa == 0 else principal * tasa / (1 - (1 + tasa) ** -plazo)
+    saldo = principal
+    filas = []
+    for mes in range(1, plazo + 1):
+        interes = saldo * tasa
+        if sistema == FRANCES:
+            amortizacion = cuota - interes
+        elif sistema == ALEMAN:
+            amortizacion = principal / plazo
+        else:
+            amortizacion = principal if mes == plazo else 0.0
+        saldo -= amortizacion
+        filas.append((interes + amortizacion, interes, amortizacion, saldo))
+    return np.array(filas).T
+
+
+@pytest.mark.parametrize("sistema", [FRANCES, ALEMAN, AMERICANO])
+@pytest.mark.parametrize("tasa", [0.0, 0.01, 0.035])
+def test_tabla_como_recorrido_mensual(sistema, tasa):
+    tabla = financiamiento.tabla_amortizacion(10_000.0, tasa, 24, sistema)
+    esperado = cronograma_iterativo(10_000.0, tasa, 24, sistema)
+    for fila, nombre in enumerate(("cuota", "interes", "amortizacion", "saldo")):
+        np.testing.assert_allclose(tabla[nombre][0], esperado[fila], atol=1e-8)
+    assert tabla["amortizacion"][0].sum() == pytest.approx(10_000.0)
+
+
+def test_lote_con_plazos_distintos():
+    plazos = np.array([6, 12, 36])
+    tabla = financiamiento.tabla_amortizacion(5_000.0, 0.02, plazos, financiamiento.SISTEMAS)
+    assert tabla["cuota"].shape == (3, 36)
+    for sistema, plazo in enumerate(plazos):
+        esperado = cronograma_iterativo(5_000.0, 0.02, plazo, sistema)
+        np.testing.assert_allclose(tabla["cuota"][sistema, :plazo], esperado[0])
+        assert not tabla["cuota"][sistema, plazo:].any()
+        assert tabla["saldo"][sistema, plazo - 1] == pytest.approx(0.0, abs=1e-8)
+
+
+def test_sistema_desconocido():
+    with pytest.raises(ValueError):
+        financiamiento.tabla_amortizacion(1_000.0, 0.01, 12, "Italiano")
+
+
+def test_agrupar_meses():
+    mensual = np.arange(1.0, 31.0)
+    anual = financiamiento.agrupar_meses(mensual, 1, periodos=4)
+    np.testing.assert_allclose(anual[0], [mensual[:12].sum(), mensual[12:24].sum(), mensual[24:].sum(), 0.0])
+    assert financiamiento.agrupar_meses(mensual, 4).shape == (1, 10)
+
+
+def test_flujos_financiados():
+    flujo_caja = FlujoCaja.desde_reglas(700.0, 100.0, 5)
+    tasa = financiamiento.tasa_mensual(0.12, 12)
+    aporte, financiado = financiamiento.flujos_financiados(flujo_caja, 1_750.0, 1_000.0, 0.12, 12, 24)
+    servicio = cronograma_iterativo(1_000.0, float(tasa), 24, FRANCES)[0]
+    assert aporte == pytest.approx(750.0)
+    np.testing.assert_allclose(flujo_caja.netos()[0] - financiado.netos()[0],
+                               [servicio[:12].sum(), servicio[12:].sum(), 0.0, 0.0, 0.0])
+
+
+def test_proyecto_financiado_en_parte():
+    proyecto = Proyecto(financiado=True, porcentaje_financiado=60.0)
+    resultados = evaluacion.evaluar_proyecto(proyecto.como_dict())
+    assert resultados.aporte_propio == pytest.approx(0.4 * proyecto.inversion_inicial)
+    assert not resultados.sin_aporte
+
+    tasa = float(financiamiento.tasa_mensual(0.12, 12))
+    servicio = cronograma_iterativo(0.6 * proyecto.inversion_inicial, tasa, 24, FRANCES)[0]
+    flujos = [proyecto.flujo_neto_anual - servicio[:12].sum(), proyecto.flujo_neto_anual - servicio[12:].sum()]
+    flujos += [proyecto.flujo_neto_anual] * (proyecto.vida_util - 2)
+    assert resultados.van == pytest.approx(finanzas.calcular_van(resultados.aporte_propio, flujos, proyecto.tmar))
+    assert resultados.tir == pytest.approx(finanzas.calcular_tir(resultados.aporte_propio, flujos))
+    decision = evaluacion.veredicto(resultados, proyecto.tmar, proyecto.vida_util)
+    assert decision["total_criterios"] == 4
+
+
+def test_sin_aporte_la_tir_y_el_payback_no_aplican():
+    proyecto = Proyecto(financiado=True, porcentaje_financiado=100.0)
+    resultados = evaluacion.evaluar_proyecto(proyecto.como_dict())
+    assert resultados.aporte_propio == 0 and resultados.sin_aporte
+    decision = evaluacion.veredicto(resultados, proyecto.tmar, proyecto.vida_util)
+    assert decision["criterios"]["tir"] is None and decision["criterios"]["payback"] is None
+    assert decision["total_criterios"] == 2
+
+    ofertas = pd.DataFrame({"tasa_nominal": [12.0], "periodos_capitalizacion": [12],
+                            "plazo_meses": [24], "sistema_amortizacion": [FRANCES]})
+    assert np.isnan(evaluacion.comparar_ofertas(proyecto.como_dict(), ofertas)["tir"]).all()
@@ -0,0 +1,106 @@
+"""
+Paridad del núcleo vectorizado de finanzas con las fórmulas escalares que
+usaba app.py (bucles por período y numpy_financial para la TIR).
+"""
+
+import numpy as np
+import numpy_financial as npf
+import pytest
+
+import finanzas
+
+
+def van_escalar(inversion_inicial, flujos_netos, tasa):
+    van = -inversion_inicial
+    for i, flujo in enumerate(flujos_netos):
+        van += flujo / ((1 + tasa) ** (i + 1))
+    return van
+
+
+def bc_escalar(beneficios, costos, tasa, n):
+    vp_beneficios = sum(beneficios / ((1 + tasa) ** (i + 1)) for i in range(n))
+    vp_costos = sum(costos / ((1 + tasa) ** (i + 1)) for i in range(n))
+    return vp_beneficios / vp_costos if vp_costos != 0 else 0
+
+
+def payback_escalar(inversion_inicial, flujos_netos, tasa=None):
+    acumulado = 0
+    for i, flujo in enumerate(flujos_netos):
+        if tasa is not None:
+            flujo = flujo / ((1 + tasa) ** (i + 1))
+        acumulado += flujo
+        if acumulado >= inversion_inicial:
+            if flujo == 0:
+                return i + 1
+            return i + 1 + (inversion_inicial - (acumulado - flujo)) / flujo
+    return None
+
+
+@pytest.fixture
+def proyectos():
+    rng = np.random.default_rng(7)
+    return [
+        (float(rng.uniform(500, 5000)), rng.uniform(-200, 1500, int(rng.integers(1, 25))).tolist(),
+         float(rng.uniform(0.0, 0.3)))
+        for _ in range(200)
+    ]
+
+
+def test_van(proyectos):
+    for inversion, flujos, tasa in proyectos:
+        assert finanzas.calcular_van(inversion, flujos, tasa) == pytest.approx(van_escalar(inversion, flujos, tasa))
+
+
+def test_van_lote_por_tasas():
+    tasas = np.linspace(0.0, 0.25, 11)
+    flujos = [300.0, 500.0, 800.0, 200.0]
+    esperado = [van_escalar(1000.0, flujos, tasa) for tasa in tasas]
+    np.testing.assert_allclose(finanzas.van_lote(1000.0, flujos, tasas), esperado)
+
+
+def test_vae():
+    for tasa, n in [(0.1, 8), (0.0, 5), (0.25, 1)]:
+        esperado = 1000.0 / n if tasa == 0 else 1000.0 * (tasa * (1 + tasa) ** n) / ((1 + tasa) ** n - 1)
+        assert finanzas.calcular_vae(1000.0, tasa, n) == pytest.approx(esperado)
+
+
+def test_tir_como_numpy_financial(proyectos):
+    for inversion, flujos, _ in proyectos:
+        esperado = npf.irr([-inversion] + flujos)
+        tir = finanzas.calcular_tir(inversion, flujos)
+        if np.isnan(esperado):
+            assert np.isnan(tir) or van_escalar(inversion, flujos, tir) == pytest.approx(0.0, abs=1e-6)
+        else:
+            assert tir == pytest.approx(esperado, abs=1e-8)
+
+
+@pytest.mark.parametrize("inversion, flujo, n", [(1750.0, 600.0, 8), (1000.0, 100.0, 5), (500.0, 5000.0, 3)])
+def test_tir_anualidad(inversion, flujo, n):
+    assert finanzas.calcular_tir(inversion, [flujo] * n) == pytest.approx(npf.irr([-inversion] + [flujo] * n))
+
+
+def test_tir_inversion_negativa():
+    # Fuera del rango de la forma cerrada (I > 0, A > 0) se usa el solucionador general
+    flujos = [-300.0] * 5
+    tir = finanzas.calcular_tir(-1000.0, flujos)
+    assert tir == pytest.approx(npf.irr([1000.0] + flujos))
+
+
+def test_tir_menor_a_menos_99_por_ciento():
+    flujos = [0.001, 0.001]
+    tir = finanzas.calcular_tir(1000.0, flujos)
+    assert tir < -0.99
+    assert van_escalar(1000.0, flujos, tir) == pytest.approx(0.0, abs=1e-6)
+
+
+def test_bc():
+    for beneficios, costos, tasa, n in [(700.0, 100.0, 0.1, 8), (50.0, 80.0, 0.0, 3), (10.0, 0.0, 0.05, 4)]:
+        assert finanzas.calcular_bc(beneficios, costos, tasa, n) == pytest.approx(
+            bc_escalar(beneficios, costos, tasa, n))
+
+
+def test_payback(proyectos):
+    for inversion, flujos, tasa in proyectos:
+        assert finanzas.calcular_payback(inversion, flujos) == pytest.approx(payback_escalar(inversion, flujos))
+        assert finanzas.calcular_payback_descontado(inversion, flujos, tasa) == pytest.approx(
+            payback_escalar(inversion, flujos, tasa))
@@ -0,0 +1,31 @@
+"""Conversión de datos a Proyecto y de lotes de proyectos a columnas"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import modelo
+from modelo import Proyecto
+
+
+def test_desde_dict_convierte_tipos():
+    proyecto = Proyecto.desde_dict({"vida_util": 10.0, "plazo_meses": "36", "tmar": 0.12, "costo_tanque": 800})
+    assert proyecto.vida_util == 10 and isinstance(proyecto.vida_util, int)
+    assert proyecto.plazo_meses == 36
+    assert proyecto.tmar_porcentaje == pytest.approx(12.0)
+    assert proyecto == Proyecto.desde_dict(proyecto.como_dict())
+
+
+@pytest.mark.parametrize("valor", [7.9, float("nan"), "7.5"])
+def test_desde_dict_rechaza_enteros_con_decimales(valor):
+    with pytest.raises(ValueError, match="vida_util"):
+        Proyecto.desde_dict({"vida_util": valor})
+
+
+def test_columnas_ida_y_vuelta():
+    proyectos = [Proyecto(), Proyecto(vida_util=12, financiado=True, sistema_amortizacion="Alemán")]
+    columnas = modelo.columnas(proyectos)
+    np.testing.assert_allclose(columnas["inversion_inicial"], [1750.0, 1750.0])
+    assert modelo.proyectos_desde_columnas(columnas) == proyectos
+    with pytest.raises(ValueError, match="vida_util"):
+        modelo.proyectos_desde_columnas(pd.DataFrame({"vida_util": [8.0, 8.5]}))
@@ -0,0 +1,49 @@
+"""Barrido de prefijos del nivel del tanque frente a la recurrencia hora a hora"""
+
+import numpy as np
+import pytest
+
+import simulacion_energia
+
+
+def niveles_iterativo(aporte, capacidad, inicial):
+    nivel = np.empty_like(aporte)
+    for fila in range(aporte.shape[0]):
+        actual = inicial[fila]
+        for hora in range(aporte.shape[1]):
+            actual = min(max(actual + aporte[fila, hora], 0.0), capacidad[fila])
+            nivel[fila, hora] = actual
+    return nivel
+
+
+@pytest.mark.parametrize("horas", [1, 23, 24, 25, 24 * 9 + 7])
+def test_niveles_como_recurrencia(horas):
+    rng = np.random.default_rng(horas)
+    capacidad = rng.uniform(100.0, 2000.0, 6)
+    inicial = rng.uniform(0.0, 1.0, 6) * capacidad
+    aporte = rng.normal(0.0, 300.0, (6, horas))
+    np.testing.assert_allclose(simulacion_energia.niveles(aporte, capacidad, inicial),
+                               niveles_iterativo(aporte, capacidad, inicial), atol=1e-9)
+
+
+def test_simular_por_bloques_de_configuraciones():
+    # Más configuraciones de las que caben en un bloque de ELEMENTOS_BLOQUE
+    dias = 30
+    demanda = simulacion_energia.perfil_demanda(600.0, dias=dias)
+    tarifa = simulacion_energia.horario(simulacion_energia.tarifa_por_franjas(), dias=dias)
+    suministro = simulacion_energia.horario(simulacion_energia.mascara_horas(6, 14), dias=dias)
+    capacidades = np.linspace(100.0, 3000.0, simulacion_energia.ELEMENTOS_BLOQUE // demanda.size + 50)
+    lote = simulacion_energia.simular(demanda, capacidades, 35.0, 0.5, tarifa, suministro, valor_agua=6.0)
+    for i in (0, len(capacidades) // 2, len(capacidades) - 1):
+        individual = simulacion_energia.simular(demanda, capacidades[i], 35.0, 0.5, tarifa, suministro,
+                                                valor_agua=6.0)
+        for clave in ("energia_kwh", "costo_energia", "demanda_no_atendida", "nivel_final", "ahorro_anual"):
+            assert lote[clave][i] == pytest.approx(individual[clave][0])
+
+
+def test_simular_sin_bombeo_no_consume_energia():
+    demanda = simulacion_energia.perfil_demanda(600.0, dias=30)
+    tarifa = simulacion_energia.horario(simulacion_energia.tarifa_por_franjas(), dias=30)
+    resultado = simulacion_energia.simular(demanda, 1100.0, 35.0, 0.5, tarifa, bombeo_permitido=False)
+    assert resultado["energia_kwh"][0] == 0.0
+    assert resultado["nivel_final"][0] == 0.0
@@ -0,0 +1,127 @@
+"""Trabajos en segundo plano: resultado en caché, trabajos compartidos y cancelación"""
+
+import threading
+import time
+
+import pytest
+
+from cache import CacheResultados
+from trabajos import CANCELADO, ERROR, TERMINADO, GestorTrabajos
+
+
+def esperar(condicion, limite=5.0):
+    fin = time.monotonic() + limite
+    while not condicion():
+        assert time.monotonic() < fin, "el trabajo no terminó a tiempo"
+        time.sleep(0.01)
+
+
+def hasta_liberar(liberar, progreso):
+    """Reporta avance hasta que se libera (retorna 'listo') o se cancela (retorna 'parcial')"""
+    while not liberar.is_set():
+        if progreso(0.5) is False:
+            return "parcial"
+        time.sleep(0.005)
+    return "listo"
+
+
+@pytest.fixture
+def gestor():
+    gestor = GestorTrabajos(max_hilos=2, cache=CacheResultados())
+    yield gestor
+    gestor.cerrar()
+
+
+def test_resultado_queda_en_cache(gestor):
+    liberar = threading.Event()
+    trabajo = gestor.enviar("a", "simulacion", "clave", hasta_liberar, liberar)
+    esperar(lambda: trabajo.progreso == 0.5)
+    liberar.set()
+    esperar(lambda: trabajo.finalizado)
+    assert (trabajo.estado, trabajo.resultado, trabajo.progreso) == (TERMINADO, "listo", 1.0)
+    assert gestor.cache.obtener("clave") == (True, "listo")
+
+    # Con el resultado en caché no se vuelve a ejecutar
+    otro = GestorTrabajos(max_hilos=1, cache=gestor.cache)
+    repetido = otro.enviar("b", "simulacion", "clave", pytest.fail)
+    assert repetido.estado == TERMINADO and repetido.resultado == "listo"
+    assert otro.metricas()["enviados"] == 0
+
+
+def test_sesiones_con_las_mismas_entradas_comparten_el_trabajo(gestor):
+    liberar = threading.Event()
+    primero = gestor.enviar("a", "simulacion", "clave", hasta_liberar, liberar)
+    segundo = gestor.enviar("b", "simulacion", "clave", hasta_liberar, liberar)
+    assert segundo is primero
+    assert gestor.metricas()["enviados"] == 1 and gestor.metricas()["reutilizados"] == 1
+
+    # Si una sesión cancela, el trabajo sigue para la otra
+    assert gestor.cancelar("a", "simulacion")
+    assert not primero.cancelado
+    liberar.set()
+    esperar(lambda: primero.finalizado)
+    assert primero.estado == TERMINADO
+    assert gestor.de_sesion("a", "simulacion") is None
+    assert gestor.de_sesion("b", "simulacion") is primero
+
+
+def test_cancelar_detiene_el_trabajo_y_no_guarda_el_parcial(gestor):
+    liberar = threading.Event()
+    trabajo = gestor.enviar("a", "simulacion", "clave", hasta_liberar, liberar)
+    esperar(lambda: trabajo.progreso == 0.5)
+    assert gestor.cancelar("a", "simulacion")
+    esperar(lambda: trabajo.finalizado)
+    assert trabajo.estado == CANCELADO and trabajo.resultado is None
+    assert gestor.cache.obtener("clave") == (False, None)
+    assert gestor.trabajo(trabajo.id) is None
+    assert gestor.metricas()["cancelados"] == 1
+
+
+def test_nuevas_entradas_cancelan_el_trabajo_anterior(gestor):
+    liberar = threading.Event()
+    anterior = gestor.enviar("a", "simulacion", "clave_1", hasta_liberar, liberar)
+    nuevo = gestor.enviar("a", "simulacion", "clave_2", hasta_liberar, liberar)
+    assert nuevo is not anterior and anterior.cancelado
+    liberar.set()
+    esperar(lambda: anterior.finalizado and nuevo.finalizado)
+    assert anterior.estado == CANCELADO and nuevo.estado == TERMINADO
+
+
+def test_error_no_se_repite_con_las_mismas_entradas(gestor):
+    llamadas = []
+
+    def fallar(progreso):
+        llamadas.append(1)
+        raise ValueError("entrada inválida")
+
+    trabajo = gestor.enviar("a", "simulacion", "clave", fallar)
+    esperar(lambda: trabajo.finalizado)
+    assert trabajo.estado == ERROR and isinstance(trabajo.error, ValueError)
+    assert gestor.cache.obtener("clave") == (False, None)
+
+    # Los reruns siguientes reciben el mismo trabajo con error, sin ejecutarlo otra vez
+    repetido = gestor.enviar("a", "simulacion", "clave", fallar)
+    assert repetido is trabajo and repetido.estado == ERROR
+    assert gestor.enviar("b", "simulacion", "clave", fallar) is trabajo
+    time.sleep(0.05)
+    assert len(llamadas) == 1
+
+
+def test_reintentar_vuelve_a_ejecutar(gestor):
+    intentos = []
+
+    def fallar_una_vez(progreso):
+        intentos.append(1)
+        if len(intentos) == 1:
+            raise ValueError("falla transitoria")
+        return "listo"
+
+    trabajo = gestor.enviar("a", "simulacion", "clave", fallar_una_vez)
+    esperar(lambda: trabajo.finalizado)
+    assert not gestor.reintentar("b", "simulacion")
+    assert gestor.reintentar("a", "simulacion")
+    nuevo = gestor.enviar("a", "simulacion", "clave", fallar_una_vez)
+    assert nuevo is not trabajo
+    esperar(lambda: nuevo.finalizado)
+    assert nuevo.estado == TERMINADO and nuevo.resultado == "listo"
+    assert len(intentos) == 2
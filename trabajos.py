@@ -0,0 +1,248 @@
+"""
+Trabajos en segundo plano para los análisis largos.
+Un trabajo ejecuta una función en un grupo de hilos, fuera del hilo del
+script de Streamlit, así la página sigue respondiendo mientras se calcula.
+La función recibe `progreso(fraccion)`, que actualiza el avance y devuelve
+False cuando se pidió cancelar (la cancelación es cooperativa). El
+resultado se guarda en la caché de resultados con la clave de sus entradas,
+de donde lo leen las páginas; sesiones con las mismas entradas comparten
+el mismo trabajo. Cada sesión tiene a lo sumo un trabajo por nombre: al
+enviar uno con otras entradas, el anterior se cancela si nadie más lo usa.
+Un trabajo que falló queda asociado a sus entradas (no se repite en cada
+rerun) hasta que cambian o se pide reintentarlo.
+
+El número de hilos se configura con INGECO_TRABAJOS_HILOS (por defecto,
+hasta 4 según los procesadores disponibles).
+"""
+
+import itertools
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from cache import cache_resultados
+from sesiones import INACTIVIDAD_MAXIMA
+
+PENDIENTE = "pendiente"
+EN_CURSO = "en_curso"
+TERMINADO = "terminado"
+CANCELADO = "cancelado"
+ERROR = "error"
+FINALIZADOS = (TERMINADO, CANCELADO, ERROR)
+
+
+class Trabajo:
+    """Estado de un trabajo: avance, resultado o error, y la señal de cancelación"""
+
+    def __init__(self, id_trabajo, nombre, clave):
+        self.id = id_trabajo
+        self.nombre = nombre
+        self.clave = clave
+        self.estado = PENDIENTE
+        self.progreso = 0.0
+        self.resultado = None
+        self.error = None
+        self.creado = time.monotonic()
+        self.terminado = None
+        self.interesados = set()
+        self._cancelar = threading.Event()
+
+    def reportar(self, fraccion):
+        """Callback de avance para la función del trabajo; False si debe detenerse"""
+        self.progreso = min(max(float(fraccion), 0.0), 1.0)
+        return not self._cancelar.is_set()
+
+    def cancelar(self):
+        """Pide detener el trabajo en su próximo reporte de avance"""
+        self._cancelar.set()
+        if self.estado == PENDIENTE:
+            self.estado = CANCELADO
+            self.terminado = time.monotonic()
+
+    @property
+    def cancelado(self):
+        return self._cancelar.is_set()
+
+    @property
+    def finalizado(self):
+        return self.estado in FINALIZADOS
+
+    def duracion(self):
+        """Segundos desde que se envió hasta que terminó (o hasta ahora)"""
+        return (self.terminado or time.monotonic()) - self.creado
+
+
+class GestorTrabajos:
+    """Grupo de hilos y registro de trabajos por id y por (sesión, nombre)"""
+
+    def __init__(self, max_hilos=None, cache=cache_resultados, inactividad_maxima=INACTIVIDAD_MAXIMA):
+        if max_hilos is None:
+            max_hilos = int(os.environ.get("INGECO_TRABAJOS_HILOS", min(4, os.cpu_count() or 1)))
+        self.max_hilos = max_hilos
+        self.cache = cache
+        self.inactividad_maxima = inactividad_maxima
+        self._pool = None
+        self._trabajos = {}
+        self._por_clave = {}
+        self._sesiones = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self.enviados = 0
+        self.reutilizados = 0
+        self.cancelados = 0
+
+    def _grupo(self):
+        # El grupo de hilos se crea con el primer trabajo
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_hilos, thread_name_prefix="ingeco-trabajo")
+        return self._pool
+
+    def enviar(self, id_sesion, nombre, clave, funcion, *args, **kwargs):
+        """
+        Trabajo `nombre` de la sesión para las entradas `clave`. Si el
+        resultado ya está en caché se retorna un trabajo terminado; si otra
+        sesión ya calcula la misma clave se comparte su trabajo; si no, se
+        ejecuta `funcion(*args, progreso=..., **kwargs)` en segundo plano.
+        El trabajo anterior de la sesión con el mismo nombre y otras entradas
+        se cancela si ninguna otra sesión lo usa.
+        """
+        encontrado, valor = self.cache.obtener(clave)
+        with self._lock:
+            self._purgar(time.monotonic())
+            actual = self._trabajo_sesion(id_sesion, nombre)
+            if actual is not None and actual.clave == clave and not actual.cancelado:
+                self._sesiones[id_sesion][nombre] = (actual.id, time.monotonic())
+                return actual
+            if actual is not None:
+                self._soltar(actual, id_sesion)
+
+            trabajo = self._por_clave.get(clave)
+            if trabajo is not None and not trabajo.cancelado:
+                self.reutilizados += 1
+            else:
+                trabajo = Trabajo(next(self._ids), nombre, clave)
+                self._trabajos[trabajo.id] = trabajo
+                self._por_clave[clave] = trabajo
+                if encontrado:
+                    trabajo.estado, trabajo.progreso, trabajo.resultado = TERMINADO, 1.0, valor
+                    trabajo.terminado = trabajo.creado
+                else:
+                    self.enviados += 1
+                    self._grupo().submit(self._ejecutar, trabajo, funcion, args, kwargs)
+            trabajo.interesados.add(id_sesion)
+            self._sesiones.setdefault(id_sesion, {})[nombre] = (trabajo.id, time.monotonic())
+            return trabajo
+
+    def _ejecutar(self, trabajo, funcion, args, kwargs):
+        if trabajo.cancelado:
+            return
+        trabajo.estado = EN_CURSO
+        try:
+            resultado = funcion(*args, progreso=trabajo.reportar, **kwargs)
+        except Exception as error:
+            trabajo.error = error
+            trabajo.estado = ERROR
+        else:
+            # Un resultado parcial (cancelado) no se guarda en la caché
+            if trabajo.cancelado:
+                trabajo.estado = CANCELADO
+            else:
+                self.cache.guardar(trabajo.clave, resultado)
+                trabajo.resultado = resultado
+                trabajo.progreso = 1.0
+                trabajo.estado = TERMINADO
+        trabajo.terminado = time.monotonic()
+
+    def _trabajo_sesion(self, id_sesion, nombre):
+        entrada = self._sesiones.get(id_sesion, {}).get(nombre)
+        return self._trabajos.get(entrada[0]) if entrada is not None else None
+
+    def _soltar(self, trabajo, id_sesion):
+        """La sesión deja de usar el trabajo; sin interesados se cancela y se olvida"""
+        trabajo.interesados.discard(id_sesion)
+        if trabajo.interesados:
+            return
+        if not trabajo.finalizado:
+            trabajo.cancelar()
+            self.cancelados += 1
+        self._trabajos.pop(trabajo.id, None)
+        if self._por_clave.get(trabajo.clave) is trabajo:
+            del self._por_clave[trabajo.clave]
+
+    def _purgar(self, ahora):
+        """Suelta los trabajos de las sesiones inactivas"""
+        for id_sesion in list(self._sesiones):
+            trabajos = self._sesiones[id_sesion]
+            for nombre, (id_trabajo, acceso) in list(trabajos.items()):
+                if ahora - acceso > self.inactividad_maxima:
+                    del trabajos[nombre]
+                    if id_trabajo in self._trabajos:
+                        self._soltar(self._trabajos[id_trabajo], id_sesion)
+            if not trabajos:
+                del self._sesiones[id_sesion]
+
+    def trabajo(self, id_trabajo):
+        """Trabajo por su id, o None si ya se olvidó"""
+        with self._lock:
+            return self._trabajos.get(id_trabajo)
+
+    def de_sesion(self, id_sesion, nombre):
+        """Último trabajo `nombre` enviado por la sesión, o None"""
+        with self._lock:
+            return self._trabajo_sesion(id_sesion, nombre)
+
+    def cancelar(self, id_sesion, nombre):
+        """Cancela el trabajo `nombre` de la sesión (si otra sesión lo comparte, sigue para ella)"""
+        with self._lock:
+            trabajo = self._trabajo_sesion(id_sesion, nombre)
+            if trabajo is None:
+                return False
+            del self._sesiones[id_sesion][nombre]
+            self._soltar(trabajo, id_sesion)
+            return True
+
+    def reintentar(self, id_sesion, nombre):
+        """Olvida el trabajo con error de la sesión para que el próximo envío lo ejecute de nuevo"""
+        with self._lock:
+            trabajo = self._trabajo_sesion(id_sesion, nombre)
+            if trabajo is None or trabajo.estado != ERROR:
+                return False
+            del self._sesiones[id_sesion][nombre]
+            if self._por_clave.get(trabajo.clave) is trabajo:
+                del self._por_clave[trabajo.clave]
+            self._soltar(trabajo, id_sesion)
+            return True
+
+    def cancelar_sesion(self, id_sesion):
+        """Cancela todos los trabajos de la sesión"""
+        with self._lock:
+            for id_trabajo, _ in self._sesiones.pop(id_sesion, {}).values():
+                if id_trabajo in self._trabajos:
+                    self._soltar(self._trabajos[id_trabajo], id_sesion)
+
+    def metricas(self):
+        """Contadores de trabajos enviados, reutilizados y cancelados, y trabajos activos"""
+        with self._lock:
+            activos = sum(not t.finalizado for t in self._trabajos.values())
+            return {
+                "enviados": self.enviados,
+                "reutilizados": self.reutilizados,
+                "cancelados": self.cancelados,
+                "activos": activos,
+                "registrados": len(self._trabajos),
+            }
+
+    def cerrar(self, esperar=True):
+        """Cancela los trabajos pendientes y detiene el grupo de hilos"""
+        with self._lock:
+            for trabajo in self._trabajos.values():
+                if not trabajo.finalizado:
+                    trabajo.cancelar()
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=esperar)
+
+
+# Instancia única por proceso, compartida por todas las sesiones como cache_resultados
+gestor_trabajos = GestorTrabajos()